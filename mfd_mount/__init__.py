@@ -2,8 +2,60 @@
 # SPDX-License-Identifier: MIT
 """Package for MFD Mount implementations."""
 
+import importlib
+from typing import Any, List
+
 from .base import Mount
-from .windows import WindowsMount
-from .esxi import ESXiMount
-from .posix import PosixMount
-from .freebsd import FreeBSDMount
+from .handle import MountHandle
+
+# platform classes and helpers are imported on first access, so users of single platform don't pay for others
+_LAZY_ATTRIBUTES = {
+    "MountSpec": ".parallel",
+    "MountResult": ".parallel",
+    "NFSOptions": ".options",
+    "CIFSOptions": ".options",
+    "TMPFSOptions": ".options",
+    "HUGETLBFSOptions": ".options",
+    "MountBenchmarkResult": ".benchmark",
+    "MountState": ".mount_table",
+    "MountEvent": ".instrumentation",
+    "UnmountQueue": ".unmount_queue",
+    "cleanup_mounts": ".cleanup",
+    "RetryPolicy": ".retry",
+    "CircuitBreaker": ".retry",
+    "ReachabilityProbe": ".reachability",
+    "LazyMount": ".lazy_mount",
+    "MountStateStore": ".state_store",
+    "WindowsMount": ".windows",
+    "ESXiMount": ".esxi",
+    "PosixMount": ".posix",
+    "FreeBSDMount": ".freebsd",
+    "AsyncMount": ".async_mount",
+    "AsyncPosixMount": ".async_mount",
+    "AsyncFreeBSDMount": ".async_mount",
+    "AsyncWindowsMount": ".async_mount",
+    "AsyncESXiMount": ".async_mount",
+}
+
+__all__ = ["Mount", "MountHandle", *_LAZY_ATTRIBUTES]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import platform class or helper on first access.
+
+    :param name: Name of attribute
+    :return: Platform class or helper
+    :raises AttributeError: when attribute is not available in package
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List attributes of package including not yet imported ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
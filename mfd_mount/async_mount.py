@@ -0,0 +1,249 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for asyncio mount front end."""
+
+import asyncio
+import functools
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, Iterable, Optional, Type, Union
+
+from .base import Mount
+from .esxi import ESXiMount
+from .freebsd import FreeBSDMount
+from .handle import MountHandle
+from .posix import PosixMount
+from .windows import WindowsMount
+
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+
+
+class _AsyncMountOperation:
+    """
+    Awaitable mount operation, usable as async context manager as well.
+
+    Awaiting mounts share and returns its MountHandle, `async with` mounts share on enter and releases handle on exit,
+    so shared mount is unmounted only by its last handle.
+    """
+
+    def __init__(self, mounter: "AsyncMount", method_name: str, mount_point: Union[Path, str], kwargs: dict) -> None:
+        """
+        Initialize _AsyncMountOperation object.
+
+        :param mounter: AsyncMount object executing operation
+        :param method_name: Name of mount method of synchronous Mount
+        :param mount_point: Path to directory for mount
+        :param kwargs: Parameters of mount method
+        """
+        self._mounter = mounter
+        self._method_name = method_name
+        self._mount_point = mount_point
+        self._kwargs = kwargs
+        self._handle: Optional[MountHandle] = None
+
+    async def _mount(self) -> MountHandle:
+        """Run mount method off event loop."""
+        self._handle = await self._mounter._run(
+            getattr(self._mounter.mounter, self._method_name), mount_point=self._mount_point, **self._kwargs
+        )
+        return self._handle
+
+    def __await__(self) -> Generator[Any, None, MountHandle]:
+        """Mount share."""
+        return self._mount().__await__()
+
+    async def __aenter__(self) -> MountHandle:
+        """Mount share."""
+        return await self._mount()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:  # noqa: ANN001
+        """Release handle of share, off event loop."""
+        await self._mounter._run(self._handle.unmount)
+
+
+class AsyncMount:
+    """
+    Class responsible for mounting fileshares on OS from asyncio code.
+
+    Blocking operations of synchronous Mount subclass are executed off event loop, on given executor.
+
+    Usage example:
+    >>> mounter = AsyncMount(connection=LocalConnection())
+    >>> await mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/shared")
+    >>> async with mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/shared"):
+    >>>     await mounter.is_mounted("/mnt/shared")  # will unmount share afterwards
+    True
+    """
+
+    _mount_class: Type[Mount] = Mount
+
+    def __new__(cls, connection: "Connection", **kwargs):
+        """
+        Choose AsyncMount subclass based on connected OS, same way as Mount does.
+
+        :param connection: Connection object of host on which mounting operations will be executed.
+        :param kwargs: Parameters passed to __init__
+        :return: Instance of AsyncMount subclass.
+        :raises MountConnectedOSNotSupportedException: when connected OS is not supported by Mount.
+        """
+        if cls == AsyncMount:
+            mount_class = Mount.get_mount_class(connection)
+            return super(AsyncMount, cls).__new__(_MOUNT_CLASS_TO_ASYNC_CLASS[mount_class])
+        return super(AsyncMount, cls).__new__(cls)
+
+    def __init__(self, connection: "Connection", *, executor: Optional[Executor] = None, **kwargs) -> None:
+        """
+        Initialize AsyncMount object.
+
+        :param connection: Connection object of host on which mounting operations will be executed.
+        :param executor: Executor for blocking operations, default executor of event loop if not given
+        :param kwargs: Subclass specific parameters of synchronous Mount subclass
+        """
+        self.mounter = self._mount_class(connection, **kwargs)
+        self._executor = executor
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run blocking function off event loop.
+
+        :param func: Function to call
+        :return: Value returned by function
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def mount_cifs(
+        self, *, mount_point: Union[Path, str], share_path: Union[Path, str], **kwargs
+    ) -> _AsyncMountOperation:
+        """
+        Mount CIFS share, see Mount.mount_cifs.
+
+        :param mount_point: Path to directory for mount
+        :param share_path: Path to mount including server
+        :param kwargs: Other parameters of mount method eg. username, password
+        :return: Awaitable, usable as async context manager
+        """
+        return _AsyncMountOperation(self, "mount_cifs", mount_point, dict(share_path=share_path, **kwargs))
+
+    def mount_nfs(
+        self, *, mount_point: Union[Path, str], share_path: Union[Path, str], **kwargs
+    ) -> _AsyncMountOperation:
+        """
+        Mount NFS share, see Mount.mount_nfs.
+
+        :param mount_point: Path to directory for mount
+        :param share_path: Path to mount including server
+        :param kwargs: Other parameters of mount method eg. username, password
+        :return: Awaitable, usable as async context manager
+        """
+        return _AsyncMountOperation(self, "mount_nfs", mount_point, dict(share_path=share_path, **kwargs))
+
+    def mount_sshfs(
+        self, *, mount_point: Union[Path, str], share_path: Union[Path, str], **kwargs
+    ) -> _AsyncMountOperation:
+        """
+        Mount SSH share, see Mount.mount_sshfs.
+
+        :param mount_point: Path to directory for mount
+        :param share_path: Path to mount including server
+        :param kwargs: Other parameters of mount method eg. username, password
+        :return: Awaitable, usable as async context manager
+        """
+        return _AsyncMountOperation(self, "mount_sshfs", mount_point, dict(share_path=share_path, **kwargs))
+
+    def mount_tmpfs(
+        self, *, mount_point: Union[Path, str], share_path: Union[Path, str], **kwargs
+    ) -> _AsyncMountOperation:
+        """
+        Mount TMP share, see Mount.mount_tmpfs.
+
+        :param mount_point: Path to directory for mount
+        :param share_path: Path to mount
+        :param kwargs: Other parameters of mount method eg. params
+        :return: Awaitable, usable as async context manager
+        """
+        return _AsyncMountOperation(self, "mount_tmpfs", mount_point, dict(share_path=share_path, **kwargs))
+
+    def mount_hugetlbfs(
+        self, *, mount_point: Union[Path, str], share_path: Union[Path, str], **kwargs
+    ) -> _AsyncMountOperation:
+        """
+        Mount HUGETLB share, see Mount.mount_hugetlbfs.
+
+        :param mount_point: Path to directory for mount
+        :param share_path: Path to mount
+        :param kwargs: Other parameters of mount method eg. params
+        :return: Awaitable, usable as async context manager
+        """
+        return _AsyncMountOperation(self, "mount_hugetlbfs", mount_point, dict(share_path=share_path, **kwargs))
+
+    async def is_mounted(self, mount_point: Union[Path, str]) -> bool:
+        """
+        Check if given mount_point is mounted.
+
+        :param mount_point: Path to directory to check if is mounted
+        :return: bool value: True if mount_point is mounted, False if not
+        """
+        return await self._run(self.mounter.is_mounted, mount_point)
+
+    async def are_mounted(self, mount_points: Iterable[Union[Path, str]]) -> Dict[str, bool]:
+        """
+        Check which of given mount points are mounted, using single query of connected host.
+
+        :param mount_points: Paths to directories to check if are mounted
+        :return: Dictionary mapping each mount point (as string) to True if mounted, False if not
+        """
+        return await self._run(self.mounter.are_mounted, list(mount_points))
+
+    async def umount(self, mount_point: Union[Path, str], *, lazy: bool = False) -> None:
+        """
+        Unmount share.
+
+        :param mount_point: Path to directory for mounted share
+        :param lazy: Detach mount point immediately and clean up when it is not busy anymore (POSIX only)
+        :raises UnmountException: on failure
+        """
+        await self._run(self.mounter.umount, mount_point, lazy=lazy)
+
+    async def umount_many(self, mount_points: Iterable[Union[Path, str]], *, lazy: bool = False) -> None:
+        """
+        Unmount many shares using single remote command.
+
+        :param mount_points: Paths to directories for mounted shares
+        :param lazy: Detach mount points immediately and clean up when they are not busy anymore (POSIX only)
+        :raises UnmountException: when any of mount points could not be unmounted
+        """
+        await self._run(self.mounter.umount_many, list(mount_points), lazy=lazy)
+
+
+class AsyncPosixMount(AsyncMount):
+    """Asyncio front end of PosixMount."""
+
+    _mount_class = PosixMount
+
+
+class AsyncFreeBSDMount(AsyncMount):
+    """Asyncio front end of FreeBSDMount."""
+
+    _mount_class = FreeBSDMount
+
+
+class AsyncWindowsMount(AsyncMount):
+    """Asyncio front end of WindowsMount."""
+
+    _mount_class = WindowsMount
+
+
+class AsyncESXiMount(AsyncMount):
+    """Asyncio front end of ESXiMount."""
+
+    _mount_class = ESXiMount
+
+
+_MOUNT_CLASS_TO_ASYNC_CLASS = {
+    PosixMount: AsyncPosixMount,
+    FreeBSDMount: AsyncFreeBSDMount,
+    WindowsMount: AsyncWindowsMount,
+    ESXiMount: AsyncESXiMount,
+}
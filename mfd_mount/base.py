@@ -2,21 +2,67 @@
 # SPDX-License-Identifier: MIT
 """Module for MFD Mount implementation."""
 
+import functools
+import time
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Dict, Iterable, List, Optional, Callable, Type
 from typing import TYPE_CHECKING
 from typing import Union
+from weakref import WeakKeyDictionary
 from .exceptions import MountConnectedOSNotSupportedException
-from mfd_typing.os_values import OSName
+from .handle import MountHandle
 
 if TYPE_CHECKING:
     from mfd_connect import Connection
+    from .benchmark import MountBenchmarkResult
+    from .instrumentation import MountObserver
+    from .lazy_mount import LazyMounter
+    from mfd_typing.os_values import OSName
+    from .parallel import MountSpec, MountResult
+    from .reachability import ReachabilityProbe
+    from .retry import CircuitBreaker, RetryPolicy
+    from .shared import SharedMount
+    from .unmount_queue import UnmountQueue
+
+
+MOUNT_MANY_MAX_WORKERS = 8
+MOUNT_MANY_PER_SERVER_LIMIT = 2
+
+# Mount subclasses resolved for connections, see Mount.get_mount_class
+_connection_mount_classes: "WeakKeyDictionary[Connection, Type[Mount]]" = WeakKeyDictionary()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_os_name_to_class() -> Dict["OSName", Type["Mount"]]:
+    """
+    Get mapping of supported OS to Mount subclass.
+
+    Subclasses (and mfd_typing) are imported on first call, as they depend on this module and are costly to import.
+
+    :return: Dictionary mapping OSName to Mount subclass
+    """
+    from mfd_typing.os_values import OSName
+    from .posix import PosixMount
+    from .windows import WindowsMount
+    from .esxi import ESXiMount
+    from .freebsd import FreeBSDMount
+
+    return {
+        OSName.WINDOWS: WindowsMount,
+        OSName.LINUX: PosixMount,
+        OSName.FREEBSD: FreeBSDMount,
+        OSName.ESXI: ESXiMount,
+    }
 
 
 def _unmount_context_manager(func: Callable) -> Callable:
     """
     Create decorator function enabling mount methods to be executed as context manager as well as through a usual call.
 
+    Decorated method returns MountHandle of mounted share. Identical mount requests of the same connection share
+    single mount: only the first one mounts share and it is unmounted when the last handle is unmounted.
+    Mount is preceded by reachability probe of server, retried and checked with circuit breaker of server
+    when mounter has them configured.
     This decorator is supposed to be used in internal implementation only.
 
     Usage example:
@@ -29,20 +75,27 @@ def _unmount_context_manager(func: Callable) -> Callable:
     >>>     ...  # will unmount share afterwards
     """
 
+    @functools.wraps(func)
     def decorator_func(self, *args, **kwargs):  # noqa: ANN001, ANN201, ANN202
         mount_point = kwargs.get("mount_point")
-        func(self, *args, **kwargs)
-
-        class ContextManager(type(self)):
-            """Context manager helper class."""
-
-            def __enter__(self):
-                pass
-
-            def __exit__(self, exc_type, exc_val, exc_tb):  # noqa: ANN001
-                self.umount(mount_point)
+        parameters = {name: value for name, value in kwargs.items() if name != "mount_point"}
+        shared = self._get_shared_mount(func.__name__, mount_point, parameters) if not args else None
+        mounted_at = time.time()
+        started = time.perf_counter()
+        if self._retry_policy is None and self._circuit_breaker is None and self._reachability_probe is None:
+            mount = functools.partial(func, self, *args, **kwargs)
+        else:
+            mount = functools.partial(self._guarded_mount, func, *args, **kwargs)
+        if shared is None:
+            mount()
+            mounted = True
+        else:
+            mounted = shared.acquire(mount)
+        if mounted and self._cleanup_on_exit:
+            from .cleanup import track_mount
 
-        return ContextManager(self._conn)
+            track_mount(self, mount_point)
+        return MountHandle(self, mount_point, mounted_at, time.perf_counter() - started, shared)
 
     return decorator_func
 
@@ -58,43 +111,220 @@ class Mount:
 
     """
 
-    def __new__(cls, connection: "Connection"):
+    # reachability probe of share servers can be run on connected host, see ReachabilityProbe
+    _REMOTE_PROBE_SUPPORTED = False
+
+    def __new__(cls, connection: "Connection", **kwargs):
         """
         Choose Mount subclass based on connected OS.
 
         :param connection: Connection object of host on which mounting operations will be executed.
+        :param kwargs: Subclass specific parameters, passed to __init__
         :return: Instance of Mount subclass.
         :raises MountConnectedOSNotSupportedException: when connected OS is not supported by Mount.
         """
         if cls == Mount:
-            from .posix import PosixMount
-            from .windows import WindowsMount
-            from .esxi import ESXiMount
-            from .freebsd import FreeBSDMount
-
-            os_name = connection.get_os_name()
-            os_name_to_class = {
-                OSName.WINDOWS: WindowsMount,
-                OSName.LINUX: PosixMount,
-                OSName.FREEBSD: FreeBSDMount,
-                OSName.ESXI: ESXiMount,
-            }
-
-            if os_name not in os_name_to_class.keys():
-                raise MountConnectedOSNotSupportedException("OS of connected client not supported")
-
-            mount_class = os_name_to_class.get(os_name)
+            mount_class = cls.get_mount_class(connection)
             return super(Mount, cls).__new__(mount_class)
         else:
             return super(Mount, cls).__new__(cls)
 
-    def __init__(self, connection: "Connection") -> None:
+    @staticmethod
+    def get_mount_class(connection: "Connection", *, refresh: bool = False) -> Type["Mount"]:
+        """
+        Get Mount subclass matching connected OS.
+
+        Resolved subclass is cached per connection (weak reference), so OS is detected once per connection.
+
+        :param connection: Connection object of host on which mounting operations will be executed.
+        :param refresh: Detect OS of connected host again, regardless of cached subclass
+        :return: Mount subclass.
+        :raises MountConnectedOSNotSupportedException: when connected OS is not supported by Mount.
+        """
+        if not refresh:
+            try:
+                mount_class = _connection_mount_classes.get(connection)
+            except TypeError:  # connection not hashable or weak referenceable
+                mount_class = None
+            if mount_class is not None:
+                return mount_class
+
+        os_name = connection.get_os_name()
+        os_name_to_class = _get_os_name_to_class()
+
+        if os_name not in os_name_to_class.keys():
+            raise MountConnectedOSNotSupportedException("OS of connected client not supported")
+
+        mount_class = os_name_to_class.get(os_name)
+        try:
+            _connection_mount_classes[connection] = mount_class
+        except TypeError:
+            pass
+        return mount_class
+
+    @staticmethod
+    def clear_mount_class_cache(connection: Optional["Connection"] = None) -> None:
+        """
+        Drop cached Mount subclasses.
+
+        :param connection: Connection which cached subclass should be dropped, all connections if not given
+        """
+        if connection is None:
+            _connection_mount_classes.clear()
+        else:
+            _connection_mount_classes.pop(connection, None)
+
+    def forget_shared_mounts(self, mount_point: Optional[Union[Path, str]] = None) -> None:
+        """
+        Drop shared mounts of connection, so next identical mount request mounts share again.
+
+        Shares are not unmounted, handles of dropped mounts unmount share when unmounted.
+
+        :param mount_point: Mount point which shared mounts should be dropped, all if not given
+        """
+        from .shared import forget_shared_mounts
+
+        forget_shared_mounts(self._conn, mount_point)
+
+    @staticmethod
+    def add_observer(observer: "MountObserver") -> None:
+        """
+        Register observer called with MountEvent after each mount, umount and is_mounted operation of any mounter.
+
+        Event contains fs type, server, mount point, executed command (password masked), wall time,
+        exit code and exception class. Observer is called in thread executing operation,
+        its exceptions are logged and ignored.
+
+        Usage example:
+        >>> Mount.add_observer(lambda event: print(event.operation, event.mount_point, event.duration))
+
+        :param observer: Callable accepting MountEvent
+        """
+        from .instrumentation import add_observer
+
+        add_observer(observer)
+
+    @staticmethod
+    def remove_observer(observer: "MountObserver") -> None:
+        """
+        Unregister observer added by add_observer.
+
+        :param observer: Previously registered observer
+        """
+        from .instrumentation import remove_observer
+
+        remove_observer(observer)
+
+    def __init__(
+        self,
+        connection: "Connection",
+        *,
+        cleanup_on_exit: bool = False,
+        retry_policy: Optional["RetryPolicy"] = None,
+        circuit_breaker: Optional["CircuitBreaker"] = None,
+        reachability_probe: Optional["ReachabilityProbe"] = None,
+    ) -> None:
         """
         Initialize Mount object.
 
         :param connection: Connection object of host on which mounting operations will be executed.
+        :param cleanup_on_exit: Unmount shares left mounted by this mounter at process exit (atexit, SIGTERM, SIGHUP)
+        :param retry_policy: Policy of retrying failed mounts, mounts are not retried if not given
+        :param circuit_breaker: Circuit breaker of servers, can be shared between mounters of many hosts
+        :param reachability_probe: Probe of share servers run before mount, servers are not probed if not given
         """
         self._conn = connection
+        self._cleanup_on_exit = cleanup_on_exit
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._reachability_probe = reachability_probe
+
+    def _guarded_mount(self, func: Callable, *args, **kwargs) -> None:
+        """
+        Call mount method according to reachability probe, retry policy and circuit breaker of mounter.
+
+        :param func: Undecorated mount method
+        :param args: Positional arguments of mount method
+        :param kwargs: Keyword arguments of mount method
+        :raises ServerUnreachableException: when share server is not reachable
+        :raises MountCircuitOpenException: when circuit of share server is open
+        """
+        from .retry import call_with_retry
+        from .utils import get_share_server
+
+        share_path = kwargs.get("share_path")
+        server = get_share_server(share_path) if share_path is not None else None
+        if self._reachability_probe is not None:
+            self._reachability_probe.check(func.__name__, server, self)
+        call_with_retry(
+            functools.partial(func, self, *args, **kwargs),
+            policy=self._retry_policy,
+            circuit_breaker=self._circuit_breaker,
+            server=server,
+        )
+
+    def _forget_mount(self, mount_point: Union[Path, str]) -> None:
+        """
+        Drop state kept for mount point after it was unmounted: shared mounts and tracking for cleanup at exit.
+
+        :param mount_point: Path to directory for mount
+        """
+        self.forget_shared_mounts(mount_point)
+        if self._cleanup_on_exit:
+            from .cleanup import untrack_mount
+
+            untrack_mount(self, mount_point)
+
+    def _forget_unmounted(self, mount_points: Iterable[str]) -> None:
+        """
+        Drop state kept for mount points which are not mounted anymore, after unmount of many of them failed.
+
+        Cached mount state has to be invalidated before, so mount points are checked on host.
+        When check fails, state of all mount points is kept, so they are unmounted again on cleanup.
+
+        :param mount_points: Paths to directories for mounts
+        """
+        try:
+            mounted_points = self.are_mounted(mount_points)
+        except Exception:
+            return
+        for mount_point, mounted in mounted_points.items():
+            if not mounted:
+                self._forget_mount(mount_point)
+
+    def _get_shared_mount(
+        self, mount_method: str, mount_point: Union[Path, str], parameters: Dict
+    ) -> Optional["SharedMount"]:
+        """
+        Get shared mount of connection for mount request.
+
+        Registry of shared mounts is looked up once per mounter, as hashing connection may be costly.
+
+        :param mount_method: Name of mount method, eg. mount_nfs
+        :param mount_point: Path to directory for mount
+        :param parameters: Other parameters of mount method, eg. share_path, username, options
+        :return: SharedMount object, None if request cannot be shared
+        """
+        from .shared import get_shared_mount, get_shared_mounts
+
+        registry = self.__dict__.get("_shared_mounts")
+        if registry is None:
+            registry = self._shared_mounts = get_shared_mounts(self._conn)
+            if registry is None:
+                return None
+        return get_shared_mount(registry, mount_method, mount_point, parameters)
+
+    def _execute_command(self, command: str, **kwargs):  # noqa: ANN201
+        """
+        Execute command on connected host, reporting it to observers of current mount operation.
+
+        :param command: Command to execute
+        :param kwargs: Parameters of execute_command of connection
+        :return: Result of execute_command of connection
+        """
+        from .instrumentation import execute_command
+
+        return execute_command(self._conn, command, **kwargs)
 
     @_unmount_context_manager
     def mount_cifs(
@@ -192,6 +422,91 @@ class Mount:
         """
         raise NotImplementedError
 
+    def mount_many(
+        self,
+        specs: Iterable["MountSpec"],
+        *,
+        max_workers: int = MOUNT_MANY_MAX_WORKERS,
+        per_server_limit: Optional[int] = MOUNT_MANY_PER_SERVER_LIMIT,
+    ) -> List["MountResult"]:
+        """
+        Mount many NFS, CIFS or TMPFS shares concurrently on thread pool.
+
+        Failures do not stop other mounts, they are reported in results.
+        Connection has to support concurrent execute_command calls.
+
+        Usage example:
+        >>> results = mounter.mount_many([MountSpec("nfs", mount_point="/mnt/a", share_path="10.10.10.10:/a")])
+        >>> [result.succeeded for result in results]
+        [True]
+
+        :param specs: Mount requests
+        :param max_workers: Maximum number of mounts executed at the same time
+        :param per_server_limit: Maximum number of mounts of one server executed at the same time, None for no limit
+        :return: Results with exception (if any) and timings, in order of specs
+        :raises MountException: when fs type of any spec is not supported or limits are incorrect
+        """
+        from .parallel import mount_many
+
+        return mount_many(self, specs, max_workers=max_workers, per_server_limit=per_server_limit)
+
+    def defer_unmounts(self, *, lazy: bool = False) -> "UnmountQueue":
+        """
+        Create queue of deferred unmounts, flushed with single remote command, see umount_many.
+
+        Usage example:
+        >>> with mounter.defer_unmounts(lazy=True) as queue:
+        >>>     queue.add(handle)
+        >>>     queue.add("/mnt/other")
+
+        :param lazy: Detach mount points immediately and clean up when they are not busy anymore (POSIX only)
+        :return: UnmountQueue object
+        """
+        from .unmount_queue import UnmountQueue
+
+        return UnmountQueue(self, lazy=lazy)
+
+    def lazy_mounts(self) -> "LazyMounter":
+        """
+        Get mounter which mount methods defer mount until mount point is first accessed.
+
+        Usage example:
+        >>> share = mounter.lazy_mounts().mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        >>> share.path  # mounts share
+        PosixPath('/mnt/shared')
+
+        :return: LazyMounter object, its mount methods return LazyMount
+        """
+        from .lazy_mount import LazyMounter
+
+        return LazyMounter(self)
+
+    def benchmark_mount(
+        self,
+        mount_point: Union[Path, str],
+        *,
+        workloads: Union[str, Iterable[str]] = ("write", "read", "randwrite", "randread"),
+        block_size: str = "1M",
+        file_size: str = "256M",
+        threads: int = 1,
+        runtime: Optional[int] = None,
+        direct: bool = True,
+    ) -> Dict[str, "MountBenchmarkResult"]:
+        """
+        Measure I/O throughput of mounted share on connected host.
+
+        :param mount_point: Path to directory of mounted share
+        :param workloads: Workload or workloads run one after another: write, read, randwrite, randread
+        :param block_size: Block size, eg. 4k, 1M
+        :param file_size: Size of file of each thread, eg. 256M
+        :param threads: Number of threads of each workload
+        :param runtime: Time in seconds of each workload, None to run until file_size is transferred
+        :param direct: Use non-buffered I/O (O_DIRECT)
+        :return: Dictionary mapping workload to MountBenchmarkResult with MB/s, IOPS and latency percentiles
+        :raises MountBenchmarkException: on failure of benchmark tool
+        """
+        raise NotImplementedError
+
     def is_mounted(self, mount_point: Union[Path, str]) -> bool:
         """
         Check if given mount_point is mounted.
@@ -201,11 +516,35 @@ class Mount:
         """
         raise NotImplementedError
 
-    def umount(self, mount_point: Union[Path, str]) -> None:
+    def are_mounted(self, mount_points: Iterable[Union[Path, str]]) -> Dict[str, bool]:
+        """
+        Check which of given mount points are mounted, using single query of connected host.
+
+        :param mount_points: Paths to directories to check if are mounted
+        :return: Dictionary mapping each mount point (as string) to True if mounted, False if not
+        """
+        raise NotImplementedError
+
+    def umount(self, mount_point: Union[Path, str], *, lazy: bool = False) -> None:
         """
         Unmount share using correct umount program.
 
         :param mount_point: Path to directory for mounted share
+        :param lazy: Detach mount point immediately and clean up when it is not busy anymore (POSIX only)
         :raises UnmountException: on failure
+        :raises MountException: when lazy unmount is not supported
+        """
+        raise NotImplementedError
+
+    def umount_many(self, mount_points: Iterable[Union[Path, str]], *, lazy: bool = False) -> None:
+        """
+        Unmount many shares using single remote command.
+
+        All mount points are attempted even if some of them fail.
+
+        :param mount_points: Paths to directories for mounted shares
+        :param lazy: Detach mount points immediately and clean up when they are not busy anymore (POSIX only)
+        :raises UnmountException: when any of mount points could not be unmounted
+        :raises MountException: when lazy unmount is not supported
         """
         raise NotImplementedError
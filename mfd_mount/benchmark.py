@@ -0,0 +1,112 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for I/O throughput probe of mounted share."""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+from .exceptions import MountException
+
+BENCHMARK_WORKLOADS = ("write", "read", "randwrite", "randread")
+BENCHMARK_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+@dataclass(frozen=True)
+class MountBenchmarkResult:
+    """Result of single workload of benchmark_mount."""
+
+    workload: str
+    bandwidth_mb_s: float
+    iops: float
+    mean_latency_us: float
+    latency_percentiles_us: Dict[float, float]
+
+
+def build_fio_command(
+    mount_point: Union[Path, str],
+    *,
+    workloads: Union[str, Iterable[str]],
+    block_size: str,
+    file_size: str,
+    threads: int,
+    runtime: Optional[int],
+    direct: bool,
+    ioengine: str,
+) -> str:
+    """
+    Build single fio command running given workloads one after another (stonewall) in mount point.
+
+    Test files are removed by fio after each workload.
+
+    :param mount_point: Path to directory of mounted share
+    :param workloads: fio rw mode or modes, eg. write, read, randwrite, randread
+    :param block_size: Block size, eg. 4k, 1M
+    :param file_size: Size of file of each thread, eg. 256M
+    :param threads: Number of threads (fio jobs) of each workload
+    :param runtime: Time in seconds of each workload, None to run until file_size is transferred
+    :param direct: Use non-buffered I/O (O_DIRECT)
+    :param ioengine: fio I/O engine
+    :return: fio command
+    :raises MountException: when workload or threads are incorrect
+    """
+    workloads = [workloads] if isinstance(workloads, str) else list(workloads)
+    if not workloads or any(workload not in BENCHMARK_WORKLOADS for workload in workloads):
+        raise MountException(f"Workloads have to be chosen from {BENCHMARK_WORKLOADS}, got {workloads}.")
+    if threads < 1:
+        raise MountException("Number of threads has to be positive number.")
+
+    percentiles = ":".join(f"{percentile:g}" for percentile in BENCHMARK_PERCENTILES)
+    command = [
+        "fio",
+        "--output-format=json",
+        f"--directory={mount_point}",
+        f"--bs={block_size}",
+        f"--size={file_size}",
+        f"--numjobs={threads}",
+        f"--ioengine={ioengine}",
+        f"--direct={int(direct)}",
+        f"--percentile_list={percentiles}",
+        "--group_reporting",
+        "--unlink=1",
+    ]
+    if runtime is not None:
+        command.extend([f"--runtime={runtime}", "--time_based"])
+    for index, workload in enumerate(workloads):
+        command.append(f"--name=mfd_mount_{workload}")
+        if index:
+            command.append("--stonewall")
+        command.append(f"--rw={workload}")
+    return " ".join(command)
+
+
+def parse_fio_output(output: str) -> Dict[str, MountBenchmarkResult]:
+    """
+    Parse JSON output of fio command built by build_fio_command.
+
+    :param output: Output of fio, warnings printed before JSON document are skipped
+    :return: Dictionary mapping workload to its result
+    :raises MountException: when output cannot be parsed
+    """
+    try:
+        report = json.loads(output[output.index("{") :])
+    except ValueError as e:
+        raise MountException(f"Cannot parse fio output: {output}") from e
+
+    results = {}
+    for job in report.get("jobs", []):
+        workload = job["jobname"].replace("mfd_mount_", "", 1)
+        stats = job["read"] if "read" in workload else job["write"]
+        clat = stats.get("clat_ns", {})
+        percentiles = clat.get("percentile", {})
+        results[workload] = MountBenchmarkResult(
+            workload=workload,
+            bandwidth_mb_s=stats["bw"] * 1024 / 1_000_000,
+            iops=stats["iops"],
+            mean_latency_us=clat.get("mean", 0.0) / 1000,
+            latency_percentiles_us={
+                percentile: percentiles.get(f"{percentile:f}", 0) / 1000 for percentile in BENCHMARK_PERCENTILES
+            },
+        )
+    return results
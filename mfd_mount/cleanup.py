@@ -0,0 +1,154 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for cleanup of mounts left mounted at process exit."""
+
+import atexit
+import logging
+import signal
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
+
+from .mount_table import normalize_mount_point
+
+if TYPE_CHECKING:
+    from .base import Mount
+
+logger = logging.getLogger(__name__)
+
+EXIT_CLEANUP_TIMEOUT = 30.0
+# signals which by default terminate process without running atexit handlers
+EXIT_SIGNALS = tuple(getattr(signal, name) for name in ("SIGTERM", "SIGHUP") if hasattr(signal, name))
+
+# mount points mounted by mounters with cleanup_on_exit, in order of mounting
+_tracked_mounts: Dict["Mount", List[str]] = {}
+_tracked_mounts_lock = threading.Lock()
+_exit_hooks_installed = False
+
+
+def _exit_on_signal(signum: int, frame: object) -> None:
+    """
+    Exit process on termination signal, so atexit handlers are run.
+
+    :param signum: Number of received signal
+    :param frame: Current stack frame
+    :raises SystemExit: always
+    """
+    raise SystemExit(128 + signum)
+
+
+def _cleanup_at_exit() -> None:
+    """Unmount tracked mounts, registered as atexit handler."""
+    try:
+        left = cleanup_mounts()
+    except Exception:
+        logger.exception("Cleanup of mounts at exit failed.")
+        return
+    if left:
+        logger.warning(f"Mount points left mounted at exit: {left}")
+
+
+def _install_exit_hooks() -> None:
+    """
+    Register atexit handler and handlers of termination signals, which have default handlers.
+
+    Signal handlers can be registered only from main thread, otherwise only atexit handler is registered.
+    """
+    global _exit_hooks_installed
+    if _exit_hooks_installed:
+        return
+    _exit_hooks_installed = True
+    atexit.register(_cleanup_at_exit)
+    if threading.current_thread() is not threading.main_thread():
+        return
+    for signum in EXIT_SIGNALS:
+        if signal.getsignal(signum) == signal.SIG_DFL:
+            signal.signal(signum, _exit_on_signal)
+
+
+def track_mount(mounter: "Mount", mount_point: Union[Path, str]) -> None:
+    """
+    Track mount point to be unmounted at process exit.
+
+    :param mounter: Mount object which mounted share
+    :param mount_point: Path to directory for mount
+    """
+    with _tracked_mounts_lock:
+        _install_exit_hooks()
+        _tracked_mounts.setdefault(mounter, []).append(normalize_mount_point(mount_point))
+
+
+def untrack_mount(mounter: "Mount", mount_point: Union[Path, str]) -> None:
+    """
+    Stop tracking mount point, eg. after it was unmounted.
+
+    :param mounter: Mount object which mounted share
+    :param mount_point: Path to directory for mount
+    """
+    mount_point = normalize_mount_point(mount_point)
+    with _tracked_mounts_lock:
+        mount_points = _tracked_mounts.get(mounter)
+        if mount_points is None:
+            return
+        mount_points[:] = [tracked for tracked in mount_points if tracked != mount_point]
+        if not mount_points:
+            del _tracked_mounts[mounter]
+
+
+def get_tracked_mounts() -> Dict["Mount", List[str]]:
+    """
+    Get mount points tracked for cleanup at exit.
+
+    :return: Dictionary mapping mounter to its mount points, in order of mounting
+    """
+    with _tracked_mounts_lock:
+        return {mounter: list(mount_points) for mounter, mount_points in _tracked_mounts.items()}
+
+
+def cleanup_mounts(timeout: Optional[float] = EXIT_CLEANUP_TIMEOUT) -> List[str]:
+    """
+    Unmount all tracked mounts, concurrently for each mounter, within overall deadline.
+
+    Mount points of each mounter are unmounted by single umount_many call, in reverse order of mounting.
+    Unmounts run in daemon threads, so unmount hanging after deadline does not block process exit.
+
+    :param timeout: Time in seconds after which cleanup stops waiting for unmounts, None to wait for all of them
+    :return: Mount points which were not confirmed as unmounted (failed or not finished before deadline)
+    """
+    with _tracked_mounts_lock:
+        tracked = {mounter: mount_points[::-1] for mounter, mount_points in _tracked_mounts.items()}
+        _tracked_mounts.clear()
+    if not tracked:
+        return []
+
+    unmounted: List[str] = []
+    results_lock = threading.Lock()
+
+    def unmount(mounter: "Mount", mount_points: List[str]) -> None:
+        try:
+            mounter.umount_many(mount_points)
+        except Exception as e:
+            logger.debug(f"Cleanup of {mount_points} mounting points failed: {e}")
+            return
+        with results_lock:
+            unmounted.extend(mount_points)
+
+    logger.debug(f"Cleaning up {sum(map(len, tracked.values()))} mounting points.")
+    threads = [
+        threading.Thread(target=unmount, args=(mounter, mount_points), name="mfd_mount_cleanup", daemon=True)
+        for mounter, mount_points in tracked.items()
+    ]
+    for thread in threads:
+        thread.start()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    for thread in threads:
+        thread.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+
+    with results_lock:
+        return [
+            mount_point
+            for mount_points in tracked.values()
+            for mount_point in mount_points
+            if mount_point not in unmounted
+        ]
@@ -2,21 +2,93 @@
 # SPDX-License-Identifier: MIT
 """Module for esxi mount."""
 
-import re
+import csv
 import logging
+import shlex
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Union, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Union, Optional
+from weakref import WeakKeyDictionary
 
 from mfd_mount import Mount
 from mfd_mount.base import _unmount_context_manager
+from mfd_mount.instrumentation import instrumented
 from mfd_mount.exceptions import NFSMountException, MountException, MountTypeNotSupported, UnmountException
 
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+    from mfd_mount.reachability import ReachabilityProbe
+    from mfd_mount.retry import CircuitBreaker, RetryPolicy
+
 logger = logging.getLogger(__name__)
 
+DATASTORE_INVENTORY_TTL = 30.0
+
+
+@dataclass(frozen=True)
+class NFSDatastore:
+    """NFS datastore (volume) of ESXi host."""
+
+    volume_name: str
+    host: str
+    share: str
+    accessible: bool
+    mounted: bool
+    read_only: bool
+    nfs_version: str
+
+
+@dataclass
+class _DatastoreInventory:
+    """Cached NFS datastores of connection."""
+
+    datastores: Dict[str, NFSDatastore]
+    created: float
+
+
+# datastore inventories shared by all mounters of the same connection
+_inventories: "WeakKeyDictionary[Connection, _DatastoreInventory]" = WeakKeyDictionary()
+
 
 class ESXiMount(Mount):
     """Class for mounting on ESXI 7.0."""
 
+    _NFS_LIST_COMMANDS = {
+        "3": "esxcli --formatter=csv storage nfs list",
+        "4.1": "esxcli --formatter=csv storage nfs41 list",
+    }
+
+    def __init__(
+        self,
+        connection: "Connection",
+        *,
+        inventory_ttl: float = DATASTORE_INVENTORY_TTL,
+        cleanup_on_exit: bool = False,
+        retry_policy: Optional["RetryPolicy"] = None,
+        circuit_breaker: Optional["CircuitBreaker"] = None,
+        reachability_probe: Optional["ReachabilityProbe"] = None,
+    ) -> None:
+        """
+        Initialize ESXiMount object.
+
+        :param connection: Connection object of host on which mounting operations will be executed.
+        :param inventory_ttl: Time in seconds for which NFS datastore inventory is reused by is_mounted,
+                              0 to list datastores on every check
+        :param cleanup_on_exit: Unmount shares left mounted by this mounter at process exit (atexit, SIGTERM, SIGHUP)
+        :param retry_policy: Policy of retrying failed mounts, mounts are not retried if not given
+        :param circuit_breaker: Circuit breaker of servers, can be shared between mounters of many hosts
+        :param reachability_probe: Probe of share servers run before mount, servers are not probed if not given
+        """
+        super().__init__(
+            connection,
+            cleanup_on_exit=cleanup_on_exit,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            reachability_probe=reachability_probe,
+        )
+        self.inventory_ttl = inventory_ttl
+
     def mount_cifs(
         self,
         *,
@@ -38,6 +110,7 @@ class ESXiMount(Mount):
         raise MountTypeNotSupported("CIFS mount is not supported for ESXi. Use other mount method.")
 
     @_unmount_context_manager
+    @instrumented("mount", fs_type="nfs")
     def mount_nfs(
         self,
         *,
@@ -73,28 +146,132 @@ class ESXiMount(Mount):
             else:
                 raise MountException("Share path is in incorrect format.")
         mount_command_list = ["esxcli storage nfs add", f"-H {host}", f"-s {share}", f"-v {mount_point}"]
-        self._conn.execute_command(" ".join(mount_command_list), custom_exception=NFSMountException)
+        try:
+            self._execute_command(" ".join(mount_command_list), custom_exception=NFSMountException)
+        finally:
+            self.invalidate_datastore_inventory()
         logger.debug(f"Mounted NFS share {share_path} as {mount_point}.")
 
+    @staticmethod
+    def _parse_nfs_list(output: str, nfs_version: str) -> Dict[str, NFSDatastore]:
+        """
+        Parse CSV output of `esxcli storage nfs list` or `esxcli storage nfs41 list`.
+
+        Column names are compared without spaces and dashes, NFS 4.1 reports list of servers in 'Hosts' column.
+
+        :param output: Output of esxcli command called with --formatter=csv
+        :param nfs_version: NFS version of listed datastores
+        :return: Dictionary mapping volume name to NFSDatastore
+        """
+        datastores = {}
+        for row in csv.DictReader(output.strip().splitlines()):
+            row = {key.replace(" ", "").replace("-", "").lower(): value for key, value in row.items() if key}
+            volume_name = row.get("volumename")
+            if not volume_name:
+                continue
+            datastores[volume_name] = NFSDatastore(
+                volume_name=volume_name,
+                host=row.get("host", row.get("hosts", "")),
+                share=row.get("share", ""),
+                accessible=row.get("accessible", "").lower() == "true",
+                mounted=row.get("mounted", "").lower() == "true",
+                read_only=row.get("readonly", "").lower() == "true",
+                nfs_version=nfs_version,
+            )
+        return datastores
+
+    def get_datastore_inventory(self, *, refresh: bool = False) -> Dict[str, NFSDatastore]:
+        """
+        Get NFS datastores of host, listed with esxcli only when cached inventory is missing or expired.
+
+        :param refresh: List datastores regardless of cached inventory
+        :return: Dictionary mapping volume name to NFSDatastore
+        """
+        inventory = _inventories.get(self._conn)
+        if refresh or inventory is None or time.monotonic() - inventory.created >= self.inventory_ttl:
+            datastores = {}
+            for nfs_version, command in self._NFS_LIST_COMMANDS.items():
+                output = self._execute_command(command, skip_logging=True).stdout
+                datastores.update(self._parse_nfs_list(output, nfs_version))
+            inventory = _DatastoreInventory(datastores=datastores, created=time.monotonic())
+            _inventories[self._conn] = inventory
+        return inventory.datastores
+
+    def invalidate_datastore_inventory(self) -> None:
+        """Drop cached NFS datastore inventory, so next check lists datastores on host."""
+        _inventories.pop(self._conn, None)
+
+    @instrumented("is_mounted")
     def is_mounted(self, mount_point: Union[Path, str]) -> bool:
         """Check if given mount_point is mounted.
 
-        :param mount_point: Path to directory to check if is mounted
-        :return: bool value: True if mount_point is mounted, False if not
+        Check is served from NFS datastore inventory, see get_datastore_inventory.
+
+        :param mount_point: Volume name
+        :return: bool value: True if volume exists and is mounted, False if not
         """
-        output = self._conn.execute_command("esxcli storage nfs list").stdout
+        datastore = self.get_datastore_inventory().get(str(mount_point))
+        return datastore is not None and datastore.mounted
 
-        mount_match = re.search(rf"^{mount_point} ", output, re.MULTILINE)
+    def are_mounted(self, mount_points: Iterable[Union[Path, str]]) -> Dict[str, bool]:
+        """
+        Check which of given volumes are mounted, using single NFS datastore inventory.
 
-        return True if mount_match else False
+        :param mount_points: Volume names to check
+        :return: Dictionary mapping each volume name (as string) to True if mounted, False if not
+        """
+        datastores = self.get_datastore_inventory()
+        return {
+            str(mount_point): str(mount_point) in datastores and datastores[str(mount_point)].mounted
+            for mount_point in mount_points
+        }
 
-    def umount(self, mount_point: Union[Path, str]) -> None:
+    @instrumented("umount")
+    def umount(self, mount_point: Union[Path, str], *, lazy: bool = False) -> None:
         """
         Unmount share using esxcli program.
 
         :param mount_point: Volume name
+        :param lazy: Not supported on ESXi
         :raises UnmountException: on failure
+        :raises MountException: when lazy unmount is requested
         """
+        if lazy:
+            raise MountException("Lazy unmount is not supported by ESXiMount.")
         logger.debug(f"Unmounting {mount_point} mounting point.")
-        self._conn.execute_command(f"esxcli storage nfs remove -v {mount_point}", custom_exception=UnmountException)
+        try:
+            self._execute_command(f"esxcli storage nfs remove -v {mount_point}", custom_exception=UnmountException)
+        finally:
+            self.invalidate_datastore_inventory()
+        self._forget_mount(mount_point)
         logger.debug(f"Unmounted {mount_point} mounting point.")
+
+    @instrumented("umount_many")
+    def umount_many(self, mount_points: Iterable[Union[Path, str]], *, lazy: bool = False) -> None:
+        """
+        Unmount many shares using single shell loop of esxcli commands.
+
+        :param mount_points: Volume names
+        :param lazy: Not supported on ESXi
+        :raises UnmountException: when any of volumes could not be removed
+        :raises MountException: when lazy unmount is requested
+        """
+        if lazy:
+            raise MountException("Lazy unmount is not supported by ESXiMount.")
+        mount_points = [str(mount_point) for mount_point in mount_points]
+        if not mount_points:
+            return
+        volumes = " ".join(shlex.quote(mount_point) for mount_point in mount_points)
+        command = f'rc=0; for volume in {volumes}; do esxcli storage nfs remove -v "$volume" || rc=$?; done; exit $rc'
+        logger.debug(f"Unmounting {mount_points} mounting points.")
+        try:
+            self._execute_command(command, shell=True, custom_exception=UnmountException)
+        except UnmountException:
+            self.invalidate_datastore_inventory()
+            self._forget_unmounted(mount_points)
+            raise
+        finally:
+            self.invalidate_datastore_inventory()
+        for mount_point in mount_points:
+            self._forget_mount(mount_point)
+        logger.debug(f"Unmounted {mount_points} mounting points.")
@@ -43,3 +43,19 @@ class UnmountException(MountException, subprocess.CalledProcessError):
 
 class CIFSUpdatingNSMBConfFileException(MountException):
     """Handle updating NSMB Config file exceptions."""
+
+
+class MountBenchmarkException(MountException, subprocess.CalledProcessError):
+    """Handle mount benchmark exceptions."""
+
+
+class MountCircuitOpenException(MountException):
+    """Handle mount rejected by open circuit breaker of server."""
+
+
+class ServerUnreachableException(MountException):
+    """Handle mount rejected by reachability probe of server."""
+
+
+class HugepageReservationException(MountException):
+    """Handle hugepages not reserved in requested number."""
@@ -10,7 +10,9 @@ from mfd_common_libs import log_levels
 
 from mfd_mount import PosixMount
 from mfd_mount.base import _unmount_context_manager
+from mfd_mount.instrumentation import instrumented
 from mfd_mount.exceptions import CIFSMountException, CIFSUpdatingNSMBConfFileException, MountException
+from mfd_mount.mount_table import MountTable
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +27,28 @@ class FreeBSDMount(PosixMount):
     True
     """
 
+    _MOUNT_TABLE_COMMAND = "mount -p"
+    # FreeBSD umount has no lazy (detach) mode
+    _LAZY_UMOUNT_OPTION = None
+    _MOUNT_POINTS_COMMAND = "mount -p | awk '{print $2}'"
+    # flock program is not part of FreeBSD base system
+    _STATE_STORE_SUPPORTED = False
+    # bash is not part of FreeBSD base system
+    _REMOTE_PROBE_SUPPORTED = False
+
+    def _read_mount_table(self) -> MountTable:
+        """
+        Read and parse mount table of connected host.
+
+        FreeBSD has no mountinfo file, mount table is printed in fstab format by `mount -p`.
+
+        :return: MountTable object
+        """
+        output = self._execute_command(self._MOUNT_TABLE_COMMAND, skip_logging=True).stdout
+        return MountTable.from_fstab(output)
+
     @_unmount_context_manager
+    @instrumented("mount", fs_type="smbfs")
     def mount_cifs(
         self,
         *,
@@ -56,7 +79,13 @@ class FreeBSDMount(PosixMount):
             logger.debug(f"Check if nsmb.conf file contains password for user: {username} at host:{host}")
             self._configure_nsmb_conf_file(username, password, host)
 
-        self._conn.execute_command(" ".join(mount_command_list), custom_exception=CIFSMountException)
+        try:
+            if self.verify_mounts:
+                self._mount_and_verify(" ".join(mount_command_list), mount_point, CIFSMountException)
+            else:
+                self._execute_command(" ".join(mount_command_list), custom_exception=CIFSMountException)
+        finally:
+            self.invalidate_mount_table()
         logger.debug(f"Mounted CIFS share {share_path} on {mount_point}.")
 
     def _configure_nsmb_conf_file(self, username: str, password: str, host: str) -> None:
@@ -78,7 +107,7 @@ class FreeBSDMount(PosixMount):
 
         logger.log(level=log_levels.MODULE_DEBUG, msg="Writing credentials to nsmb.conf")
         cmd = f"echo '[{host}:{username.upper()}]' >> {nsmb_conf}; echo 'password={password}' >> {nsmb_conf}"
-        self._conn.execute_command(cmd)
+        self._execute_command(cmd)
 
         logger.log(level=log_levels.MODULE_DEBUG, msg="Check if nsmb.conf has updated credentials")
         if credentials not in nsmb_conf.read_text():
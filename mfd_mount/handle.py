@@ -0,0 +1,87 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for mount handle."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+if TYPE_CHECKING:
+    from .base import Mount
+    from .shared import SharedMount
+
+
+class MountHandle:
+    """
+    Handle of mounted share returned by mount methods.
+
+    Can be used as context manager, share is unmounted on exit.
+    Attributes which are not part of handle are looked up on mounter, so handle can be used as mounter as well.
+    Handle of shared mount unmounts share only when it is the last handle of the mount.
+
+    Usage example:
+    >>> handle = mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+    >>> handle.mount_point, handle.duration
+    ('/mnt/shared', 0.25)
+    >>> with mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share"):
+    >>>     ...  # will unmount share afterwards
+    """
+
+    __slots__ = ("mounter", "mount_point", "mounted_at", "duration", "shared", "released")
+
+    def __init__(
+        self,
+        mounter: "Mount",
+        mount_point: Union[Path, str],
+        mounted_at: float,
+        duration: float,
+        shared: Optional["SharedMount"] = None,
+    ) -> None:
+        """
+        Initialize MountHandle object.
+
+        :param mounter: Mount object which mounted share
+        :param mount_point: Path to directory for mount
+        :param mounted_at: Time of mount (seconds since epoch)
+        :param duration: Time in seconds which mount took
+        :param shared: Shared mount of handle, None if mount is not shared
+        """
+        self.mounter = mounter
+        self.mount_point = mount_point
+        self.mounted_at = mounted_at
+        self.duration = duration
+        self.shared = shared
+        self.released = False
+
+    def unmount(self) -> None:
+        """
+        Unmount share through mounter which mounted it, so its state (eg. cached mount table) is updated.
+
+        Shared mount is unmounted only by its last handle. Handle is released once, repeated unmount does nothing.
+
+        :raises UnmountException: on failure
+        """
+        if self.released:
+            return
+        self.released = True
+        if self.shared is None:
+            self.mounter.umount(self.mount_point)
+        else:
+            self.shared.release(lambda: self.mounter.umount(self.mount_point))
+
+    def __enter__(self) -> "MountHandle":
+        """Enter context of mounted share."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # noqa: ANN001
+        """Unmount share."""
+        self.unmount()
+
+    def __getattr__(self, name: str) -> Any:
+        """Look up attribute (other than special one) on mounter."""
+        if name in MountHandle.__slots__ or name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.mounter, name)
+
+    def __repr__(self) -> str:
+        """Get representation of handle."""
+        return f"{type(self).__name__}(mount_point={self.mount_point!r}, duration={self.duration:.3f})"
@@ -0,0 +1,102 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for reservation of hugepages through sysfs of connected host."""
+
+from typing import NamedTuple, Optional, Union
+
+from .exceptions import MountException
+from .options import parse_page_size
+
+HUGEPAGES_SYSFS = "/sys/kernel/mm/hugepages"
+NODE_SYSFS = "/sys/devices/system/node"
+HUGEPAGE_DEFAULT_SIZE = "2M"
+HUGEPAGES_STATUS_PREFIX = "MFD_HUGEPAGES"
+
+
+class HugepageReservation(NamedTuple):
+    """
+    Hugepages of pool after reservation: requested free pages, total pages of pool and free ones.
+
+    Free pages of system wide pool exclude pages reserved for mappings which were not faulted in yet (resv_hugepages).
+
+    Kernel may reserve fewer pages than requested, eg. when memory is fragmented.
+    """
+
+    page_size: int
+    node: Optional[int]
+    requested: int
+    reserved: int
+    free: int
+
+    @property
+    def satisfied(self) -> bool:
+        """Whether pool has at least requested number of free pages."""
+        return self.free >= self.requested
+
+
+def get_hugepages_directory(page_size: Union[int, str], node: Optional[int] = None) -> str:
+    """
+    Get sysfs directory of hugepage pool.
+
+    :param page_size: Size of page in bytes or string with k, m, g suffix, eg. 2M, 1G
+    :param node: NUMA node of pool, system wide pool if not given
+    :return: Path of directory, eg. /sys/kernel/mm/hugepages/hugepages-2048kB
+    :raises MountException: when page size is incorrect
+    """
+    pool = f"hugepages-{parse_page_size(page_size) // 1024}kB"
+    if node is None:
+        return f"{HUGEPAGES_SYSFS}/{pool}"
+    return f"{NODE_SYSFS}/node{node}/hugepages/{pool}"
+
+
+def build_reservation_script(count: int, page_size: Union[int, str], node: Optional[int] = None) -> str:
+    """
+    Build shell script growing pool, so at least count of its pages are free, and reporting pool afterwards.
+
+    Script prints status line "MFD_HUGEPAGES <nr_hugepages> <free pages>" or "MFD_HUGEPAGES missing"
+    when pool of page size does not exist. Free pages of system wide pool are free_hugepages minus resv_hugepages,
+    as reserved pages are already promised to other mappings; node pools have no reserved pages count.
+
+    :param count: Requested number of free pages
+    :param page_size: Size of page in bytes or string with k, m, g suffix
+    :param node: NUMA node of pool, system wide pool if not given
+    :return: Shell script
+    :raises MountException: when count or page size is incorrect
+    """
+    if isinstance(count, bool) or not isinstance(count, int) or count < 0:
+        raise MountException(f"Number of hugepages has to be non-negative integer, got {count!r}.")
+    directory = get_hugepages_directory(page_size, node)
+    status = HUGEPAGES_STATUS_PREFIX
+    free = '$(cat "$d/free_hugepages")'
+    if node is None:
+        free = f'$(({free} - $(cat "$d/resv_hugepages")))'
+    return (
+        f'd={directory}; [ -d "$d" ] || {{ echo "{status} missing"; exit 1; }}; '
+        f'n=$(cat "$d/nr_hugepages"); t=$((n - {free} + {count})); '
+        f'[ "$n" -ge "$t" ] || echo "$t" > "$d/nr_hugepages"; '
+        f'echo "{status} $(cat "$d/nr_hugepages") {free}"'
+    )
+
+
+def parse_reservation(
+    output: str, count: int, page_size: Union[int, str], node: Optional[int] = None
+) -> HugepageReservation:
+    """
+    Parse output of reservation script, see build_reservation_script.
+
+    :param output: Output of script
+    :param count: Requested number of free pages
+    :param page_size: Size of page in bytes or string with k, m, g suffix
+    :param node: NUMA node of pool, system wide pool if not given
+    :return: HugepageReservation object
+    :raises MountException: when pool does not exist or output is not parsable
+    """
+    for line in output.splitlines():
+        fields = line.split()
+        if not fields or fields[0] != HUGEPAGES_STATUS_PREFIX:
+            continue
+        if fields[1:] == ["missing"]:
+            raise MountException(f"Hugepage pool {get_hugepages_directory(page_size, node)} does not exist.")
+        if len(fields) == 3 and fields[1].isdigit() and fields[2].isdigit():
+            return HugepageReservation(parse_page_size(page_size), node, count, int(fields[1]), int(fields[2]))
+    raise MountException(f"Cannot parse hugepage reservation output: {output!r}")
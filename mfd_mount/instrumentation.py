@@ -0,0 +1,158 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for instrumentation of mount operations."""
+
+import functools
+import logging
+import subprocess
+import threading
+import time
+from typing import Any, Callable, List, NamedTuple, Optional, Type
+
+from .utils import get_share_server, get_signature
+
+logger = logging.getLogger(__name__)
+
+
+class MountEvent(NamedTuple):
+    """Event emitted to observers after each instrumented mount operation."""
+
+    operation: str
+    fs_type: Optional[str]
+    server: Optional[str]
+    mount_point: Optional[str]
+    command: Optional[str]
+    duration: float
+    return_code: Optional[int]
+    exception: Optional[Type[BaseException]]
+
+
+MountObserver = Callable[[MountEvent], None]
+
+_observers: List[MountObserver] = []
+_recorders = threading.local()
+
+
+class _Recorder:
+    """Collects last remote command of instrumented operation."""
+
+    __slots__ = ("command", "return_code")
+
+    def __init__(self) -> None:
+        self.command = None
+        self.return_code = None
+
+
+def add_observer(observer: MountObserver) -> None:
+    """
+    Register observer called with MountEvent after each mount operation.
+
+    Observer is called in thread executing operation, its exceptions are logged and ignored.
+
+    :param observer: Callable accepting MountEvent
+    """
+    if observer not in _observers:
+        _observers.append(observer)
+
+
+def remove_observer(observer: MountObserver) -> None:
+    """
+    Unregister observer.
+
+    :param observer: Previously registered observer
+    """
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+def execute_command(connection: Any, command: str, **kwargs) -> Any:
+    """
+    Execute command on connection, recording command and return code for currently instrumented operation.
+
+    :param connection: Connection object
+    :param command: Command to execute
+    :param kwargs: Parameters of execute_command of connection
+    :return: Result of execute_command of connection
+    """
+    stack = getattr(_recorders, "stack", None)
+    if not stack:
+        return connection.execute_command(command, **kwargs)
+    recorder = stack[-1]
+    recorder.command = command
+    try:
+        result = connection.execute_command(command, **kwargs)
+    except subprocess.CalledProcessError as e:
+        recorder.return_code = e.returncode
+        raise
+    recorder.return_code = result.return_code
+    return result
+
+
+def _notify(event: MountEvent) -> None:
+    """
+    Call observers with event.
+
+    :param event: Event of finished operation
+    """
+    for observer in list(_observers):
+        try:
+            observer(event)
+        except Exception:
+            logger.exception(f"Mount observer {observer!r} failed.")
+
+
+def instrumented(operation: str, fs_type: Optional[str] = None) -> Callable:
+    """
+    Create decorator emitting MountEvent after each call of mount operation.
+
+    Parameters mount_point, share_path and mount_method (fs type of generic mount) are taken from call arguments,
+    password is masked in reported command. When no observer is registered decorated method is called directly.
+
+    :param operation: Name of operation eg. mount, umount, is_mounted
+    :param fs_type: Fs type of operation, when not given in mount_method argument
+    :return: Decorator
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):  # noqa: ANN001, ANN202
+            if not _observers:
+                return func(self, *args, **kwargs)
+
+            stack = getattr(_recorders, "stack", None)
+            if stack is None:
+                stack = _recorders.stack = []
+            recorder = _Recorder()
+            stack.append(recorder)
+            exception = None
+            started = time.perf_counter()
+            try:
+                return func(self, *args, **kwargs)
+            except BaseException as e:
+                exception = type(e)
+                raise
+            finally:
+                duration = time.perf_counter() - started
+                stack.pop()
+                arguments = get_signature(func).bind_partial(self, *args, **kwargs).arguments
+                mount_point = arguments.get("mount_point")
+                share_path = arguments.get("share_path")
+                command = recorder.command
+                if command is not None and arguments.get("password"):
+                    command = command.replace(str(arguments["password"]), "*****")
+                _notify(
+                    MountEvent(
+                        operation=operation,
+                        fs_type=arguments.get("mount_method", fs_type),
+                        server=get_share_server(share_path) if share_path is not None else None,
+                        mount_point=str(mount_point) if mount_point is not None else None,
+                        command=command,
+                        duration=duration,
+                        return_code=recorder.return_code,
+                        exception=exception,
+                    )
+                )
+
+        return wrapper
+
+    return decorator
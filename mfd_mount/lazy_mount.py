@@ -0,0 +1,135 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for mounts deferred until first access."""
+
+import functools
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Union
+
+from .utils import get_signature
+
+if TYPE_CHECKING:
+    from .base import Mount
+    from .handle import MountHandle
+
+LAZY_MOUNT_METHODS = frozenset({"mount_cifs", "mount_nfs", "mount_sshfs", "mount_tmpfs", "mount_hugetlbfs"})
+
+
+class LazyMount:
+    """
+    Mount request which is executed on first access to mount point, see Mount.lazy_mounts.
+
+    Share is mounted when path is resolved through handle (path, os.fspath, / operator) or ensure is called.
+    Share which was never accessed is neither mounted nor unmounted.
+
+    Usage example:
+    >>> with mounter.lazy_mounts().mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share") as share:
+    >>>     ...  # not mounted yet
+    >>>     open(share / "file.txt")  # mounted here
+    >>> # unmounted, if it was mounted
+    """
+
+    __slots__ = ("mounter", "method", "kwargs", "_handle", "_lock")
+
+    def __init__(self, mounter: "Mount", method: str, kwargs: Dict[str, Any]) -> None:
+        """
+        Initialize LazyMount object.
+
+        :param mounter: Mount object which mounts share
+        :param method: Name of mount method, eg. mount_nfs
+        :param kwargs: Parameters of mount method
+        """
+        self.mounter = mounter
+        self.method = method
+        self.kwargs = kwargs
+        self._handle: Optional["MountHandle"] = None
+        self._lock = threading.Lock()
+
+    @property
+    def mount_point(self) -> Union[Path, str]:
+        """Path to directory for mount, reading it does not mount share."""
+        return self.kwargs["mount_point"]
+
+    @property
+    def mounted(self) -> bool:
+        """Whether share was mounted through this handle and not unmounted yet."""
+        return self._handle is not None
+
+    def ensure(self) -> "MountHandle":
+        """
+        Mount share, unless it is already mounted through this handle.
+
+        :return: MountHandle of mounted share
+        :raises MountException: on failure of mount, next access retries mount
+        """
+        with self._lock:
+            if self._handle is None:
+                self._handle = getattr(self.mounter, self.method)(**self.kwargs)
+            return self._handle
+
+    @property
+    def path(self) -> Path:
+        """Path to mounted share, share is mounted on first access."""
+        self.ensure()
+        return Path(self.mount_point)
+
+    def __fspath__(self) -> str:
+        """Get path to mounted share, share is mounted on first access."""
+        return str(self.path)
+
+    def __truediv__(self, other: Union[Path, str]) -> Path:
+        """Get path inside mounted share, share is mounted on first access."""
+        return self.path / other
+
+    def unmount(self) -> None:
+        """
+        Unmount share if it was mounted through this handle, otherwise do nothing.
+
+        :raises UnmountException: on failure
+        """
+        with self._lock:
+            handle, self._handle = self._handle, None
+        if handle is not None:
+            handle.unmount()
+
+    def __enter__(self) -> "LazyMount":
+        """Enter context of share, share is not mounted yet."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # noqa: ANN001
+        """Unmount share if it was mounted."""
+        self.unmount()
+
+    def __repr__(self) -> str:
+        """Get representation of lazy mount."""
+        return f"{type(self).__name__}({self.method}, mount_point={self.mount_point!r}, mounted={self.mounted})"
+
+
+class LazyMounter:
+    """
+    Mounter with mount methods of wrapped mounter, which return LazyMount instead of mounting share.
+
+    Parameters are validated against signature of mount method immediately, TypeError is raised for invalid ones.
+    """
+
+    def __init__(self, mounter: "Mount") -> None:
+        """
+        Initialize LazyMounter object.
+
+        :param mounter: Mount object which mounts shares on first access
+        """
+        self.mounter = mounter
+
+    def __getattr__(self, name: str) -> Callable[..., LazyMount]:
+        """Get mount method of mounter deferring mount until first access."""
+        if name not in LAZY_MOUNT_METHODS:
+            raise AttributeError(name)
+        method = getattr(self.mounter, name)
+
+        @functools.wraps(method)
+        def lazy_method(**kwargs) -> LazyMount:  # noqa: ANN003
+            get_signature(getattr(type(self.mounter), name)).bind(self.mounter, **kwargs)
+            return LazyMount(self.mounter, name, kwargs)
+
+        return lazy_method
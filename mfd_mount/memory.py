@@ -0,0 +1,66 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for memory information of connected host used for sizing of memory backed mounts."""
+
+from typing import Dict, Optional
+
+from .exceptions import MountException
+from .options import TMPFSOptions
+
+MEMINFO_COMMAND = "cat /proc/meminfo"
+TMPFS_DEFAULT_PERCENT = 50
+# share of available memory above which tmpfs risks OOM of host
+TMPFS_MAX_PERCENT = 90
+_MIB = 1024 * 1024
+
+
+def parse_meminfo(output: str) -> Dict[str, int]:
+    """
+    Parse /proc/meminfo.
+
+    :param output: Content of /proc/meminfo
+    :return: Dictionary mapping field to value, in bytes for fields in kB (eg. MemAvailable), as given otherwise
+    """
+    meminfo = {}
+    for line in output.splitlines():
+        name, _, value = line.partition(":")
+        fields = value.split()
+        if not fields or not fields[0].isdigit():
+            continue
+        meminfo[name.strip()] = int(fields[0]) * (1024 if fields[1:] == ["kB"] else 1)
+    return meminfo
+
+
+def plan_tmpfs_options(
+    meminfo: Dict[str, int],
+    *,
+    percent: float = TMPFS_DEFAULT_PERCENT,
+    huge: Optional[str] = "within_size",
+    nr_inodes: Optional[int] = None,
+    mode: Optional[str] = None,
+    mpol: Optional[str] = None,
+) -> TMPFSOptions:
+    """
+    Compute tmpfs options with size being percentage of memory available on host.
+
+    Size is rounded down to huge page size (2 MiB by default) when huge pages are used, to whole MiB otherwise.
+
+    :param meminfo: Parsed /proc/meminfo, see parse_meminfo
+    :param percent: Percentage of MemAvailable used for tmpfs, at most TMPFS_MAX_PERCENT
+    :param huge: Transparent huge pages mode, eg. within_size (huge pages not exceeding file size), None to skip
+    :param nr_inodes: Maximal number of inodes, kernel default (half of RAM pages) if not given
+    :param mode: Permissions of root directory of mount, eg. 1777
+    :param mpol: NUMA memory policy of mount, eg. bind:0
+    :return: TMPFSOptions object
+    :raises MountException: when percent is out of range or available memory is unknown or too low
+    """
+    if not 0 < percent <= TMPFS_MAX_PERCENT:
+        raise MountException(f"percent={percent} is out of range (0, {TMPFS_MAX_PERCENT}>.")
+    available = meminfo.get("MemAvailable")
+    if available is None:
+        raise MountException("MemAvailable not found in /proc/meminfo.")
+    alignment = meminfo.get("Hugepagesize", 2 * _MIB) if huge not in (None, "never") else _MIB
+    size = int(available * percent / 100) // alignment * alignment
+    if not size:
+        raise MountException(f"Available memory {available} B is too low for tmpfs.")
+    return TMPFSOptions(size=size, nr_inodes=nr_inodes, mode=mode, huge=huge, mpol=mpol)
@@ -0,0 +1,167 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for mount table snapshots."""
+
+import re
+import time
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Union
+
+_OCTAL_ESCAPE_REGEX = re.compile(r"\\([0-7]{3})")
+
+
+def normalize_mount_point(mount_point: Union[Path, str]) -> str:
+    """
+    Normalize mount point to the form used as mount table key.
+
+    :param mount_point: Path to directory for mount
+    :return: Mount point without trailing separators
+    """
+    path = str(mount_point)
+    return path.rstrip("/") or path[:1]
+
+
+def escape_mount_point(mount_point: Union[Path, str]) -> str:
+    """
+    Encode mount point the way kernel writes it in mount table files.
+
+    :param mount_point: Path to directory for mount
+    :return: Normalized mount point with space, tab, newline and backslash as octal escapes
+    """
+    return "".join(f"\\{ord(char):03o}" if char in " \t\n\\" else char for char in normalize_mount_point(mount_point))
+
+
+def _unescape(value: str) -> str:
+    """
+    Decode octal escapes (eg. \\040 for space) used by kernel in mount table files.
+
+    :param value: Escaped field of mount table
+    :return: Decoded field
+    """
+    return _OCTAL_ESCAPE_REGEX.sub(lambda match: chr(int(match.group(1), 8)), value)
+
+
+class MountState(Enum):
+    """State of mount point reported by liveness probe."""
+
+    MOUNTED = "mounted"
+    STALE = "stale"
+    ABSENT = "absent"
+
+
+@dataclass(frozen=True)
+class MountTableEntry:
+    """Single entry of mount table."""
+
+    source: str
+    mount_point: str
+    fs_type: str
+    options: str
+
+
+class MountTable:
+    """
+    Snapshot of mount table of connected host indexed by exact mount point.
+
+    Usage example:
+    >>> table = MountTable.from_mountinfo(connection.execute_command("cat /proc/self/mountinfo").stdout)
+    >>> "/mnt/shared" in table
+    True
+    """
+
+    def __init__(self, entries: Iterable[MountTableEntry], created: Optional[float] = None) -> None:
+        """
+        Initialize MountTable object.
+
+        When several entries share mount point (stacked mounts), the last one - visible one - is kept.
+
+        :param entries: Parsed mount table entries
+        :param created: Monotonic timestamp of snapshot, current time if not given
+        """
+        self._entries: Dict[str, MountTableEntry] = {entry.mount_point: entry for entry in entries}
+        self.created = time.monotonic() if created is None else created
+
+    @classmethod
+    def from_mountinfo(cls, output: str) -> "MountTable":
+        """
+        Parse content of /proc/self/mountinfo.
+
+        Line format: id parent major:minor root mount_point options [optional fields...] - fs_type source super_options
+
+        :param output: Content of mountinfo file
+        :return: MountTable object
+        """
+        entries = []
+        for line in output.splitlines():
+            fields = line.split()
+            if "-" not in fields:
+                continue
+            separator_index = fields.index("-")
+            if separator_index < 6 or len(fields) < separator_index + 3:
+                continue
+            entries.append(
+                MountTableEntry(
+                    source=_unescape(fields[separator_index + 2]),
+                    mount_point=_unescape(fields[4]),
+                    fs_type=fields[separator_index + 1],
+                    options=fields[5],
+                )
+            )
+        return cls(entries)
+
+    @classmethod
+    def from_fstab(cls, output: str) -> "MountTable":
+        """
+        Parse mount table printed in fstab format, eg. by FreeBSD `mount -p` or /proc/mounts.
+
+        Line format: source mount_point fs_type options [dump pass]
+
+        :param output: Mount table in fstab format
+        :return: MountTable object
+        """
+        entries = []
+        for line in output.splitlines():
+            fields = line.split()
+            if len(fields) < 4 or fields[0].startswith("#"):
+                continue
+            entries.append(
+                MountTableEntry(
+                    source=_unescape(fields[0]),
+                    mount_point=_unescape(fields[1]),
+                    fs_type=fields[2],
+                    options=fields[3],
+                )
+            )
+        return cls(entries)
+
+    def get(self, mount_point: Union[Path, str]) -> Optional[MountTableEntry]:
+        """
+        Get entry for exact mount point.
+
+        :param mount_point: Path to directory for mount
+        :return: MountTableEntry if mount point is mounted, None otherwise
+        """
+        return self._entries.get(normalize_mount_point(mount_point))
+
+    def is_expired(self, ttl: float) -> bool:
+        """
+        Check if snapshot is older than given time to live.
+
+        :param ttl: Time to live of snapshot in seconds
+        :return: True if snapshot should be refreshed, False otherwise
+        """
+        return time.monotonic() - self.created >= ttl
+
+    def __contains__(self, mount_point: Union[Path, str]) -> bool:
+        """Check if exact mount point is mounted."""
+        return self.get(mount_point) is not None
+
+    def __iter__(self) -> Iterator[MountTableEntry]:
+        """Iterate over mount table entries."""
+        return iter(self._entries.values())
+
+    def __len__(self) -> int:
+        """Get number of mount points."""
+        return len(self._entries)
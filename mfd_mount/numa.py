@@ -0,0 +1,124 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for NUMA topology of connected host read from sysfs."""
+
+import shlex
+from typing import Dict, Iterable, List, NamedTuple
+
+from .exceptions import MountException
+from .hugepages import NODE_SYSFS
+
+NUMA_STATUS_PREFIX = "MFD_NUMA_NODE"
+NUMA_POLICIES = ("bind", "prefer", "preferred", "interleave")
+# prints "MFD_NUMA_NODE <node> <cpulist> <MemTotal kB> <MemFree kB>" for each node
+NUMA_TOPOLOGY_COMMAND = (
+    f"for d in {NODE_SYSFS}/node[0-9]*; do "
+    f'[ -d "$d" ] || continue; '
+    f"echo \"{NUMA_STATUS_PREFIX} ${{d##*node}} $(cat \"$d/cpulist\") "
+    f"$(awk '/MemTotal:/ {{t=$4}} /MemFree:/ {{f=$4}} END {{print t, f}}' \"$d/meminfo\")\"; "
+    f"done"
+)
+
+
+class NumaNode(NamedTuple):
+    """NUMA node of host, memory in bytes."""
+
+    node: int
+    cpus: List[int]
+    mem_total: int
+    mem_free: int
+
+
+def parse_cpulist(cpulist: str) -> List[int]:
+    """
+    Parse list in sysfs format, eg. cpulist of node.
+
+    :param cpulist: List of numbers and ranges, eg. 0-3,8-11
+    :return: Sorted numbers
+    :raises MountException: when list is incorrect
+    """
+    numbers = set()
+    for part in cpulist.strip().split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        if not first.isdigit() or (last and not last.isdigit()):
+            raise MountException(f"Incorrect list {cpulist!r}.")
+        numbers.update(range(int(first), int(last or first) + 1))
+    return sorted(numbers)
+
+
+def format_nodelist(nodes: Iterable[int]) -> str:
+    """
+    Format nodes as list of numbers and ranges, eg. for mpol option.
+
+    :param nodes: Numbers of nodes
+    :return: List in sysfs format, eg. 0-1,3
+    """
+    ranges: List[List[int]] = []
+    for node in sorted(set(nodes)):
+        if ranges and node == ranges[-1][1] + 1:
+            ranges[-1][1] = node
+        else:
+            ranges.append([node, node])
+    return ",".join(str(first) if first == last else f"{first}-{last}" for first, last in ranges)
+
+
+def parse_numa_topology(output: str) -> Dict[int, NumaNode]:
+    """
+    Parse output of NUMA_TOPOLOGY_COMMAND.
+
+    :param output: Output of command
+    :return: Dictionary mapping node number to NumaNode, empty when host has no NUMA information
+    """
+    topology = {}
+    for line in output.splitlines():
+        fields = line.split()
+        if len(fields) == 5 and fields[0] == NUMA_STATUS_PREFIX and fields[1].isdigit():
+            node = int(fields[1])
+            topology[node] = NumaNode(node, parse_cpulist(fields[2]), int(fields[3]) * 1024, int(fields[4]) * 1024)
+        elif len(fields) == 4 and fields[0] == NUMA_STATUS_PREFIX and fields[1].isdigit():  # memoryless, no cpus
+            node = int(fields[1])
+            topology[node] = NumaNode(node, [], int(fields[2]) * 1024, int(fields[3]) * 1024)
+    return topology
+
+
+def get_nic_numa_node_command(interface: str) -> str:
+    """
+    Get command printing NUMA node of network interface, -1 when device has no NUMA affinity.
+
+    :param interface: Name of network interface, eg. eth0
+    :return: Command
+    """
+    return f"cat {shlex.quote(f'/sys/class/net/{interface}/device/numa_node')}"
+
+
+def get_cpu_nodes(topology: Dict[int, NumaNode], cpus: Iterable[int]) -> List[int]:
+    """
+    Get NUMA nodes of CPUs.
+
+    :param topology: NUMA topology, see parse_numa_topology
+    :param cpus: Numbers of CPUs
+    :return: Sorted nodes containing any of CPUs
+    :raises MountException: when any CPU is not found in topology
+    """
+    cpus = set(cpus)
+    nodes = sorted(node.node for node in topology.values() if cpus.intersection(node.cpus))
+    unknown = cpus.difference(cpu for node in topology.values() for cpu in node.cpus)
+    if unknown:
+        raise MountException(f"CPUs {sorted(unknown)} not found in NUMA topology.")
+    return nodes
+
+
+def build_mpol(policy: str, nodes: Iterable[int]) -> str:
+    """
+    Build tmpfs memory policy option.
+
+    :param policy: bind, prefer (preferred) or interleave
+    :param nodes: Numbers of nodes
+    :return: Memory policy, eg. bind:0-1
+    :raises MountException: when policy is not supported
+    """
+    if policy not in NUMA_POLICIES:
+        raise MountException(f"NUMA policy {policy} is not supported, use one of {NUMA_POLICIES}.")
+    return f"{policy}:{format_nodelist(nodes)}"
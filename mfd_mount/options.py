@@ -0,0 +1,304 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for typed mount options."""
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Union
+
+from .exceptions import MountException
+
+NFS_VERSIONS = ("3", "4", "4.0", "4.1", "4.2")
+NFS_PROTOCOLS = ("tcp", "udp", "rdma", "tcp6", "udp6", "rdma6")
+NFS_MAX_NCONNECT = 16
+NFS_MIN_TRANSFER_SIZE = 4096
+NFS_MAX_TRANSFER_SIZE = 1048576
+CIFS_VERSIONS = ("1.0", "2.0", "2.1", "3", "3.0", "3.02", "3.1.1", "default")
+CIFS_MULTICHANNEL_VERSIONS = ("3", "3.0", "3.02", "3.1.1", "default")
+CIFS_CACHE_MODES = ("strict", "loose", "none")
+CIFS_MAX_CHANNELS = 16
+CIFS_MIN_TRANSFER_SIZE = 4096
+CIFS_MAX_TRANSFER_SIZE = 16777216
+TMPFS_HUGE_MODES = ("never", "always", "within_size", "advise")
+# size or nr_inodes: number with optional k, m, g, t, p, e suffix or percentage (of RAM or hugepage pool)
+_SIZE_REGEX = re.compile(r"^\d+[kmgtpe%]?$", re.IGNORECASE)
+# hugetlbfs page size: number of bytes with optional k, m, g suffix
+_PAGE_SIZE_REGEX = re.compile(r"^(?P<number>\d+)(?P<unit>[kmg]?)b?$", re.IGNORECASE)
+_MODE_REGEX = re.compile(r"^[0-7]{3,4}$")
+# memory policy: default, local or prefer, bind, interleave with nodelist, optionally =static or =relative
+_MPOL_REGEX = re.compile(
+    r"^(default|local|(?P<mode>prefer|preferred|bind|interleave)(=static|=relative)?"
+    r":(?P<nodes>\d+(-\d+)?(,\d+(-\d+)?)*))$"
+)
+
+
+def _check_range(name: str, value: Optional[int], minimum: int, maximum: Optional[int] = None) -> None:
+    """
+    Check if optional integer option is in range.
+
+    :param name: Name of option
+    :param value: Value of option, None if not set
+    :param minimum: Minimal allowed value
+    :param maximum: Maximal allowed value, None for no limit
+    :raises MountException: when value is out of range
+    """
+    if value is None:
+        return
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise MountException(f"{name} has to be integer, got {value!r}.")
+    if value < minimum or (maximum is not None and value > maximum):
+        limit = f"<{minimum}, {maximum}>" if maximum is not None else f">= {minimum}"
+        raise MountException(f"{name}={value} is out of range {limit}.")
+
+
+def _check_choice(name: str, value: Optional[str], choices: tuple) -> None:
+    """
+    Check if optional string option is one of allowed values.
+
+    :param name: Name of option
+    :param value: Value of option, None if not set
+    :param choices: Allowed values
+    :raises MountException: when value is not allowed
+    """
+    if value is not None and value not in choices:
+        raise MountException(f"{name}={value} is not supported, use one of {choices}.")
+
+
+@dataclass(frozen=True)
+class NFSOptions:
+    """
+    NFS mount options of PosixMount.mount_nfs.
+
+    Usage example:
+    >>> NFSOptions(version="4.2", nconnect=8, rsize=1048576, wsize=1048576, proto="tcp", hard=True, timeo=600)
+    """
+
+    version: Optional[str] = None
+    nconnect: Optional[int] = None
+    rsize: Optional[int] = None
+    wsize: Optional[int] = None
+    proto: Optional[str] = None
+    actimeo: Optional[int] = None
+    hard: Optional[bool] = None
+    timeo: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        """
+        Validate options.
+
+        :raises MountException: when any option is incorrect
+        """
+        _check_choice("version", self.version, NFS_VERSIONS)
+        _check_choice("proto", self.proto, NFS_PROTOCOLS)
+        _check_range("nconnect", self.nconnect, 1, NFS_MAX_NCONNECT)
+        for name in ("rsize", "wsize"):
+            value = getattr(self, name)
+            _check_range(name, value, NFS_MIN_TRANSFER_SIZE, NFS_MAX_TRANSFER_SIZE)
+            if value is not None and value % 1024:
+                raise MountException(f"{name}={value} has to be multiple of 1024.")
+        _check_range("actimeo", self.actimeo, 0)
+        _check_range("timeo", self.timeo, 1)
+        if self.proto is not None and self.proto.startswith("udp") and (self.version or "3")[0] == "4":
+            raise MountException("NFSv4 does not support UDP transport.")
+
+    def to_mount_options(self) -> List[str]:
+        """
+        Render options for -o parameter of mount program.
+
+        :return: List of options eg. ["vers=4.2", "nconnect=8"]
+        """
+        options = []
+        if self.version is not None:
+            options.append(f"vers={self.version}")
+        for name in ("proto", "nconnect", "rsize", "wsize", "timeo", "actimeo"):
+            value = getattr(self, name)
+            if value is not None:
+                options.append(f"{name}={value}")
+        if self.hard is not None:
+            options.append("hard" if self.hard else "soft")
+        return options
+
+
+@dataclass(frozen=True)
+class CIFSOptions:
+    """
+    CIFS/SMB mount options of PosixMount.mount_cifs.
+
+    Usage example:
+    >>> CIFSOptions(vers="3.1.1", multichannel=True, max_channels=4, cache="loose", rsize=4194304, wsize=4194304)
+    """
+
+    vers: Optional[str] = None
+    multichannel: Optional[bool] = None
+    max_channels: Optional[int] = None
+    cache: Optional[str] = None
+    rsize: Optional[int] = None
+    wsize: Optional[int] = None
+    actimeo: Optional[int] = None
+    nosharesock: bool = False
+
+    def __post_init__(self) -> None:
+        """
+        Validate options.
+
+        :raises MountException: when any option is incorrect
+        """
+        _check_choice("vers", self.vers, CIFS_VERSIONS)
+        _check_choice("cache", self.cache, CIFS_CACHE_MODES)
+        _check_range("max_channels", self.max_channels, 1, CIFS_MAX_CHANNELS)
+        _check_range("rsize", self.rsize, CIFS_MIN_TRANSFER_SIZE, CIFS_MAX_TRANSFER_SIZE)
+        _check_range("wsize", self.wsize, CIFS_MIN_TRANSFER_SIZE, CIFS_MAX_TRANSFER_SIZE)
+        _check_range("actimeo", self.actimeo, 0)
+        if self.multichannel and self.vers is not None and self.vers not in CIFS_MULTICHANNEL_VERSIONS:
+            raise MountException(f"Multichannel requires SMB 3, got vers={self.vers}.")
+        if self.max_channels is not None and not self.multichannel:
+            raise MountException("max_channels requires multichannel=True.")
+
+    def to_mount_options(self) -> List[str]:
+        """
+        Render options for -o parameter of mount program.
+
+        :return: List of options eg. ["vers=3.1.1", "multichannel", "max_channels=4"]
+        """
+        options = []
+        if self.vers is not None:
+            options.append(f"vers={self.vers}")
+        if self.multichannel is not None:
+            options.append("multichannel" if self.multichannel else "nomultichannel")
+        for name in ("max_channels", "cache", "rsize", "wsize", "actimeo"):
+            value = getattr(self, name)
+            if value is not None:
+                options.append(f"{name}={value}")
+        if self.nosharesock:
+            options.append("nosharesock")
+        return options
+
+
+def parse_page_size(page_size: Union[int, str]) -> int:
+    """
+    Parse page size.
+
+    :param page_size: Size in bytes or string with k, m, g suffix, eg. 2M, 1G, 2048kB
+    :return: Size in bytes
+    :raises MountException: when page size is incorrect
+    """
+    if isinstance(page_size, int) and not isinstance(page_size, bool):
+        size = page_size
+    else:
+        match = _PAGE_SIZE_REGEX.match(page_size) if isinstance(page_size, str) else None
+        if match is None:
+            raise MountException(f"Page size {page_size!r} has to be number with optional k, m or g suffix.")
+        size = int(match.group("number")) * 1024 ** " kmg".index(match.group("unit").lower() or " ")
+    if size <= 0 or size & (size - 1):
+        raise MountException(f"Page size {page_size!r} has to be power of 2.")
+    return size
+
+
+def _check_size(name: str, value: Optional[Union[int, str]]) -> None:
+    """
+    Check if optional size option is number of bytes or string with unit suffix or percentage.
+
+    :param name: Name of option
+    :param value: Value of option, None if not set
+    :raises MountException: when value is incorrect
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        _check_range(name, value, 0)
+    elif value is not None and (not isinstance(value, str) or not _SIZE_REGEX.match(value)):
+        raise MountException(f"{name}={value!r} has to be number with optional k, m, g, t, p, e or % suffix.")
+
+
+@dataclass(frozen=True)
+class TMPFSOptions:
+    """
+    tmpfs mount options of PosixMount.mount_tmpfs, see PosixMount.plan_tmpfs_options for sizing based on free memory.
+
+    Sizes are in bytes or strings with k, m, g suffix or % of RAM.
+
+    Usage example:
+    >>> TMPFSOptions(size="4g", nr_inodes="1m", mode="1777", huge="within_size", mpol="bind:0")
+    """
+
+    size: Optional[Union[int, str]] = None
+    nr_inodes: Optional[Union[int, str]] = None
+    mode: Optional[str] = None
+    huge: Optional[str] = None
+    mpol: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """
+        Validate options, preferred memory policy is rendered as prefer, as expected by kernel.
+
+        :raises MountException: when any option is incorrect
+        """
+        for name in ("size", "nr_inodes"):
+            _check_size(name, getattr(self, name))
+        if self.mode is not None and (not isinstance(self.mode, str) or not _MODE_REGEX.match(self.mode)):
+            raise MountException(f"mode={self.mode!r} has to be octal string, eg. 1777.")
+        _check_choice("huge", self.huge, TMPFS_HUGE_MODES)
+        if self.mpol is not None:
+            match = _MPOL_REGEX.match(self.mpol) if isinstance(self.mpol, str) else None
+            if match is None:
+                raise MountException(
+                    f"mpol={self.mpol} is not supported, eg. bind:0, interleave:0-1, prefer:1, local."
+                )
+            if match.group("mode") in ("prefer", "preferred") and not match.group("nodes").isdigit():
+                raise MountException(f"mpol={self.mpol} is not supported, prefer policy takes single node.")
+            if match.group("mode") == "preferred":
+                object.__setattr__(self, "mpol", "prefer" + self.mpol[len("preferred") :])
+
+    def to_mount_options(self) -> List[str]:
+        """
+        Render options for -o parameter of mount program.
+
+        :return: List of options eg. ["size=4g", "huge=within_size"]
+        """
+        return [
+            f"{name}={getattr(self, name)}"
+            for name in ("size", "nr_inodes", "mode", "huge", "mpol")
+            if getattr(self, name) is not None
+        ]
+
+
+@dataclass(frozen=True)
+class HUGETLBFSOptions:
+    """
+    hugetlbfs mount options of PosixMount.mount_hugetlbfs, see PosixMount.reserve_hugepages for reservation of pages.
+
+    Sizes are in bytes or strings with k, m, g suffix or % of pages of pool.
+    min_size is reserved from pool at mount time, so mount fails when pool has not enough free pages.
+
+    Usage example:
+    >>> HUGETLBFSOptions(pagesize="1G", size="8G", min_size="4G", nr_inodes=64)
+    """
+
+    pagesize: Optional[Union[int, str]] = None
+    size: Optional[Union[int, str]] = None
+    min_size: Optional[Union[int, str]] = None
+    nr_inodes: Optional[Union[int, str]] = None
+    mode: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """
+        Validate options.
+
+        :raises MountException: when any option is incorrect
+        """
+        if self.pagesize is not None:
+            parse_page_size(self.pagesize)
+        for name in ("size", "min_size", "nr_inodes"):
+            _check_size(name, getattr(self, name))
+        if self.mode is not None and (not isinstance(self.mode, str) or not _MODE_REGEX.match(self.mode)):
+            raise MountException(f"mode={self.mode!r} has to be octal string, eg. 1770.")
+
+    def to_mount_options(self) -> List[str]:
+        """
+        Render options for -o parameter of mount program.
+
+        :return: List of options eg. ["pagesize=1G", "size=8G"]
+        """
+        return [
+            f"{name}={getattr(self, name)}"
+            for name in ("pagesize", "size", "min_size", "nr_inodes", "mode")
+            if getattr(self, name) is not None
+        ]
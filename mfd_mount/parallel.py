@@ -0,0 +1,125 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for parallel mounting."""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
+
+from .base import MOUNT_MANY_MAX_WORKERS, MOUNT_MANY_PER_SERVER_LIMIT
+from .exceptions import MountException
+from .handle import MountHandle
+from .utils import get_share_server
+
+if TYPE_CHECKING:
+    from .base import Mount
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_FS_TYPES = ("nfs", "cifs", "tmpfs")
+
+
+@dataclass(frozen=True)
+class MountSpec:
+    """
+    Single mount request of mount_many.
+
+    Usage example:
+    >>> MountSpec("nfs", mount_point="/mnt/shared", share_path="10.10.10.10:/shared")
+    >>> MountSpec("cifs", mount_point="/mnt/cifs", share_path="//10.10.10.10/shared", options={"username": "user"})
+    """
+
+    fs_type: str
+    mount_point: Union[Path, str]
+    share_path: Union[Path, str]
+    options: Dict[str, Any] = field(default_factory=dict, hash=False)
+
+    @property
+    def server(self) -> Optional[str]:
+        """Server of share, None for shares without server eg. tmpfs."""
+        return get_share_server(self.share_path) if self.fs_type != "tmpfs" else None
+
+
+@dataclass(frozen=True)
+class MountResult:
+    """
+    Result of single mount request of mount_many.
+
+    Handle of mounted share releases it through shared mount, so share mounted also elsewhere stays mounted.
+    """
+
+    spec: MountSpec
+    exception: Optional[BaseException]
+    wait_time: float
+    duration: float
+    handle: Optional[MountHandle] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether share was mounted."""
+        return self.exception is None
+
+
+def mount_many(
+    mounter: "Mount",
+    specs: Iterable[MountSpec],
+    *,
+    max_workers: int = MOUNT_MANY_MAX_WORKERS,
+    per_server_limit: Optional[int] = MOUNT_MANY_PER_SERVER_LIMIT,
+) -> List[MountResult]:
+    """
+    Mount many shares concurrently.
+
+    :param mounter: Mount object used for mounting
+    :param specs: Mount requests
+    :param max_workers: Maximum number of mounts executed at the same time
+    :param per_server_limit: Maximum number of mounts of one server executed at the same time, None for no limit
+    :return: Results in order of specs
+    :raises MountException: when fs type of any spec is not supported or limits are incorrect
+    """
+    specs = list(specs)
+    for spec in specs:
+        if spec.fs_type not in SUPPORTED_FS_TYPES:
+            raise MountException(f"Unsupported fs type {spec.fs_type} for mount_many, use one of {SUPPORTED_FS_TYPES}")
+    if max_workers < 1 or (per_server_limit is not None and per_server_limit < 1):
+        raise MountException("max_workers and per_server_limit have to be positive numbers.")
+
+    server_semaphores = {}
+    if per_server_limit is not None:
+        server_semaphores = {
+            spec.server: threading.BoundedSemaphore(per_server_limit) for spec in specs if spec.server is not None
+        }
+
+    def _mount(spec: MountSpec) -> MountResult:
+        queued = time.perf_counter()
+        semaphore = server_semaphores.get(spec.server)
+        if semaphore is not None:
+            semaphore.acquire()
+        started = time.perf_counter()
+        exception = handle = None
+        try:
+            handle = getattr(mounter, f"mount_{spec.fs_type}")(
+                mount_point=spec.mount_point, share_path=spec.share_path, **spec.options
+            )
+        except Exception as e:
+            logger.debug(f"Mounting {spec.fs_type.upper()} share {spec.share_path} on {spec.mount_point} failed: {e}")
+            exception = e
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+        return MountResult(
+            spec=spec,
+            exception=exception,
+            wait_time=started - queued,
+            duration=time.perf_counter() - started,
+            handle=handle,
+        )
+
+    if not specs:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(specs)), thread_name_prefix="mount_many") as executor:
+        return list(executor.map(_mount, specs))
@@ -3,23 +3,64 @@
 """Module for posix mount."""
 
 import logging
+import shlex
 import subprocess
 from pathlib import Path
-from typing import Union, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Type, Union, Optional
+from weakref import WeakKeyDictionary
 
 from mfd_mount import Mount
 from mfd_mount.base import _unmount_context_manager
+from mfd_mount.handle import MountHandle
+from mfd_mount.instrumentation import instrumented
+from mfd_mount.hugepages import (
+    HUGEPAGE_DEFAULT_SIZE,
+    HugepageReservation,
+    build_reservation_script,
+    parse_reservation,
+)
+from mfd_mount.memory import MEMINFO_COMMAND, TMPFS_DEFAULT_PERCENT, parse_meminfo, plan_tmpfs_options
+from mfd_mount.numa import (
+    NUMA_TOPOLOGY_COMMAND,
+    NumaNode,
+    build_mpol,
+    get_cpu_nodes,
+    get_nic_numa_node_command,
+    parse_numa_topology,
+)
+from mfd_mount.mount_table import MountState, MountTable, escape_mount_point
+from mfd_mount.options import CIFSOptions, HUGETLBFSOptions, NFSOptions, TMPFSOptions, parse_page_size
+from mfd_mount.benchmark import MountBenchmarkResult, build_fio_command, parse_fio_output
 from mfd_mount.exceptions import (
+    MountBenchmarkException,
+    MountException,
     NFSMountException,
     CIFSMountException,
     SSHFSMountException,
     TMPFSMountException,
     HUGETLBFSMountException,
+    HugepageReservationException,
     UnmountException,
 )
 
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+    from mfd_mount.reachability import ReachabilityProbe
+    from mfd_mount.retry import CircuitBreaker, RetryPolicy
+    from mfd_mount.state_store import MountStateStore
+
 logger = logging.getLogger(__name__)
 
+MOUNT_TABLE_TTL = 5.0
+PROBE_TIMEOUT = 2
+# time for connection to deliver result of probe script, on top of probe timeout
+PROBE_CONNECTION_GRACE = 5
+# prefix of status line printed by mount-and-verify script
+MOUNT_STATUS_PREFIX = "MFD_MOUNT_STATUS"
+
+# mount table snapshots shared by all mounters of the same connection
+_mount_tables: "WeakKeyDictionary[Connection, MountTable]" = WeakKeyDictionary()
+
 
 class PosixMount(Mount):
     """
@@ -31,6 +72,58 @@ class PosixMount(Mount):
     True
     """
 
+    _MOUNT_TABLE_COMMAND = "cat /proc/self/mountinfo"
+    _LAZY_UMOUNT_OPTION = "-l"
+    # prints escaped mount points of mount table, one per line
+    _MOUNT_POINTS_COMMAND = "awk '{print $5}' /proc/self/mountinfo"
+    # state store scripts lock state directory with flock program
+    _STATE_STORE_SUPPORTED = True
+    # reachability probe uses bash /dev/tcp and timeout program
+    _REMOTE_PROBE_SUPPORTED = True
+    _FIO_IOENGINE = "psync"
+    # statfs of mount point, answered by server of network filesystem, hangs when server is gone
+    _PROBE_COMMAND = "df -P"
+
+    def __init__(
+        self,
+        connection: "Connection",
+        *,
+        mount_table_ttl: float = MOUNT_TABLE_TTL,
+        verify_mounts: bool = False,
+        cleanup_on_exit: bool = False,
+        retry_policy: Optional["RetryPolicy"] = None,
+        circuit_breaker: Optional["CircuitBreaker"] = None,
+        reachability_probe: Optional["ReachabilityProbe"] = None,
+        state_store: Optional["MountStateStore"] = None,
+    ) -> None:
+        """
+        Initialize PosixMount object.
+
+        :param connection: Connection object of host on which mounting operations will be executed.
+        :param mount_table_ttl: Time in seconds for which mount table snapshot is reused by is_mounted,
+                                0 to read mount table on every check
+        :param verify_mounts: Create mount point, mount and check mount table entry in single remote script
+        :param cleanup_on_exit: Unmount shares left mounted by this mounter at process exit (atexit, SIGTERM, SIGHUP)
+        :param retry_policy: Policy of retrying failed mounts, mounts are not retried if not given
+        :param circuit_breaker: Circuit breaker of servers, can be shared between mounters of many hosts
+        :param reachability_probe: Probe of share servers run before mount, servers are not probed if not given
+        :param state_store: Store of mounts shared with other processes, mounts of identical shares recorded in it
+                            are adopted and unmounted only by the last owner
+        :raises MountException: when state store is not supported
+        """
+        super().__init__(
+            connection,
+            cleanup_on_exit=cleanup_on_exit,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            reachability_probe=reachability_probe,
+        )
+        self.mount_table_ttl = mount_table_ttl
+        self.verify_mounts = verify_mounts
+        if state_store is not None and not self._STATE_STORE_SUPPORTED:
+            raise MountException(f"State store is not supported by {type(self).__name__}.")
+        self.state_store = state_store
+
     @_unmount_context_manager
     def mount_cifs(
         self,
@@ -39,6 +132,7 @@ class PosixMount(Mount):
         share_path: Union[Path, str],
         username: Optional[str] = None,
         password: Optional[str] = None,
+        options: Optional[CIFSOptions] = None,
     ) -> None:
         """
         Mount CIFS share.
@@ -47,9 +141,11 @@ class PosixMount(Mount):
         :param share_path: Path to mount including server eg. //10.10.10.10/to_share
         :param username: Username to share if required
         :param password: Password to share if required
+        :param options: CIFS options eg. vers, multichannel, cache mode, rsize/wsize
         :raises CIFSMountException: on failure
         """
-        self._generic_mount("cifs", mount_point, share_path, username, password)
+        mount_options = options.to_mount_options() if options else None
+        self._generic_mount("cifs", mount_point, share_path, username, password, mount_options=mount_options)
 
     @_unmount_context_manager
     def mount_nfs(
@@ -59,6 +155,7 @@ class PosixMount(Mount):
         share_path: Union[Path, str],
         username: Optional[str] = None,
         password: Optional[str] = None,
+        options: Optional[NFSOptions] = None,
     ) -> None:
         """
         Mount NFS share.
@@ -67,11 +164,14 @@ class PosixMount(Mount):
         :param share_path: Path to mount including server eg. 10.10.10.10:/to_share
         :param username: Username to share if required
         :param password: Password to share if required
+        :param options: NFS options eg. version, nconnect, rsize/wsize
         :raises NFSMountException: on failure
         """
-        self._generic_mount("nfs", mount_point, share_path, username, password)
+        mount_options = options.to_mount_options() if options else None
+        self._generic_mount("nfs", mount_point, share_path, username, password, mount_options=mount_options)
 
     @_unmount_context_manager
+    @instrumented("mount", fs_type="sshfs")
     def mount_sshfs(
         self,
         *,
@@ -93,7 +193,13 @@ class PosixMount(Mount):
         sshfs_command = "sshfs -o password_stdin -o StrictHostKeyChecking=no"
         command = f"{sshfs_command} {username}@{share_path} {mount_point} <<<'{password}'"
 
-        self._conn.execute_command(command, shell=True, custom_exception=SSHFSMountException)
+        try:
+            if self.state_store is not None:
+                self._mount_with_state_store(command, mount_point, SSHFSMountException, secrets=(password,))
+            else:
+                self._execute_command(command, shell=True, custom_exception=SSHFSMountException)
+        finally:
+            self.invalidate_mount_table()
         logger.debug(f"Mounted SSHFS share {share_path} on {mount_point}.")
 
     @_unmount_context_manager
@@ -103,6 +209,7 @@ class PosixMount(Mount):
         mount_point: Union[Path, str],
         share_path: Union[Path, str],
         params: str = "",
+        options: Optional[TMPFSOptions] = None,
     ) -> None:
         """
         Mount TMP share.
@@ -110,22 +217,94 @@ class PosixMount(Mount):
         :param mount_point: Path to directory for mount, eg. /mnt/shared
         :param share_path: Path to mount including server eg. 10.10.10.10:/to_share
         :param params: Additional parameters for the file system mount command.
+        :param options: tmpfs options eg. size, huge, mpol, see plan_tmpfs_options
         :raises TMPFSMountException: on failure
         """
-        self._generic_mount(mount_method="tmpfs", mount_point=mount_point, share_path=share_path, params=params)
+        self._generic_mount(
+            mount_method="tmpfs",
+            mount_point=mount_point,
+            share_path=share_path,
+            params=params,
+            mount_options=options.to_mount_options() if options else None,
+        )
 
     @_unmount_context_manager
-    def mount_hugetlbfs(self, *, mount_point: Union[Path, str], share_path: Union[Path, str], params: str = "") -> None:
+    def mount_hugetlbfs(
+        self,
+        *,
+        mount_point: Union[Path, str],
+        share_path: Union[Path, str],
+        params: str = "",
+        options: Optional[HUGETLBFSOptions] = None,
+        reserve: Optional[int] = None,
+        reserve_nodes: Optional[Iterable[int]] = None,
+    ) -> None:
         """
         Mount HUGELB share.
 
         :param mount_point: Path to directory for mount, eg. /mnt/shared
         :param share_path: Path to mount including server eg. 10.10.10.10:/to_share
         :param params: Additional parameters for the file system mount command.
+        :param options: hugetlbfs options eg. pagesize, size, min_size
+        :param reserve: Number of free hugepages of page size of options reserved before mount, see reserve_hugepages
+        :param reserve_nodes: NUMA nodes, reserve pages are reserved in pool of each of them, system wide if not given
         :raises HUGELBFSMountException: on failure
+        :raises HugepageReservationException: when requested hugepages could not be reserved
+        :raises MountException: when reserve_nodes is empty or given without reserve
+        """
+        if reserve_nodes is not None and reserve is None:
+            raise MountException("reserve_nodes requires reserve")
+        nodes = [None] if reserve_nodes is None else list(reserve_nodes)
+        if not nodes:
+            raise MountException("reserve_nodes is empty, give NUMA nodes or None for system wide pool.")
+        if reserve is not None:
+            page_size = options.pagesize if options and options.pagesize is not None else HUGEPAGE_DEFAULT_SIZE
+            for node in nodes:
+                self.reserve_hugepages(reserve, page_size=page_size, node=node)
+        self._generic_mount(
+            mount_method="hugetlbfs",
+            mount_point=mount_point,
+            share_path=share_path,
+            params=params,
+            mount_options=options.to_mount_options() if options else None,
+        )
+
+    def reserve_hugepages(
+        self,
+        count: int,
+        *,
+        page_size: Union[int, str] = HUGEPAGE_DEFAULT_SIZE,
+        node: Optional[int] = None,
+        strict: bool = True,
+    ) -> HugepageReservation:
+        """
+        Grow hugepage pool of connected host, so at least count of its pages are free, in single remote call.
+
+        Pool is never shrunk. nr_hugepages of pool is written in sysfs, system wide or of given NUMA node.
+
+        :param count: Requested number of free pages
+        :param page_size: Size of page in bytes or string with k, m, g suffix, eg. 2M, 1G
+        :param node: NUMA node of pool, system wide pool if not given
+        :param strict: Raise exception when fewer than count pages are free after reservation
+        :return: HugepageReservation with number of pages of pool and free ones after reservation
+        :raises HugepageReservationException: when strict and requested pages could not be reserved
+        :raises MountException: when pool of page size does not exist or parameters are incorrect
         """
-        self._generic_mount(mount_method="hugetlbfs", mount_point=mount_point, share_path=share_path, params=params)
+        script = build_reservation_script(count, page_size, node)
+        output = self._execute_command(script, shell=True, expected_return_codes=None).stdout
+        reservation = parse_reservation(output, count, page_size, node)
+        logger.debug(
+            f"Hugepages of {page_size} pool{'' if node is None else f' of node {node}'}: "
+            f"{reservation.reserved} reserved, {reservation.free} free, {count} requested."
+        )
+        if strict and not reservation.satisfied:
+            raise HugepageReservationException(
+                f"Only {reservation.free} of {count} requested {page_size} hugepages are free "
+                f"({reservation.reserved} reserved)."
+            )
+        return reservation
 
+    @instrumented("mount")
     def _generic_mount(
         self,
         mount_method: str,
@@ -134,32 +313,39 @@ class PosixMount(Mount):
         username: Optional[str] = None,
         password: Optional[str] = None,
         params: Optional[str] = None,
+        mount_options: Optional[List[str]] = None,
     ) -> None:
         """
         Mount share using generic method for posix mount program.
 
+        Username, password and mount options are rendered as single comma separated -o parameter,
+        params are passed as given.
+
         :param mount_point: Path to directory for mount
         :param share_path: Path to mount including server
         :param username: Username to share if required
         :param password: Password to share if required
         :param params: Additional parameters for mount
+        :param mount_options: Additional options for -o parameter of mount eg. ["vers=4.2", "nconnect=8"]
         :raises NFSMountException: on nfs failure
         :raises CIFSMountException: on cifs failure
         :raises TMPFSMountException: on tmpfs failure
         :raises HUGELBFSMountException: on hugelbfs failure
         """
         logger.debug(f"Mounting {mount_method.upper()} share {share_path} on {mount_point}.")
-        options = ""
+        options = []
         if username:
-            options = f"-o username={username}"
+            options.append(f"username={username}")
             if password:
-                options += f",password={password}"
-        if params:
-            options += f"{params}"
-        mount_command_list = [f"mount -t {mount_method}", str(share_path), str(mount_point)]
+                options.append(f"password={password}")
+        if mount_options:
+            options.extend(mount_options)
+        mount_command_list = [f"mount -t {mount_method}"]
         if options:
-            # insert options after mount_method
-            mount_command_list.insert(1, options)
+            mount_command_list.append(f"-o {','.join(options)}")
+        if params:
+            mount_command_list.append(params)
+        mount_command_list.extend([str(share_path), str(mount_point)])
 
         exceptions = {
             "nfs": NFSMountException,
@@ -167,30 +353,479 @@ class PosixMount(Mount):
             "tmpfs": TMPFSMountException,
             "hugetlbfs": HUGETLBFSMountException,
         }
-        self._conn.execute_command(" ".join(mount_command_list), custom_exception=exceptions[mount_method])
+        try:
+            if self.state_store is not None:
+                self._mount_with_state_store(
+                    " ".join(mount_command_list), mount_point, exceptions[mount_method], secrets=(password,)
+                )
+            elif self.verify_mounts:
+                self._mount_and_verify(" ".join(mount_command_list), mount_point, exceptions[mount_method])
+            else:
+                self._execute_command(" ".join(mount_command_list), custom_exception=exceptions[mount_method])
+        finally:
+            self.invalidate_mount_table()
         logger.debug(f"Mounted {mount_method.upper()} share {share_path} on {mount_point}.")
 
+    def _build_mount_script(self, mount_command: str, mount_point: Union[Path, str]) -> str:
+        """
+        Build shell script creating mount point, mounting share and checking mount table entry of mount point.
+
+        Script prints status line "MFD_MOUNT_STATUS <stage> <return code>",
+        where stage is mounted on success or mkdir, mount, verify - step which failed.
+
+        :param mount_command: Mount command
+        :param mount_point: Path to directory for mount
+        :return: Shell script
+        """
+        status = MOUNT_STATUS_PREFIX
+        return (
+            f'mkdir -p {shlex.quote(str(mount_point))} || {{ rc=$?; echo "{status} mkdir $rc"; exit $rc; }}; '
+            f'{mount_command} || {{ rc=$?; echo "{status} mount $rc"; exit $rc; }}; '
+            f"{self._MOUNT_POINTS_COMMAND} | grep -qxF -- {shlex.quote(escape_mount_point(mount_point))} "
+            f'|| {{ echo "{status} verify 1"; exit 1; }}; '
+            f'echo "{status} mounted 0"'
+        )
+
+    def _mount_and_verify(
+        self, mount_command: str, mount_point: Union[Path, str], exception: Type[subprocess.CalledProcessError]
+    ) -> None:
+        """
+        Mount share and verify it in single remote call, see _build_mount_script.
+
+        Mount point has to be absolute path, as it is compared with mount table entries.
+
+        :param mount_command: Mount command
+        :param mount_point: Path to directory for mount
+        :param exception: Exception raised on failure
+        :raises CalledProcessError: exception of given type when any step of script failed
+        """
+        script = self._build_mount_script(mount_command, mount_point)
+        self._run_mount_script(script, mount_point, exception, ("mounted",))
+
+    def _run_mount_script(
+        self,
+        script: str,
+        mount_point: Union[Path, str],
+        exception: Type[subprocess.CalledProcessError],
+        success_stages: Iterable[str],
+    ) -> str:
+        """
+        Run mount script printing status line "MFD_MOUNT_STATUS <stage> <return code>".
+
+        :param script: Shell script
+        :param mount_point: Path to directory for mount
+        :param exception: Exception raised on failure
+        :param success_stages: Stages reported by script on success
+        :return: Stage reported by script
+        :raises CalledProcessError: exception of given type when script did not report success,
+                                   with description of failed step followed by stderr of script
+        """
+        result = self._execute_command(script, shell=True, expected_return_codes=None)
+        stage, return_code = None, result.return_code
+        for line in result.stdout.splitlines():
+            fields = line.split()
+            if len(fields) == 3 and fields[0] == MOUNT_STATUS_PREFIX and fields[2].isdigit():
+                stage, return_code = fields[1], int(fields[2])
+        if stage not in success_stages:
+            message = f"Mount of {mount_point} failed at {stage or 'unknown'} step."
+            if stage == "verify":
+                message = f"{mount_point} not found in mount table after mount."
+            elif stage == "conflict":
+                message = f"{mount_point} holds different mount recorded in state store."
+            try:
+                stderr = result.stderr
+            except NotImplementedError:  # connection does not capture stderr
+                stderr = ""
+            raise exception(return_code or 1, script, result.stdout, f"{message}\n{stderr}".strip())
+        return stage
+
+    def _mount_with_state_store(
+        self,
+        mount_command: str,
+        mount_point: Union[Path, str],
+        exception: Type[subprocess.CalledProcessError],
+        secrets: Iterable[Optional[str]] = (),
+    ) -> None:
+        """
+        Adopt identical mount recorded in state store or mount share and record it, in single remote call.
+
+        :param mount_command: Mount command
+        :param mount_point: Path to directory for mount
+        :param exception: Exception raised on failure
+        :param secrets: Values masked in recorded mount command, eg. password
+        :raises CalledProcessError: exception of given type on failure
+        """
+        record = self.state_store.build_record(mount_command, mount_point, secrets)
+        script = self.state_store.build_acquire_script(
+            mount_command, mount_point, record, self._MOUNT_POINTS_COMMAND, MOUNT_STATUS_PREFIX
+        )
+        stage = self._run_mount_script(script, mount_point, exception, ("mounted", "adopted"))
+        if stage == "adopted":
+            logger.debug(f"Adopted mount of {mount_point} recorded in state store.")
+
+    def benchmark_mount(
+        self,
+        mount_point: Union[Path, str],
+        *,
+        workloads: Union[str, Iterable[str]] = ("write", "read", "randwrite", "randread"),
+        block_size: str = "1M",
+        file_size: str = "256M",
+        threads: int = 1,
+        runtime: Optional[int] = None,
+        direct: bool = True,
+    ) -> Dict[str, MountBenchmarkResult]:
+        """
+        Measure I/O throughput of mounted share on connected host with fio.
+
+        All workloads are run by single fio command, one after another. fio has to be installed on host.
+        tmpfs on kernels older than 6.6 does not support O_DIRECT, use direct=False for it.
+
+        :param mount_point: Path to directory of mounted share
+        :param workloads: Workload or workloads run one after another: write, read, randwrite, randread
+        :param block_size: Block size, eg. 4k, 1M
+        :param file_size: Size of file of each thread, eg. 256M
+        :param threads: Number of threads of each workload
+        :param runtime: Time in seconds of each workload, None to run until file_size is transferred
+        :param direct: Use non-buffered I/O (O_DIRECT)
+        :return: Dictionary mapping workload to MountBenchmarkResult with MB/s, IOPS and latency percentiles
+        :raises MountBenchmarkException: on fio failure
+        :raises MountException: on incorrect parameters or unparsable fio output
+        """
+        command = build_fio_command(
+            mount_point,
+            workloads=workloads,
+            block_size=block_size,
+            file_size=file_size,
+            threads=threads,
+            runtime=runtime,
+            direct=direct,
+            ioengine=self._FIO_IOENGINE,
+        )
+        logger.debug(f"Benchmarking {mount_point} mounting point.")
+        output = self._execute_command(command, custom_exception=MountBenchmarkException).stdout
+        results = parse_fio_output(output)
+        for result in results.values():
+            logger.debug(
+                f"{mount_point} {result.workload}: {result.bandwidth_mb_s:.1f} MB/s, {result.iops:.0f} IOPS, "
+                f"p99 latency {result.latency_percentiles_us[99.0]:.0f} us"
+            )
+        return results
+
+    def get_meminfo(self) -> Dict[str, int]:
+        """
+        Read memory information of connected host.
+
+        :return: Parsed /proc/meminfo, values in bytes for fields in kB, see parse_meminfo
+        """
+        return parse_meminfo(self._execute_command(MEMINFO_COMMAND, skip_logging=True).stdout)
+
+    def plan_tmpfs_options(
+        self,
+        *,
+        percent: float = TMPFS_DEFAULT_PERCENT,
+        huge: Optional[str] = "within_size",
+        nr_inodes: Optional[int] = None,
+        mode: Optional[str] = None,
+        mpol: Optional[str] = None,
+    ) -> TMPFSOptions:
+        """
+        Compute tmpfs options sized as percentage of memory available on connected host, see plan_tmpfs_options.
+
+        /proc/meminfo is read once per call.
+
+        Usage example:
+        >>> mounter.mount_tmpfs(mount_point="/mnt/scratch", share_path="tmpfs", options=mounter.plan_tmpfs_options())
+
+        :param percent: Percentage of MemAvailable used for tmpfs, at most TMPFS_MAX_PERCENT
+        :param huge: Transparent huge pages mode, eg. within_size, None to skip
+        :param nr_inodes: Maximal number of inodes, kernel default if not given
+        :param mode: Permissions of root directory of mount, eg. 1777
+        :param mpol: NUMA memory policy of mount, eg. bind:0
+        :return: TMPFSOptions object
+        :raises MountException: when percent is out of range or available memory is unknown or too low
+        """
+        options = plan_tmpfs_options(
+            self.get_meminfo(), percent=percent, huge=huge, nr_inodes=nr_inodes, mode=mode, mpol=mpol
+        )
+        logger.debug(f"Planned tmpfs options: {options.to_mount_options()}.")
+        return options
+
+    def get_numa_topology(self) -> Dict[int, NumaNode]:
+        """
+        Read NUMA topology of connected host from sysfs, in single remote call.
+
+        :return: Dictionary mapping node number to NumaNode with CPUs and memory of node, empty without NUMA
+        """
+        output = self._execute_command(NUMA_TOPOLOGY_COMMAND, shell=True, skip_logging=True).stdout
+        return parse_numa_topology(output)
+
+    def get_local_numa_nodes(
+        self,
+        *,
+        interface: Optional[str] = None,
+        cpus: Optional[Iterable[int]] = None,
+        topology: Optional[Dict[int, NumaNode]] = None,
+    ) -> List[int]:
+        """
+        Get NUMA nodes local to network interface or CPUs.
+
+        Interface without NUMA affinity (numa_node -1, eg. virtual NIC or single node host) is local to all nodes.
+
+        :param interface: Name of network interface, eg. eth0
+        :param cpus: Numbers of CPUs
+        :param topology: NUMA topology used for CPUs and interface without NUMA affinity, read from host if not given
+        :return: Sorted numbers of nodes, empty when interface has no NUMA affinity and host has no NUMA information
+        :raises MountException: when neither or both of interface and cpus are given, NUMA node of interface
+                                cannot be parsed or CPUs are not found in topology
+        """
+        if (interface is None) == (cpus is None):
+            raise MountException("Exactly one of interface and cpus has to be given.")
+        if interface is not None:
+            output = self._execute_command(get_nic_numa_node_command(interface), skip_logging=True).stdout.strip()
+            if output.isdigit():
+                return [int(output)]
+            if output != "-1":
+                raise MountException(f"Cannot parse NUMA node of interface {interface}: {output!r}.")
+            nodes = sorted(topology if topology is not None else self.get_numa_topology())
+            logger.debug(f"Interface {interface} has no NUMA affinity, using all NUMA nodes {nodes}.")
+            return nodes
+        return get_cpu_nodes(topology if topology is not None else self.get_numa_topology(), cpus)
+
+    def mount_local_scratch(
+        self,
+        *,
+        mount_point: Union[Path, str],
+        interface: Optional[str] = None,
+        cpus: Optional[Iterable[int]] = None,
+        policy: str = "bind",
+        percent: float = TMPFS_DEFAULT_PERCENT,
+        hugepages: Optional[int] = None,
+        page_size: Union[int, str] = HUGEPAGE_DEFAULT_SIZE,
+    ) -> MountHandle:
+        """
+        Mount scratch area with memory on NUMA nodes local to network interface or CPUs.
+
+        tmpfs is sized as percentage of free memory of local nodes and placed on them with memory policy.
+        With hugepages, given number of pages is reserved in pool of each local node and hugetlbfs is mounted;
+        hugetlbfs pages are allocated according to memory policy of process using them, eg. numactl --membind.
+        On host without NUMA information tmpfs is not bound to nodes and hugepages are reserved in system wide pool.
+
+        Usage example:
+        >>> with mounter.mount_local_scratch(mount_point="/mnt/scratch", interface="eth0"):
+        >>>     ...  # mount -t tmpfs -o size=...,huge=within_size,mpol=bind:1 tmpfs /mnt/scratch
+
+        :param mount_point: Path to directory for mount
+        :param interface: Name of network interface, eg. eth0
+        :param cpus: Numbers of CPUs
+        :param policy: tmpfs memory policy: bind, prefer (single node) or interleave
+        :param percent: Percentage of free memory of local nodes used for tmpfs
+        :param hugepages: Number of hugepages reserved on each local node for hugetlbfs, tmpfs is mounted if not given
+        :param page_size: Size of hugepages, eg. 2M, 1G
+        :return: MountHandle of mounted share
+        :raises MountException: when local nodes cannot be determined or parameters are incorrect
+        :raises HugepageReservationException: when requested hugepages could not be reserved
+        :raises TMPFSMountException: on tmpfs failure
+        :raises HUGELBFSMountException: on hugetlbfs failure
+        """
+        topology = self.get_numa_topology() if hugepages is None or cpus is not None else None
+        nodes = self.get_local_numa_nodes(interface=interface, cpus=cpus, topology=topology)
+        logger.debug(f"Mounting scratch area on {mount_point} local to NUMA nodes {nodes}.")
+        if hugepages is not None:
+            size = hugepages * max(len(nodes), 1) * parse_page_size(page_size)
+            return self.mount_hugetlbfs(
+                mount_point=mount_point,
+                share_path="nodev",
+                options=HUGETLBFSOptions(pagesize=page_size, size=size),
+                reserve=hugepages,
+                reserve_nodes=nodes or None,
+            )
+        if nodes:
+            free = sum(topology[node].mem_free for node in nodes if node in topology)
+            options = plan_tmpfs_options({"MemAvailable": free}, percent=percent, mpol=build_mpol(policy, nodes))
+        else:
+            options = self.plan_tmpfs_options(percent=percent)
+        return self.mount_tmpfs(mount_point=mount_point, share_path="tmpfs", options=options)
+
+    def _read_mount_table(self) -> MountTable:
+        """
+        Read and parse mount table of connected host.
+
+        :return: MountTable object
+        """
+        output = self._execute_command(self._MOUNT_TABLE_COMMAND, skip_logging=True).stdout
+        return MountTable.from_mountinfo(output)
+
+    def get_mount_table(self, *, refresh: bool = False) -> MountTable:
+        """
+        Get snapshot of mount table, read from host only when cached one is missing or expired.
+
+        :param refresh: Read mount table from host regardless of cached snapshot
+        :return: MountTable object
+        """
+        mount_table = _mount_tables.get(self._conn)
+        if refresh or mount_table is None or mount_table.is_expired(self.mount_table_ttl):
+            mount_table = self._read_mount_table()
+            _mount_tables[self._conn] = mount_table
+        return mount_table
+
+    def invalidate_mount_table(self) -> None:
+        """Drop cached mount table snapshot, so next check reads it from host."""
+        _mount_tables.pop(self._conn, None)
+
+    @instrumented("is_mounted")
     def is_mounted(self, mount_point: Union[Path, str]) -> bool:
         """Check if given mount_point is mounted.
 
+        Check is served from mount table snapshot, see get_mount_table. Filesystem of mount point is not accessed,
+        so check does not hang on stale network mounts, use probe_mount to check if mount point is responsive.
+        When mount table cannot be read, mount point is checked with df program.
+
         :param mount_point: Path to directory to check if is mounted
         :return: bool value: True if mount_point is mounted, False if not
         """
         try:
-            output = self._conn.execute_command(f"df {mount_point}").stdout
-            if mount_point not in output:
-                return False
-            return True
+            return mount_point in self.get_mount_table()
+        except subprocess.CalledProcessError as e:
+            logger.debug(f"Cannot read mount table ({e}), checking {mount_point} with df.")
+        try:
+            return str(mount_point) in self._execute_command(f"df {mount_point}").stdout
         except subprocess.CalledProcessError:
             return False
 
-    def umount(self, mount_point: Union[Path, str]) -> None:
+    def are_mounted(self, mount_points: Iterable[Union[Path, str]]) -> Dict[str, bool]:
+        """
+        Check which of given mount points are mounted, using single mount table snapshot.
+
+        :param mount_points: Paths to directories to check if are mounted
+        :return: Dictionary mapping each mount point (as string) to True if mounted, False if not
+        """
+        mount_table = self.get_mount_table()
+        return {str(mount_point): mount_point in mount_table for mount_point in mount_points}
+
+    def probe_mounts(
+        self, mount_points: Iterable[Union[Path, str]], *, timeout: int = PROBE_TIMEOUT
+    ) -> Dict[str, MountState]:
+        """
+        Check if given mount points are mounted and responsive.
+
+        Mount points missing in fresh mount table are absent, without touching filesystem.
+        Remaining ones are probed in parallel by single remote script, each probe killed after timeout,
+        so check takes at most timeout seconds even when server of share is gone.
+
+        :param mount_points: Paths to directories to check
+        :param timeout: Time in seconds after which not responding mount point is considered stale
+        :return: Dictionary mapping each mount point (as string) to MountState
+        """
+        mount_points = [str(mount_point) for mount_point in mount_points]
+        mount_table = self.get_mount_table(refresh=True)
+        states = {mount_point: MountState.ABSENT for mount_point in mount_points}
+        to_probe = [mount_point for mount_point in mount_points if mount_point in mount_table]
+        if not to_probe:
+            return states
+
+        probes = [
+            f"(timeout -s KILL {timeout} {self._PROBE_COMMAND} {shlex.quote(mount_point)} >/dev/null 2>&1; "
+            f'echo "{index} $?") &'
+            for index, mount_point in enumerate(to_probe)
+        ]
+        script = " ".join(probes + ["wait"])
+        try:
+            output = self._execute_command(
+                script, shell=True, timeout=timeout + PROBE_CONNECTION_GRACE, expected_return_codes=None
+            ).stdout
+        except subprocess.TimeoutExpired:
+            logger.debug(f"Probe of {to_probe} mounting points timed out.")
+            output = ""
+
+        return_codes = {}
+        for line in output.splitlines():
+            fields = line.split()
+            if len(fields) == 2 and fields[0].isdigit() and fields[1].isdigit():
+                return_codes[int(fields[0])] = int(fields[1])
+        for index, mount_point in enumerate(to_probe):
+            states[mount_point] = MountState.MOUNTED if return_codes.get(index) == 0 else MountState.STALE
+        return states
+
+    def probe_mount(self, mount_point: Union[Path, str], *, timeout: int = PROBE_TIMEOUT) -> MountState:
+        """
+        Check if given mount point is mounted and responsive, see probe_mounts.
+
+        :param mount_point: Path to directory to check
+        :param timeout: Time in seconds after which not responding mount point is considered stale
+        :return: MountState
+        """
+        return self.probe_mounts([mount_point], timeout=timeout)[str(mount_point)]
+
+    def _get_umount_command(self, lazy: bool) -> str:
+        """
+        Get umount program with options.
+
+        :param lazy: Use lazy unmount
+        :return: umount command without mount points
+        :raises MountException: when lazy unmount is not supported
+        """
+        if not lazy:
+            return "umount"
+        if self._LAZY_UMOUNT_OPTION is None:
+            raise MountException(f"Lazy unmount is not supported by {type(self).__name__}.")
+        return f"umount {self._LAZY_UMOUNT_OPTION}"
+
+    @instrumented("umount")
+    def umount(self, mount_point: Union[Path, str], *, lazy: bool = False) -> None:
         """
         Unmount share using posix umount program.
 
+        With state store, mount of this process is released and share is unmounted only when it has no other owners.
+
         :param mount_point: Path to directory for mounted share
+        :param lazy: Detach mount point immediately and clean up when it is not busy anymore (umount -l)
         :raises UnmountException: on failure
+        :raises MountException: when lazy unmount is not supported
         """
+        command = self._get_umount_command(lazy)
         logger.debug(f"Unmounting {mount_point} mounting point.")
-        self._conn.execute_command(f"umount {mount_point}", custom_exception=UnmountException)
+        try:
+            if self.state_store is not None:
+                script = self.state_store.build_release_script(command, [mount_point])
+                self._execute_command(script, shell=True, custom_exception=UnmountException)
+            else:
+                self._execute_command(f"{command} {mount_point}", custom_exception=UnmountException)
+        finally:
+            self.invalidate_mount_table()
+        self._forget_mount(mount_point)
         logger.debug(f"Unmounted {mount_point} mounting point.")
+
+    @instrumented("umount_many")
+    def umount_many(self, mount_points: Iterable[Union[Path, str]], *, lazy: bool = False) -> None:
+        """
+        Unmount many shares using single umount command, eg. umount /mnt/a /mnt/b.
+
+        umount attempts all mount points even if some of them fail.
+        With state store, mounts of this process are released and shares without other owners are unmounted.
+
+        :param mount_points: Paths to directories for mounted shares
+        :param lazy: Detach mount points immediately and clean up when they are not busy anymore (umount -l)
+        :raises UnmountException: when any of mount points could not be unmounted
+        :raises MountException: when lazy unmount is not supported
+        """
+        mount_points = [str(mount_point) for mount_point in mount_points]
+        if not mount_points:
+            return
+        umount_command = self._get_umount_command(lazy)
+        logger.debug(f"Unmounting {mount_points} mounting points.")
+        try:
+            if self.state_store is not None:
+                script = self.state_store.build_release_script(umount_command, mount_points)
+                self._execute_command(script, shell=True, custom_exception=UnmountException)
+            else:
+                command = " ".join([umount_command, *map(shlex.quote, mount_points)])
+                self._execute_command(command, custom_exception=UnmountException)
+        except UnmountException:
+            self.invalidate_mount_table()
+            self._forget_unmounted(mount_points)
+            raise
+        finally:
+            self.invalidate_mount_table()
+        for mount_point in mount_points:
+            self._forget_mount(mount_point)
+        logger.debug(f"Unmounted {mount_points} mounting points.")
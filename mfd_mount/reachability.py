@@ -0,0 +1,209 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for pre-flight reachability probe of share servers."""
+
+import errno
+import logging
+import selectors
+import shlex
+import socket
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from .exceptions import ServerUnreachableException
+
+if TYPE_CHECKING:
+    from .base import Mount
+
+logger = logging.getLogger(__name__)
+
+PROBE_TIMEOUT = 1.0
+PROBE_CACHE_TTL = 10.0
+# ports probed before mount, mount is attempted when any of them accepts connection
+MOUNT_PROBE_PORTS: Dict[str, Tuple[int, ...]] = {
+    "mount_nfs": (2049, 111),
+    "mount_cifs": (445,),
+    "mount_sshfs": (22,),
+}
+
+PROBE_STATUS_PREFIX = "MFD_REACHABLE"
+
+_CONNECT_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN, getattr(errno, "WSAEWOULDBLOCK", 10035)}
+
+
+def probe_server(server: str, ports: Iterable[int], timeout: float = PROBE_TIMEOUT) -> bool:
+    """
+    Check whether server accepts TCP connection on any of ports.
+
+    Connections to all addresses of server and all ports are attempted concurrently,
+    probe returns as soon as first of them is established.
+
+    :param server: Name or address of server
+    :param ports: TCP ports to connect to
+    :param timeout: Time in seconds for which connections are awaited
+    :return: True if any connection was established, False otherwise
+    """
+    deadline = time.monotonic() + timeout
+    try:
+        addresses = {info[:2] + (info[4],) for info in socket.getaddrinfo(server, None, type=socket.SOCK_STREAM)}
+    except (socket.gaierror, UnicodeError) as e:
+        logger.debug(f"Cannot resolve {server}: {e}")
+        return False
+
+    sockets: List[socket.socket] = []
+    with selectors.DefaultSelector() as selector:
+        try:
+            for family, sock_type, sockaddr in addresses:
+                for port in ports:
+                    sock = socket.socket(family, sock_type)
+                    sockets.append(sock)
+                    sock.setblocking(False)
+                    result = sock.connect_ex((sockaddr[0], port) + tuple(sockaddr[2:]))
+                    if result == 0:
+                        return True
+                    if result in _CONNECT_IN_PROGRESS:
+                        selector.register(sock, selectors.EVENT_WRITE)
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in selector.select(remaining):
+                    if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        return True
+                    selector.unregister(key.fileobj)
+            return False
+        finally:
+            for sock in sockets:
+                sock.close()
+
+
+def build_probe_command(server: str, ports: Iterable[int], timeout: float = PROBE_TIMEOUT) -> str:
+    """
+    Build shell command probing TCP ports of server from connected host, requires bash and timeout programs.
+
+    Ports are probed concurrently, command prints "MFD_REACHABLE <port>" for each port accepting connection.
+
+    :param server: Name or address of server, IPv6 address may be enclosed in brackets
+    :param ports: TCP ports to connect to
+    :param timeout: Time in seconds for which connections are awaited
+    :return: Shell command
+    """
+    host = server.strip("[]")
+    probes = [
+        f"(timeout -s KILL {timeout:g} bash -c {shlex.quote(f'</dev/tcp/{host}/{port}')} 2>/dev/null "
+        f'&& echo "{PROBE_STATUS_PREFIX} {port}") &'
+        for port in ports
+    ]
+    return " ".join([*probes, "wait"])
+
+
+def parse_probe_output(output: str) -> bool:
+    """
+    Parse output of probe command, see build_probe_command.
+
+    :param output: Output of command
+    :return: True if any port accepted connection, False otherwise
+    """
+    return any(line.split()[:1] == [PROBE_STATUS_PREFIX] for line in output.splitlines())
+
+
+class ReachabilityProbe:
+    """
+    Pre-flight check of share server, so mount of unreachable server fails fast instead of waiting for kernel timeout.
+
+    Server is probed with TCP connect from connected host, so probe checks the same route as mount, in single remote
+    call (POSIX hosts with bash and timeout programs, see build_probe_command). Hosts of other mounters
+    (FreeBSD, Windows, ESXi) and all hosts with local=True are probed from this process instead, which checks
+    route from controller to server: server reachable only from connected host (eg. through isolated storage network)
+    is then rejected. Results (positive and negative) are cached per connection and server for ttl seconds.
+    Probe can be shared between mounters.
+
+    Usage example:
+    >>> probe = ReachabilityProbe(timeout=0.5, ttl=30)
+    >>> mounter = PosixMount(connection=LocalConnection(), reachability_probe=probe)
+    >>> mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+    ServerUnreachableException: Server 10.10.10.10 is not reachable on ports (2049, 111).
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = PROBE_TIMEOUT,
+        ttl: float = PROBE_CACHE_TTL,
+        ports: Optional[Dict[str, Tuple[int, ...]]] = None,
+        local: bool = False,
+    ) -> None:
+        """
+        Initialize ReachabilityProbe object.
+
+        :param timeout: Time in seconds for which connections to server are awaited
+        :param ttl: Time in seconds for which result of probe is reused for server, 0 to probe on every mount
+        :param ports: Mapping of mount method name to probed ports, overrides MOUNT_PROBE_PORTS entries
+        :param local: Probe servers from this process even when connected host could probe them
+        """
+        self.timeout = timeout
+        self.ttl = ttl
+        self.ports = {**MOUNT_PROBE_PORTS, **(ports or {})}
+        self.local = local
+        self._results: Dict[Tuple[Any, str, Tuple[int, ...]], Tuple[bool, float]] = {}
+        self._lock = threading.Lock()
+
+    def is_reachable(self, server: str, ports: Tuple[int, ...], mounter: Optional["Mount"] = None) -> bool:
+        """
+        Check whether server accepts TCP connection on any of ports, reusing cached result.
+
+        :param server: Name or address of server
+        :param ports: TCP ports to connect to
+        :param mounter: Mount object which host probes server, server is probed from this process if not given
+        :return: True if server is reachable, False otherwise
+        """
+        remote = not self.local and mounter is not None and mounter._REMOTE_PROBE_SUPPORTED
+        key = (mounter._conn if remote else None, server, ports)
+        with self._lock:
+            cached = self._results.get(key)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+        if remote:
+            result = mounter._execute_command(
+                build_probe_command(server, ports, self.timeout),
+                shell=True,
+                expected_return_codes=None,
+                skip_logging=True,
+            )
+            reachable = parse_probe_output(result.stdout)
+        else:
+            reachable = probe_server(server, ports, self.timeout)
+        with self._lock:
+            self._results[key] = reachable, time.monotonic() + self.ttl
+        return reachable
+
+    def check(self, mount_method: str, server: Optional[str], mounter: Optional["Mount"] = None) -> None:
+        """
+        Check that server of mount request is reachable.
+
+        Mounts of shares without server (eg. tmpfs) and of methods without probed ports are not checked.
+
+        :param mount_method: Name of mount method, eg. mount_nfs
+        :param server: Name or address of share server
+        :param mounter: Mount object which host probes server, server is probed from this process if not given
+        :raises ServerUnreachableException: when server does not accept connection on any of probed ports
+        """
+        ports = self.ports.get(mount_method)
+        if server is None or not ports:
+            return
+        if not self.is_reachable(server, ports, mounter):
+            raise ServerUnreachableException(f"Server {server} is not reachable on ports {ports}.")
+
+    def clear(self, server: Optional[str] = None) -> None:
+        """
+        Drop cached results of probes.
+
+        :param server: Server which results should be dropped, all servers if not given
+        """
+        with self._lock:
+            if server is None:
+                self._results.clear()
+            else:
+                for key in [key for key in self._results if key[1] == server]:
+                    del self._results[key]
@@ -0,0 +1,250 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for retries of mount operations and circuit breaker of servers."""
+
+import logging
+import random
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Optional, Tuple, Type
+
+from .exceptions import (
+    CIFSMountException,
+    MountCircuitOpenException,
+    MountException,
+    NFSMountException,
+    SSHFSMountException,
+)
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_RESET_TIMEOUT = 60.0
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Policy of retrying failed mount.
+
+    Delay before attempt n + 1 is initial_delay * backoff ** (n - 1), capped by max_delay
+    and multiplied by random factor from <1 - jitter, 1 + jitter>.
+
+    Usage example:
+    >>> RetryPolicy(max_attempts=5, initial_delay=0.5, backoff=2, jitter=0.2, retryable_return_codes=frozenset({32}))
+    """
+
+    max_attempts: int = 3
+    initial_delay: float = 1.0
+    backoff: float = 2.0
+    max_delay: float = 30.0
+    jitter: float = 0.1
+    retryable_exceptions: Tuple[Type[BaseException], ...] = (
+        NFSMountException,
+        CIFSMountException,
+        SSHFSMountException,
+    )
+    retryable_return_codes: Optional[FrozenSet[int]] = None
+
+    def __post_init__(self) -> None:
+        """
+        Validate policy.
+
+        :raises MountException: when any parameter is incorrect
+        """
+        if self.max_attempts < 1:
+            raise MountException("max_attempts has to be positive number.")
+        if self.initial_delay < 0 or self.max_delay < 0 or self.backoff < 1:
+            raise MountException("Delays cannot be negative and backoff has to be at least 1.")
+        if not 0 <= self.jitter <= 1:
+            raise MountException("jitter has to be in range <0, 1>.")
+
+    def is_retryable(self, exception: BaseException) -> bool:
+        """
+        Check if mount failed with given exception can be retried.
+
+        :param exception: Exception raised by mount
+        :return: True if exception is retryable and its return code (if any) is retryable
+        """
+        if not isinstance(exception, self.retryable_exceptions):
+            return False
+        if self.retryable_return_codes is None:
+            return True
+        return getattr(exception, "returncode", None) in self.retryable_return_codes
+
+    def get_delay(self, attempt: int) -> float:
+        """
+        Get delay before next attempt.
+
+        :param attempt: Number of failed attempt, starting from 1
+        :return: Delay in seconds
+        """
+        delay = min(self.initial_delay * self.backoff ** (attempt - 1), self.max_delay)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+@dataclass
+class _ServerCircuit:
+    """Circuit state of single server."""
+
+    failures: int = 0
+    opened_at: Optional[float] = None
+    trial_in_progress: bool = False
+
+
+class CircuitBreaker:
+    """
+    Per-server circuit breaker rejecting mounts of server after consecutive failures.
+
+    After failure_threshold consecutive failures circuit of server opens and mounts fail fast with
+    MountCircuitOpenException. After reset_timeout single trial mount is let through (half-open):
+    success closes circuit, failure opens it again. Share single breaker between mounters of many hosts,
+    so dead server is detected once for all of them.
+
+    Usage example:
+    >>> breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    >>> mounters = [PosixMount(connection=connection, circuit_breaker=breaker) for connection in connections]
+    """
+
+    def __init__(
+        self, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD, reset_timeout: float = CIRCUIT_RESET_TIMEOUT
+    ) -> None:
+        """
+        Initialize CircuitBreaker object.
+
+        :param failure_threshold: Number of consecutive failures of server which opens circuit
+        :param reset_timeout: Time in seconds after which trial mount of server is let through
+        :raises MountException: when parameters are incorrect
+        """
+        if failure_threshold < 1:
+            raise MountException("failure_threshold has to be positive number.")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._circuits: Dict[str, _ServerCircuit] = {}
+        self._lock = threading.Lock()
+
+    def before_call(self, server: str) -> None:
+        """
+        Check if mount of server can be attempted.
+
+        :param server: Server of share
+        :raises MountCircuitOpenException: when circuit of server is open
+        """
+        with self._lock:
+            circuit = self._circuits.get(server)
+            if circuit is None or circuit.opened_at is None:
+                return
+            if not circuit.trial_in_progress and time.monotonic() - circuit.opened_at >= self.reset_timeout:
+                circuit.trial_in_progress = True
+                return
+            raise MountCircuitOpenException(
+                f"Circuit of server {server} is open after {circuit.failures} consecutive failures."
+            )
+
+    def record_success(self, server: str) -> None:
+        """
+        Close circuit of server.
+
+        :param server: Server of share
+        """
+        with self._lock:
+            self._circuits.pop(server, None)
+
+    def record_failure(self, server: str) -> None:
+        """
+        Count failure of server, opening its circuit when threshold is reached or trial mount failed.
+
+        :param server: Server of share
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(server, _ServerCircuit())
+            circuit.failures += 1
+            if circuit.trial_in_progress or circuit.failures >= self.failure_threshold:
+                if circuit.opened_at is None or circuit.trial_in_progress:
+                    logger.debug(f"Opening circuit of server {server} after {circuit.failures} failures.")
+                circuit.opened_at = time.monotonic()
+                circuit.trial_in_progress = False
+
+    def cancel_trial(self, server: str) -> None:
+        """
+        End trial mount of server without result, eg. when it failed before reaching server.
+
+        :param server: Server of share
+        """
+        with self._lock:
+            circuit = self._circuits.get(server)
+            if circuit is not None:
+                circuit.trial_in_progress = False
+
+    def is_open(self, server: str) -> bool:
+        """
+        Check if circuit of server is open.
+
+        :param server: Server of share
+        :return: True if mounts of server are rejected
+        """
+        with self._lock:
+            circuit = self._circuits.get(server)
+            return circuit is not None and circuit.opened_at is not None
+
+    def reset(self, server: Optional[str] = None) -> None:
+        """
+        Close circuits.
+
+        :param server: Server which circuit should be closed, all if not given
+        """
+        with self._lock:
+            if server is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(server, None)
+
+
+def call_with_retry(
+    mount: Callable[[], None],
+    *,
+    policy: Optional[RetryPolicy] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    server: Optional[str] = None,
+) -> None:
+    """
+    Call mount, retrying it according to policy and consulting circuit breaker of server.
+
+    Failures which are CalledProcessError or TimeoutExpired are counted by circuit breaker.
+
+    :param mount: Callable mounting share
+    :param policy: Retry policy, single attempt if not given
+    :param circuit_breaker: Circuit breaker, not used if not given or server is unknown
+    :param server: Server of share
+    :raises MountCircuitOpenException: when circuit of server is open
+    :raises MountException: exception of last attempt when all attempts failed or failure is not retryable
+    """
+    breaker = circuit_breaker if server else None
+    attempt = 0
+    while True:
+        attempt += 1
+        if breaker is not None:
+            breaker.before_call(server)
+        try:
+            mount()
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            if breaker is not None:
+                breaker.record_failure(server)
+            if policy is None or attempt >= policy.max_attempts or not policy.is_retryable(e):
+                raise
+            delay = policy.get_delay(attempt)
+            logger.debug(
+                f"Mount attempt {attempt} failed with return code {getattr(e, 'returncode', None)}, "
+                f"retrying in {delay:.2f}s."
+            )
+            time.sleep(delay)
+        except BaseException:
+            if breaker is not None:
+                breaker.cancel_trial(server)
+            raise
+        else:
+            if breaker is not None:
+                breaker.record_success(server)
+            return
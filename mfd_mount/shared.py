@@ -0,0 +1,161 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for registry of mounts shared by handles of identical mount requests."""
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Optional, Union
+from weakref import WeakKeyDictionary
+
+from .mount_table import normalize_mount_point
+
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+
+# shared mounts of connection, keyed by (mount method, mount point, other mount parameters)
+_registries: "WeakKeyDictionary[Connection, Dict[Hashable, SharedMount]]" = WeakKeyDictionary()
+_registries_lock = threading.Lock()
+
+
+class SharedMount:
+    """
+    Mount shared by all handles of identical mount requests of connection.
+
+    Share is mounted by the first handle and unmounted when the last handle is released.
+    """
+
+    def __init__(self, registry: Dict[Hashable, "SharedMount"], key: tuple) -> None:
+        """
+        Initialize SharedMount object.
+
+        :param registry: Shared mounts of connection
+        :param key: Key of mount in registry
+        """
+        self._registry = registry
+        self.key = key
+        self.users = 0
+        # serializes mount and unmount of identical requests
+        self._lock = threading.Lock()
+
+    @property
+    def mount_point(self) -> str:
+        """Normalized mount point of shared mount."""
+        return self.key[1]
+
+    def _is_registered(self) -> bool:
+        """Check if mount is still in registry, must be called with registry lock."""
+        return self._registry.get(self.key) is self
+
+    def acquire(self, mount: Callable[[], None]) -> bool:
+        """
+        Add user of mount, mounting share if it is not mounted by other user.
+
+        :param mount: Callable mounting share
+        :return: True if share was mounted, False if mount of other user was reused
+        :raises MountException: when mount failed
+        """
+        with self._lock:
+            with _registries_lock:
+                if self._is_registered() and self.users > 0:
+                    self.users += 1
+                    return False
+            try:
+                mount()
+            except BaseException:
+                with _registries_lock:
+                    if self._is_registered() and not self.users:
+                        del self._registry[self.key]
+                raise
+            with _registries_lock:
+                self._registry[self.key] = self
+                self.users = 1
+            return True
+
+    def release(self, unmount: Callable[[], None]) -> bool:
+        """
+        Remove user of mount, unmounting share if it was the last one.
+
+        Share is unmounted as well when mount was dropped from registry by direct umount.
+
+        :param unmount: Callable unmounting share
+        :return: True if share was unmounted, False if it is still used
+        :raises UnmountException: when unmount failed
+        """
+        with self._lock:
+            with _registries_lock:
+                if self._is_registered():
+                    self.users -= 1
+                    if self.users > 0:
+                        return False
+                    del self._registry[self.key]
+                self.users = 0
+            unmount()
+            return True
+
+    def __repr__(self) -> str:
+        """Get representation of shared mount."""
+        return f"{type(self).__name__}(key={self.key!r}, users={self.users})"
+
+
+def get_shared_mounts(connection: "Connection") -> Optional[Dict[Hashable, SharedMount]]:
+    """
+    Get registry of shared mounts of connection, creating it if there is none.
+
+    :param connection: Connection object of host on which shares are mounted
+    :return: Shared mounts of connection, None if connection is not hashable or weak referenceable
+    """
+    try:
+        with _registries_lock:
+            registry = _registries.get(connection)
+            if registry is None:
+                registry = _registries[connection] = {}
+            return registry
+    except TypeError:
+        return None
+
+
+def get_shared_mount(
+    registry: Dict[Hashable, SharedMount], mount_method: str, mount_point: Union[Path, str], parameters: Dict
+) -> Optional[SharedMount]:
+    """
+    Get shared mount for mount request, registering new one if there is none.
+
+    :param registry: Shared mounts of connection, see get_shared_mounts
+    :param mount_method: Name of mount method, eg. mount_nfs
+    :param mount_point: Path to directory for mount
+    :param parameters: Other parameters of mount method, eg. share_path, username, options
+    :return: SharedMount object, None if request cannot be shared (parameters not hashable)
+    """
+    key = (mount_method, normalize_mount_point(mount_point), tuple(sorted(parameters.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    with _registries_lock:
+        shared = registry.get(key)
+        if shared is None:
+            shared = registry[key] = SharedMount(registry, key)
+        return shared
+
+
+def forget_shared_mounts(connection: "Connection", mount_point: Optional[Union[Path, str]] = None) -> None:
+    """
+    Drop shared mounts of connection from registry, so next mount request mounts share again.
+
+    :param connection: Connection object of host on which shares are mounted
+    :param mount_point: Mount point which shared mounts should be dropped, all if not given
+    """
+    with _registries_lock:
+        try:
+            registry = _registries.get(connection)
+        except TypeError:
+            return
+        if not registry:
+            return
+        if mount_point is None:
+            keys = list(registry)
+        else:
+            mount_point = normalize_mount_point(mount_point)
+            keys = [key for key in registry if key[1] == mount_point]
+        for key in keys:
+            registry.pop(key).users = 0
@@ -0,0 +1,167 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for mount state shared between processes through state directory on connected host."""
+
+import hashlib
+import json
+import os
+import shlex
+import socket
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from .mount_table import escape_mount_point, normalize_mount_point
+
+STATE_DIRECTORY = "/run/mfd_mount"
+STATE_LOCK_TIMEOUT = 30
+STATE_STATUS_PREFIX = "MFD_MOUNT_STATE"
+# file descriptor of lock file in state scripts
+_LOCK_FD = 9
+
+
+class MountStateStore:
+    """
+    Store of mounts shared between processes (eg. pytest-xdist workers, consecutive jobs) on connected host.
+
+    Each mount point has state file in state directory on connected host, holding JSON record of mount
+    (mount point, mount command with masked password and digest of full command) followed by owners, one per line.
+    State files are read and written by remote scripts holding flock of lock file in state directory,
+    so mount, adoption and release are atomic between processes.
+    Process requesting mount identical to recorded one, which is still present in mount table, adopts it
+    instead of mounting again. Share is unmounted only when the last owner releases it.
+
+    Default state directory is on tmpfs, so state does not survive reboot together with mounts.
+    Requires flock program (util-linux) on connected host.
+
+    Usage example:
+    >>> mounter = PosixMount(connection=RPyCConnection("10.10.10.11"), state_store=MountStateStore())
+    >>> mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")  # mounts or adopts
+    >>> mounter.umount("/mnt/shared")  # unmounts only when no other process owns mount
+    """
+
+    def __init__(
+        self,
+        directory: Union[Path, str] = STATE_DIRECTORY,
+        *,
+        owner: Optional[str] = None,
+        lock_timeout: int = STATE_LOCK_TIMEOUT,
+    ) -> None:
+        """
+        Initialize MountStateStore object.
+
+        :param directory: Directory for state files on connected host
+        :param owner: Identifier of owner of mounts, hostname and PID of current process if not given
+        :param lock_timeout: Time in seconds for which lock of state directory is awaited
+        """
+        self.directory = str(directory).rstrip("/") or "/"
+        self.owner = owner if owner is not None else f"{socket.gethostname()}:{os.getpid()}"
+        self.lock_timeout = lock_timeout
+
+    def _get_state_file(self, mount_point: Union[Path, str]) -> str:
+        """
+        Get path of state file of mount point.
+
+        :param mount_point: Path to directory for mount
+        :return: Path to state file on connected host
+        """
+        digest = hashlib.sha1(normalize_mount_point(mount_point).encode()).hexdigest()
+        return f"{self.directory}/{digest}"
+
+    def _lock(self, status_prefix: str = STATE_STATUS_PREFIX) -> str:
+        """
+        Get shell commands creating state directory and taking its lock until end of script.
+
+        :param status_prefix: Prefix of status line printed when lock cannot be taken
+        :return: Shell commands
+        """
+        directory = shlex.quote(self.directory)
+        return (
+            f"mkdir -p {directory} && exec {_LOCK_FD}>>{directory}/.lock && flock -w {self.lock_timeout} {_LOCK_FD} "
+            f'|| {{ echo "{status_prefix} lock 1"; exit 1; }}; '
+        )
+
+    @staticmethod
+    def build_record(mount_command: str, mount_point: Union[Path, str], secrets: Iterable[Optional[str]] = ()) -> str:
+        """
+        Build JSON record of mount, identical mounts have identical records.
+
+        :param mount_command: Mount command
+        :param mount_point: Path to directory for mount
+        :param secrets: Values masked in recorded command, eg. password
+        :return: JSON record
+        """
+        masked_command = mount_command
+        for secret in secrets:
+            if secret:
+                masked_command = masked_command.replace(secret, "*****")
+        return json.dumps(
+            {
+                "mount_point": normalize_mount_point(mount_point),
+                "command": masked_command,
+                "digest": hashlib.sha1(mount_command.encode()).hexdigest(),
+            },
+            sort_keys=True,
+        )
+
+    def build_acquire_script(
+        self,
+        mount_command: str,
+        mount_point: Union[Path, str],
+        record: str,
+        mount_points_command: str,
+        status_prefix: str = STATE_STATUS_PREFIX,
+    ) -> str:
+        """
+        Build shell script adopting recorded mount or mounting share, under lock of state directory.
+
+        Script prints status line "<status_prefix> <stage> <return code>", where stage is adopted or mounted
+        on success, or lock, conflict (mount point holds different recorded mount), mkdir, mount, verify on failure.
+
+        :param mount_command: Mount command
+        :param mount_point: Path to directory for mount
+        :param record: JSON record of mount, see build_record
+        :param mount_points_command: Command printing escaped mount points of mount table, one per line
+        :param status_prefix: Prefix of status line
+        :return: Shell script
+        """
+        state_file = shlex.quote(self._get_state_file(mount_point))
+        owner = shlex.quote(self.owner)
+        record = shlex.quote(record)
+        is_mounted = f"{mount_points_command} | grep -qxF -- {shlex.quote(escape_mount_point(mount_point))}"
+        return (
+            f"{self._lock(status_prefix)}"
+            f"f={state_file}; "
+            f'if [ -f "$f" ] && {is_mounted}; then '
+            f'[ "$(head -n 1 "$f")" = {record} ] || {{ echo "{status_prefix} conflict 1"; exit 1; }}; '
+            f'tail -n +2 "$f" | grep -qxF -- {owner} || echo {owner} >> "$f"; '
+            f'echo "{status_prefix} adopted 0"; '
+            f"else "
+            f'mkdir -p {shlex.quote(str(mount_point))} || {{ rc=$?; echo "{status_prefix} mkdir $rc"; exit $rc; }}; '
+            f'{mount_command} || {{ rc=$?; echo "{status_prefix} mount $rc"; exit $rc; }}; '
+            f'{is_mounted} || {{ echo "{status_prefix} verify 1"; exit 1; }}; '
+            f"printf '%s\\n%s\\n' {record} {owner} > \"$f\"; "
+            f'echo "{status_prefix} mounted 0"; '
+            f"fi"
+        )
+
+    def build_release_script(self, umount_command: str, mount_points: Iterable[Union[Path, str]]) -> str:
+        """
+        Build shell script releasing mounts of owner and unmounting those without other owners, under lock.
+
+        Mount points without state file are unmounted unconditionally. Script exits with return code
+        of the last failed umount, all mount points are attempted.
+
+        :param umount_command: umount program with options
+        :param mount_points: Paths to directories for mounted shares
+        :return: Shell script
+        """
+        owner = shlex.quote(self.owner)
+        releases = [
+            f"f={shlex.quote(self._get_state_file(mount_point))}; "
+            f'if [ -f "$f" ]; then {{ head -n 1 "$f"; tail -n +2 "$f" | grep -vxF -- {owner}; }} > "$f.tmp"; '
+            f'mv "$f.tmp" "$f"; fi; '
+            f'if [ ! -f "$f" ] || [ "$(wc -l < "$f")" -le 1 ]; then '
+            f'{umount_command} {shlex.quote(str(mount_point))} && rm -f "$f" || rc=$?; fi; '
+            for mount_point in mount_points
+        ]
+        return "".join([self._lock(), "rc=0; ", *releases, "exit $rc"])
@@ -0,0 +1,97 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for deferred unmounts."""
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Union
+
+from .handle import MountHandle
+
+if TYPE_CHECKING:
+    from .base import Mount
+
+
+class UnmountQueue:
+    """
+    Queue of deferred unmounts, flushed with single remote command of mounter, see Mount.umount_many.
+
+    Queue is flushed on exit of context manager.
+
+    Usage example:
+    >>> with mounter.defer_unmounts() as queue:
+    >>>     queue.add(mounter.mount_nfs(mount_point="/mnt/a", share_path="10.10.10.10:/a"))
+    >>>     queue.add("/mnt/b")
+    >>> # umount /mnt/a /mnt/b
+    """
+
+    def __init__(self, mounter: "Mount", *, lazy: bool = False) -> None:
+        """
+        Initialize UnmountQueue object.
+
+        :param mounter: Mount object which unmounts shares
+        :param lazy: Detach mount points immediately and clean up when they are not busy anymore (POSIX only)
+        """
+        self.mounter = mounter
+        self.lazy = lazy
+        self._pending: List[str] = []
+        self._lock = threading.Lock()
+
+    def _append(self, mount_point: Union[Path, str]) -> None:
+        """
+        Add mount point to pending unmounts.
+
+        :param mount_point: Path to directory for mounted share
+        """
+        with self._lock:
+            self._pending.append(str(mount_point))
+
+    def add(self, mount: Union[MountHandle, Path, str]) -> None:
+        """
+        Defer unmount of share until flush.
+
+        Handle of shared mount is released immediately, share is queued only when it was the last handle.
+        Handle which was already released is ignored.
+
+        :param mount: Handle returned by mount method or mount point
+        """
+        if not isinstance(mount, MountHandle):
+            self._append(mount)
+            return
+        if mount.released:
+            return
+        mount.released = True
+        if mount.shared is None:
+            self._append(mount.mount_point)
+        else:
+            mount.shared.release(lambda: self._append(mount.mount_point))
+
+    @property
+    def pending(self) -> List[str]:
+        """Mount points waiting for flush."""
+        with self._lock:
+            return list(self._pending)
+
+    def flush(self) -> None:
+        """
+        Unmount all pending mount points with single remote command.
+
+        :raises UnmountException: when any of mount points could not be unmounted
+        :raises MountException: when lazy unmount is not supported
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if pending:
+            self.mounter.umount_many(pending, lazy=self.lazy)
+
+    def __len__(self) -> int:
+        """Get number of pending unmounts."""
+        return len(self._pending)
+
+    def __enter__(self) -> "UnmountQueue":
+        """Enter context of queue."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # noqa: ANN001
+        """Flush pending unmounts."""
+        self.flush()
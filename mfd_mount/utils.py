@@ -0,0 +1,43 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for mount helpers."""
+
+import functools
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional, Union
+
+if TYPE_CHECKING:
+    import inspect
+
+# //host/share, \\host\share, host:/share, host/share, optionally prefixed with user@
+_SHARE_SERVER_REGEX = re.compile(r"^(?:[/\\]{2})?(?:[^@/\\]+@)?(?P<server>\[[^\]]+\]|[^:/\\]+)(?::|[/\\])")
+
+
+def get_share_server(share_path: Union[Path, str]) -> Optional[str]:
+    """
+    Get server part of share path.
+
+    Supported formats: 10.10.10.10:/share, //10.10.10.10/share, \\\\10.10.10.10\\share, 10.10.10.10/share,
+    user@10.10.10.10:/share, [fe80::1]:/share.
+
+    :param share_path: Path to share including server
+    :return: Server name or address, None for shares without server eg. tmpfs
+    """
+    match = _SHARE_SERVER_REGEX.match(str(share_path))
+    return match.group("server").strip("[]") if match else None
+
+
+@functools.lru_cache(maxsize=None)
+def get_signature(func: Callable) -> "inspect.Signature":
+    """
+    Get signature of function, cached per function.
+
+    inspect is imported on first call as it is costly to import.
+
+    :param func: Function, eg. mount method
+    :return: Signature of function
+    """
+    import inspect
+
+    return inspect.signature(func)
@@ -3,16 +3,20 @@
 """Module for windows mount."""
 
 import logging
+import re
 import subprocess
 from pathlib import Path
-from typing import Union, Optional
+from typing import Dict, Iterable, Set, Union, Optional
 
 from mfd_mount import Mount
 from mfd_mount.base import _unmount_context_manager
-from mfd_mount.exceptions import NFSMountException, CIFSMountException, UnmountException
+from mfd_mount.instrumentation import instrumented
+from mfd_mount.exceptions import NFSMountException, CIFSMountException, MountException, UnmountException
 
 logger = logging.getLogger(__name__)
 
+_DRIVE_REGEX = re.compile(r"^[A-Z]:$", re.IGNORECASE)
+
 
 class WindowsMount(Mount):
     """
@@ -25,6 +29,7 @@ class WindowsMount(Mount):
     """
 
     @_unmount_context_manager
+    @instrumented("mount", fs_type="cifs")
     def mount_cifs(
         self,
         *,
@@ -53,10 +58,11 @@ class WindowsMount(Mount):
         if options:
             mount_command_list.append(options)
 
-        self._conn.execute_command(" ".join(mount_command_list), custom_exception=CIFSMountException)
+        self._execute_command(" ".join(mount_command_list), custom_exception=CIFSMountException)
         logger.debug(f"Mounted CIFS share {share_path} on {mount_point}.")
 
     @_unmount_context_manager
+    @instrumented("mount", fs_type="nfs")
     def mount_nfs(
         self,
         *,
@@ -84,9 +90,10 @@ class WindowsMount(Mount):
         if options:
             # insert options after 'mount'
             mount_command_list.insert(1, options)
-        self._conn.execute_command(" ".join(mount_command_list), custom_exception=NFSMountException)
+        self._execute_command(" ".join(mount_command_list), custom_exception=NFSMountException)
         logger.debug(f"Mounted NFS share {share_path} on {mount_point}.")
 
+    @instrumented("is_mounted")
     def is_mounted(self, mount_point: Union[Path, str]) -> bool:
         """Check if given mount_point is mounted.
 
@@ -94,20 +101,87 @@ class WindowsMount(Mount):
         :return: bool value: True if mount_point is mounted, False if not
         """
         try:
-            self._conn.execute_command(f"net use {mount_point}")
+            self._execute_command(f"net use {mount_point}")
             return True
         except subprocess.CalledProcessError:
             return False
 
-    def umount(self, mount_point: Union[Path, str]) -> None:
+    @staticmethod
+    def _parse_net_use(output: str) -> Set[str]:
+        """
+        Parse local names of connections listed by `net use`.
+
+        Local name is either first (connection without status) or second column of connection line.
+
+        :param output: Output of `net use` command
+        :return: Set of upper case drive letters with colon, eg. {"Z:"}
+        """
+        drives = set()
+        for line in output.splitlines():
+            for column in line.split()[:2]:
+                if _DRIVE_REGEX.match(column):
+                    drives.add(column.upper())
+                    break
+        return drives
+
+    def are_mounted(self, mount_points: Iterable[Union[Path, str]]) -> Dict[str, bool]:
+        """
+        Check which of given mount points are mounted, using single `net use` listing.
+
+        :param mount_points: Paths to directories to check, eg. Z:
+        :return: Dictionary mapping each mount point (as string) to True if mounted, False if not
+        """
+        drives = self._parse_net_use(self._execute_command("net use").stdout)
+        return {str(mount_point): str(mount_point).rstrip("\\").upper() in drives for mount_point in mount_points}
+
+    @instrumented("umount")
+    def umount(self, mount_point: Union[Path, str], *, lazy: bool = False) -> None:
         """
         Unmount share using net use program.
 
         :param mount_point: Path to directory for mounted share
+        :param lazy: Not supported on Windows
         :raises UnmountException: on failure
+        :raises MountException: when lazy unmount is requested
         """
+        if lazy:
+            raise MountException("Lazy unmount is not supported by WindowsMount.")
         logger.debug(f"Unmounting {mount_point} mounting point.")
-        result = self._conn.execute_command(f"net use {mount_point} /delete", custom_exception=UnmountException)
+        result = self._execute_command(f"net use {mount_point} /delete", custom_exception=UnmountException)
         if "was deleted successfully" not in result.stdout:
             raise UnmountException(1, "net use", "", "Confirmation of unmount not found")
+        self._forget_mount(mount_point)
         logger.debug(f"Unmounted {mount_point} mounting point.")
+
+    @instrumented("umount_many")
+    def umount_many(self, mount_points: Iterable[Union[Path, str]], *, lazy: bool = False) -> None:
+        """
+        Unmount many shares using single PowerShell pipeline of net use commands.
+
+        :param mount_points: Paths to directories for mounted shares, eg. Z:
+        :param lazy: Not supported on Windows
+        :raises UnmountException: when confirmation of unmount is not found for any of mount points
+        :raises MountException: when lazy unmount is requested
+        """
+        if lazy:
+            raise MountException("Lazy unmount is not supported by WindowsMount.")
+        mount_points = [str(mount_point) for mount_point in mount_points]
+        if not mount_points:
+            return
+        drives = ",".join(f"'{mount_point}'" for mount_point in mount_points)
+        command = f'powershell -Command "{drives} | ForEach-Object {{ net use $_ /delete /y }}"'
+        logger.debug(f"Unmounting {mount_points} mounting points.")
+        result = self._execute_command(command, expected_return_codes=None)
+        not_deleted = [
+            mount_point
+            for mount_point in mount_points
+            if f"{mount_point} was deleted successfully" not in result.stdout
+        ]
+        for mount_point in mount_points:
+            if mount_point not in not_deleted:
+                self._forget_mount(mount_point)
+        if not_deleted:
+            raise UnmountException(
+                result.return_code or 1, command, result.stdout, f"Confirmation of unmount not found for {not_deleted}"
+            )
+        logger.debug(f"Unmounted {mount_points} mounting points.")
@@ -0,0 +1,163 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Local fake of mfd_connect Connection simulating mount table of remote host."""
+
+import re
+import shlex
+import time
+from collections import Counter
+from subprocess import CalledProcessError
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing.os_values import OSName
+
+
+class FakeConnection:
+    """
+    Connection executing mount related commands against in-memory mount table.
+
+    Every command sleeps for `latency` seconds to simulate round trip and is counted in `commands`,
+    keyed by its program (eg. "mount", "umount", "cat", "net", "esxcli").
+    """
+
+    def __init__(self, os_name: OSName = OSName.LINUX, latency: float = 0.0) -> None:
+        self.os_name = os_name
+        self.latency = latency
+        self.commands: Counter = Counter()
+        # mount point -> (fs type, source)
+        self.mounts: Dict[str, Tuple[str, str]] = {}
+        self._handlers: List[Tuple[re.Pattern, Callable]] = [
+            (re.compile(r"^cat /proc/self/mountinfo$"), self._mountinfo),
+            (re.compile(r"^mount -p$"), self._mount_p),
+            (re.compile(r"^mount -t (?P<fs_type>\S+) (?P<args>.+)$"), self._posix_mount),
+            (re.compile(r"^umount (?P<mount_points>.+)$"), self._posix_umount),
+            (re.compile(r"^sshfs .* \S+@(?P<source>\S+) (?P<mount_point>\S+) <<<.*$"), self._sshfs),
+            (re.compile(r"^mount_smbfs -I \S+ (?P<source>\S+) (?P<mount_point>\S+)$"), self._smbfs),
+            (re.compile(r"^net use$"), self._net_use_list),
+            (re.compile(r"^net use (?P<drive>\S+) /delete$"), self._net_use_delete),
+            (re.compile(r"^net use (?P<drive>\S+)$"), self._net_use_show),
+            (re.compile(r"^net use (?P<drive>\S+) (?P<source>\S+) /persistent:no.*$"), self._net_use_add),
+            (re.compile(r"^mount (?:-u:\S+ )?(?:-p:\S+ )?(?P<source>\S+) (?P<drive>\S+)$"), self._windows_nfs),
+            (re.compile(r"^esxcli --formatter=csv storage (?P<kind>nfs|nfs41) list$"), self._esxcli_list),
+            (
+                re.compile(r"^esxcli storage nfs add -H (?P<host>\S+) -s (?P<share>\S+) -v (?P<volume>\S+)$"),
+                self._esx_add,
+            ),
+            (re.compile(r"^esxcli storage nfs remove -v (?P<volume>\S+)$"), self._esx_remove),
+            (
+                re.compile(r"^powershell -Command \"(?P<drives>\S+) \| ForEach-Object .*net use .*/delete"),
+                self._ps_delete,
+            ),
+            (re.compile(r"^rc=0; for volume in (?P<volumes>.+); do esxcli storage nfs remove"), self._esx_remove_loop),
+        ]
+
+    def get_os_name(self) -> OSName:
+        """Get simulated OS."""
+        return self.os_name
+
+    def execute_command(
+        self, command: str, *, custom_exception: Optional[Type[CalledProcessError]] = None, **kwargs
+    ) -> ConnectionCompletedProcess:
+        """Execute command against simulated mount table."""
+        if self.latency:
+            time.sleep(self.latency)
+        self.commands[command.split()[0]] += 1
+        for regex, handler in self._handlers:
+            match = regex.match(command)
+            if match:
+                try:
+                    stdout = handler(**match.groupdict())
+                except CalledProcessError as e:
+                    raise (custom_exception or CalledProcessError)(e.returncode, command, e.output, e.stderr)
+                return ConnectionCompletedProcess(args=command, stdout=stdout or "", return_code=0)
+        raise (custom_exception or CalledProcessError)(127, command, "", f"{command}: command not found")
+
+    def _add(self, mount_point: str, fs_type: str, source: str) -> None:
+        if mount_point in self.mounts:
+            raise CalledProcessError(32, "mount", "", f"{mount_point}: already mounted")
+        self.mounts[mount_point] = (fs_type, source)
+
+    def _remove(self, mount_point: str) -> None:
+        if self.mounts.pop(mount_point, None) is None:
+            raise CalledProcessError(32, "umount", "", f"{mount_point}: not mounted")
+
+    def _mountinfo(self) -> str:
+        lines = ["22 1 8:1 / / rw,relatime shared:1 - ext4 /dev/sda1 rw"]
+        for index, (mount_point, (fs_type, source)) in enumerate(self.mounts.items()):
+            escaped = mount_point.replace(" ", "\\040")
+            lines.append(f"{100 + index} 22 0:{50 + index} / {escaped} rw,relatime - {fs_type} {source} rw")
+        return "\n".join(lines) + "\n"
+
+    def _mount_p(self) -> str:
+        lines = ["/dev/ada0p2\t/\tufs\trw\t1 1"]
+        for mount_point, (fs_type, source) in self.mounts.items():
+            lines.append(f"{source}\t{mount_point}\t{fs_type}\trw\t0 0")
+        return "\n".join(lines) + "\n"
+
+    def _posix_mount(self, fs_type: str, args: str) -> None:
+        positional = [arg for arg in shlex.split(args) if not arg.startswith("-")]
+        # options are passed as "-o value", skip their values
+        tokens = shlex.split(args)
+        option_values = {tokens[i + 1] for i, token in enumerate(tokens[:-1]) if token == "-o"}
+        source, mount_point = [arg for arg in positional if arg not in option_values][-2:]
+        self._add(mount_point, fs_type, source)
+
+    def _posix_umount(self, mount_points: str) -> None:
+        for mount_point in shlex.split(mount_points):
+            if not mount_point.startswith("-"):
+                self._remove(mount_point)
+
+    def _sshfs(self, source: str, mount_point: str) -> None:
+        self._add(mount_point, "fuse.sshfs", source)
+
+    def _smbfs(self, source: str, mount_point: str) -> None:
+        self._add(mount_point, "smbfs", source)
+
+    def _net_use_list(self) -> str:
+        lines = ["Status       Local     Remote                    Network", "-" * 79]
+        for drive, (_, source) in self.mounts.items():
+            lines.append(f"OK           {drive:<10}{source:<26}Microsoft Windows Network")
+        lines.append("The command completed successfully.")
+        return "\n".join(lines)
+
+    def _net_use_show(self, drive: str) -> str:
+        if drive not in self.mounts:
+            raise CalledProcessError(2, "net use", "", "The network connection could not be found.")
+        return f"Local name        {drive}\nRemote name       {self.mounts[drive][1]}\n"
+
+    def _net_use_add(self, drive: str, source: str) -> None:
+        self._add(drive, "cifs", source)
+
+    def _net_use_delete(self, drive: str) -> str:
+        self._remove(drive)
+        return f"{drive} was deleted successfully."
+
+    def _ps_delete(self, drives: str) -> str:
+        output = []
+        for drive in drives.replace("'", "").split(","):
+            self._remove(drive)
+            output.append(f"{drive} was deleted successfully.")
+        return "\n".join(output)
+
+    def _esx_remove_loop(self, volumes: str) -> None:
+        for volume in shlex.split(volumes):
+            self._remove(volume)
+
+    def _windows_nfs(self, source: str, drive: str) -> None:
+        self._add(drive, "nfs", source)
+
+    def _esxcli_list(self, kind: str) -> str:
+        host_column = "Host" if kind == "nfs" else "Hosts"
+        lines = [f"Accessible,Hardware Acceleration,{host_column},Mounted,Read-Only,Share,Volume Name,isPE,"]
+        for volume, (fs_type, source) in self.mounts.items():
+            if fs_type == kind:
+                host, share = source.split(":", 1)
+                lines.append(f"true,Not Supported,{host},true,false,{share},{volume},false,")
+        return "\n".join(lines) + "\n"
+
+    def _esx_add(self, host: str, share: str, volume: str) -> None:
+        self._add(volume, "nfs", f"{host}:{share}")
+
+    def _esx_remove(self, volume: str) -> None:
+        self._remove(volume)
@@ -0,0 +1,31 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of `import mfd_mount` measured with `python -X importtime` in fresh interpreter."""
+
+import re
+import subprocess
+import sys
+from typing import List
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+# generous budget of cumulative import time of mfd_mount in microseconds, interpreter start-up is not included
+IMPORT_TIME_BUDGET_US = 50_000
+_IMPORT_TIME_REGEX = re.compile(r"^import time:\s+\d+ \|\s+(?P<cumulative>\d+) \| mfd_mount$", re.MULTILINE)
+
+
+def _import_time_us() -> int:
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import mfd_mount"], capture_output=True, text=True, check=True
+    ).stderr
+    return int(_IMPORT_TIME_REGEX.search(stderr).group("cumulative"))
+
+
+class TestImportTime:
+    def test_import(self, benchmark):
+        import_times: List[int] = []
+        benchmark.pedantic(lambda: import_times.append(_import_time_us()), rounds=5)
+        benchmark.extra_info["import_time_us"] = min(import_times)
+        assert min(import_times) < IMPORT_TIME_BUDGET_US
@@ -0,0 +1,51 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of generic Mount construction with and without cached OS detection."""
+
+import time
+
+import pytest
+from mfd_typing.os_values import OSName
+
+from mfd_mount import Mount
+
+pytest.importorskip("pytest_benchmark")
+
+OS_DETECTION_LATENCY = 0.001
+
+
+class _RemoteConnection:
+    """Connection which simulates round trip of OS detection and counts it."""
+
+    def __init__(self) -> None:
+        self.os_name_calls = 0
+
+    def get_os_name(self) -> OSName:
+        self.os_name_calls += 1
+        time.sleep(OS_DETECTION_LATENCY)
+        return OSName.LINUX
+
+
+class TestMountConstruction:
+    @pytest.fixture()
+    def conn(self):
+        conn = _RemoteConnection()
+        yield conn
+        Mount.clear_mount_class_cache(conn)
+
+    @pytest.mark.parametrize("cached", [False, True], ids=["uncached", "cached"])
+    def test_construction(self, benchmark, conn, cached):
+        benchmark.group = "Mount construction"
+        constructions = 0
+
+        def construct():
+            nonlocal constructions
+            constructions += 1
+            if not cached:
+                Mount.clear_mount_class_cache(conn)
+            Mount(connection=conn)
+
+        Mount.clear_mount_class_cache(conn)
+        benchmark(construct)
+        # cached class is detected once, uncached on every construction
+        assert conn.os_name_calls == (1 if cached else constructions)
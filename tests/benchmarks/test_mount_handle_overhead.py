@@ -0,0 +1,67 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Micro-benchmark of Python-side overhead of decorated mount call, before and after MountHandle."""
+
+import gc
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+
+from mfd_mount import PosixMount
+from mfd_mount.base import _unmount_context_manager
+
+pytest.importorskip("pytest_benchmark")
+
+ITERATIONS = 2000
+
+
+def _legacy_unmount_context_manager(func):
+    """Decorator as implemented before MountHandle: new class and new mounter per call."""
+
+    def decorator_func(self, *args, **kwargs):
+        mount_point = kwargs.get("mount_point")
+        func(self, *args, **kwargs)
+        mounter = self
+
+        class ContextManager(type(self)):
+            def __enter__(self):
+                pass
+
+            def __exit__(self, exc_type, exc_val, exc_tb):
+                mounter.umount(mount_point)
+
+        return ContextManager(self._conn)
+
+    return decorator_func
+
+
+def _noop_mount(self, *, mount_point, share_path):
+    pass
+
+
+class TestMountHandleOverhead:
+    @pytest.fixture()
+    def mount(self, mocker):
+        conn = mocker.create_autospec(RPyCConnection)
+        conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        return PosixMount(connection=conn)
+
+    @pytest.mark.parametrize(
+        "decorator", [_legacy_unmount_context_manager, _unmount_context_manager], ids=["legacy", "mount_handle"]
+    )
+    def test_per_call_overhead(self, benchmark, mount, decorator):
+        benchmark.group = "decorated mount call"
+        decorated = decorator(_noop_mount)
+        benchmark(decorated, mount, mount_point="/mnt/shared", share_path="10.10.10.10:/share")
+
+    def test_no_class_objects_left_behind(self, mount):
+        decorated = _unmount_context_manager(_noop_mount)
+        # first call imports modules used by decorator
+        decorated(mount, mount_point="/mnt/shared", share_path="10.10.10.10:/share")
+        gc.collect()
+        classes_before = sum(isinstance(obj, type) for obj in gc.get_objects())
+        for _ in range(ITERATIONS):
+            decorated(mount, mount_point="/mnt/shared", share_path="10.10.10.10:/share")
+        gc.collect()
+        assert sum(isinstance(obj, type) for obj in gc.get_objects()) <= classes_before
@@ -0,0 +1,176 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Benchmarks of Python-side overhead and remote command count of mount operations.
+
+Run with: pytest tests/benchmarks --benchmark-only
+Remote command counts are reported in extra_info of each benchmark and asserted, so added round trips fail the suite.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict
+
+import pytest
+from mfd_typing.os_values import OSName
+
+from mfd_mount import ESXiMount, FreeBSDMount, PosixMount, WindowsMount
+
+from .fake_connection import FakeConnection
+
+pytest.importorskip("pytest_benchmark")
+
+# simulated round trip of single remote command in seconds
+LATENCY = float(os.environ.get("MFD_MOUNT_BENCHMARK_LATENCY", "0"))
+
+
+@dataclass(frozen=True)
+class Backend:
+    mount_class: type
+    os_name: OSName
+    mount: Callable
+    mount_point: str
+    fs_type: str
+    source: str
+
+
+BACKENDS: Dict[str, Backend] = {
+    "posix": Backend(
+        PosixMount,
+        OSName.LINUX,
+        lambda mounter: mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/shared"),
+        "/mnt/shared",
+        "nfs",
+        "10.10.10.10:/shared",
+    ),
+    "freebsd": Backend(
+        FreeBSDMount,
+        OSName.FREEBSD,
+        lambda mounter: mounter.mount_cifs(mount_point="/mnt/shared", share_path="10.10.10.10/shared", username="u"),
+        "/mnt/shared",
+        "smbfs",
+        "//u@10.10.10.10/shared",
+    ),
+    "windows": Backend(
+        WindowsMount,
+        OSName.WINDOWS,
+        lambda mounter: mounter.mount_cifs(mount_point="Z:", share_path=r"\\10.10.10.10\shared"),
+        "Z:",
+        "cifs",
+        r"\\10.10.10.10\shared",
+    ),
+    "esxi": Backend(
+        ESXiMount,
+        OSName.ESXI,
+        lambda mounter: mounter.mount_nfs(mount_point="shared", share_path="10.10.10.10:/shared"),
+        "shared",
+        "nfs",
+        "10.10.10.10:/shared",
+    ),
+}
+
+# expected remote commands per operation, (cold, warm) for is_mounted served from cache
+EXPECTED_COMMANDS = {
+    "posix": {"mount": 1, "umount": 1, "context_manager": 2, "is_mounted": (1, 0), "umount_many": 1},
+    "freebsd": {"mount": 1, "umount": 1, "context_manager": 2, "is_mounted": (1, 0), "umount_many": 1},
+    "windows": {"mount": 1, "umount": 1, "context_manager": 2, "is_mounted": (1, 1), "umount_many": 1},
+    "esxi": {"mount": 1, "umount": 1, "context_manager": 2, "is_mounted": (2, 0), "umount_many": 1},
+}
+# number of mount points unmounted by umount_many benchmark
+UMOUNT_MANY_COUNT = 10
+
+
+@pytest.fixture(params=BACKENDS.keys())
+def backend(request):
+    return request.param
+
+
+@pytest.fixture()
+def setup(backend):
+    conn = FakeConnection(os_name=BACKENDS[backend].os_name, latency=LATENCY)
+    return BACKENDS[backend], conn, BACKENDS[backend].mount_class(connection=conn)
+
+
+def _count_commands(conn: FakeConnection, operation: Callable) -> int:
+    before = sum(conn.commands.values())
+    operation()
+    return sum(conn.commands.values()) - before
+
+
+def _set_mounted(backend: Backend, conn: FakeConnection, mounted: bool, mounter=None) -> None:
+    if mounted:
+        conn.mounts[backend.mount_point] = (backend.fs_type, backend.source)
+    else:
+        conn.mounts.pop(backend.mount_point, None)
+        if mounter is not None:
+            # drop shared mount, so each round mounts share again
+            mounter.forget_shared_mounts()
+
+
+def _many_mount_points(backend: Backend) -> list:
+    if backend.os_name == OSName.WINDOWS:
+        return [f"{chr(ord('D') + index)}:" for index in range(UMOUNT_MANY_COUNT)]
+    return [f"{backend.mount_point}{index}" for index in range(UMOUNT_MANY_COUNT)]
+
+
+def _set_many_mounted(backend: Backend, conn: FakeConnection) -> None:
+    for mount_point in _many_mount_points(backend):
+        conn.mounts[mount_point] = (backend.fs_type, backend.source)
+
+
+class TestMountOperationsBenchmark:
+    def test_mount(self, benchmark, backend, setup):
+        params, conn, mounter = setup
+        commands = _count_commands(conn, lambda: params.mount(mounter))
+        benchmark.extra_info["remote_commands"] = commands
+        assert commands == EXPECTED_COMMANDS[backend]["mount"]
+        benchmark.pedantic(
+            params.mount,
+            args=(mounter,),
+            setup=lambda: _set_mounted(params, conn, False, mounter),
+            rounds=200,
+        )
+
+    def test_umount(self, benchmark, backend, setup):
+        params, conn, mounter = setup
+        _set_mounted(params, conn, True)
+        commands = _count_commands(conn, lambda: mounter.umount(params.mount_point))
+        benchmark.extra_info["remote_commands"] = commands
+        assert commands == EXPECTED_COMMANDS[backend]["umount"]
+        benchmark.pedantic(
+            mounter.umount, args=(params.mount_point,), setup=lambda: _set_mounted(params, conn, True), rounds=200
+        )
+
+    def test_context_manager(self, benchmark, backend, setup):
+        params, conn, mounter = setup
+
+        def mount_and_unmount():
+            with params.mount(mounter):
+                pass
+
+        commands = _count_commands(conn, mount_and_unmount)
+        benchmark.extra_info["remote_commands"] = commands
+        assert commands == EXPECTED_COMMANDS[backend]["context_manager"]
+        benchmark(mount_and_unmount)
+
+    def test_is_mounted(self, benchmark, backend, setup):
+        params, conn, mounter = setup
+        _set_mounted(params, conn, True)
+        cold = _count_commands(conn, lambda: mounter.is_mounted(params.mount_point))
+        warm = _count_commands(conn, lambda: mounter.is_mounted(params.mount_point))
+        benchmark.extra_info["remote_commands_cold"] = cold
+        benchmark.extra_info["remote_commands_warm"] = warm
+        assert (cold, warm) == EXPECTED_COMMANDS[backend]["is_mounted"]
+        assert benchmark(mounter.is_mounted, params.mount_point) is True
+
+    def test_umount_many(self, benchmark, backend, setup):
+        params, conn, mounter = setup
+        mount_points = _many_mount_points(params)
+        _set_many_mounted(params, conn)
+        commands = _count_commands(conn, lambda: mounter.umount_many(mount_points))
+        benchmark.extra_info["remote_commands"] = commands
+        assert commands == EXPECTED_COMMANDS[backend]["umount_many"]
+        assert not conn.mounts
+        benchmark.pedantic(
+            mounter.umount_many, args=(mount_points,), setup=lambda: _set_many_mounted(params, conn), rounds=200
+        )
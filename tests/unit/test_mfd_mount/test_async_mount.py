@@ -0,0 +1,118 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing.os_values import OSName
+
+from mfd_mount import (
+    AsyncESXiMount,
+    AsyncFreeBSDMount,
+    AsyncMount,
+    AsyncPosixMount,
+    AsyncWindowsMount,
+    ESXiMount,
+    FreeBSDMount,
+    PosixMount,
+    WindowsMount,
+)
+from mfd_mount.exceptions import MountConnectedOSNotSupportedException, NFSMountException, UnmountException
+
+MOUNTINFO = "40 22 0:35 / /mnt/shared rw,relatime - nfs4 10.10.10.10:/to_share rw\n"
+
+
+class TestAsyncMount:
+    @pytest.fixture()
+    def conn(self, mocker):
+        conn = mocker.create_autospec(RPyCConnection)
+        conn.get_os_name.return_value = OSName.LINUX
+        conn.execute_command.return_value = ConnectionCompletedProcess(args="", stdout=MOUNTINFO, return_code=0)
+        return conn
+
+    @pytest.mark.parametrize(
+        "os_name, async_class, mount_class",
+        [
+            (OSName.LINUX, AsyncPosixMount, PosixMount),
+            (OSName.FREEBSD, AsyncFreeBSDMount, FreeBSDMount),
+            (OSName.WINDOWS, AsyncWindowsMount, WindowsMount),
+            (OSName.ESXI, AsyncESXiMount, ESXiMount),
+        ],
+    )
+    def test_class_dispatch(self, conn, os_name, async_class, mount_class):
+        conn.get_os_name.return_value = os_name
+        mounter = AsyncMount(connection=conn)
+        assert type(mounter) is async_class
+        assert type(mounter.mounter) is mount_class
+
+    def test_class_dispatch_not_supported(self, conn):
+        conn.get_os_name.return_value = OSName.MELLANOX
+        with pytest.raises(MountConnectedOSNotSupportedException):
+            AsyncMount(connection=conn)
+
+    def test_subclass_parameters(self, conn):
+        assert AsyncMount(connection=conn, mount_table_ttl=0).mounter.mount_table_ttl == 0
+
+    def test_mount_nfs(self, conn):
+        mounter = AsyncMount(connection=conn)
+
+        async def scenario():
+            return await mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+
+        assert asyncio.run(scenario()).mount_point == "/mnt/shared"
+        conn.execute_command.assert_called_once_with(
+            "mount -t nfs 10.10.10.10:/to_share /mnt/shared", custom_exception=NFSMountException
+        )
+
+    def test_mount_cifs_context_manager(self, conn):
+        mounter = AsyncMount(connection=conn)
+
+        async def scenario():
+            async with mounter.mount_cifs(
+                mount_point="/mnt/shared", share_path="//10.10.10.10/to_share", username="admin"
+            ):
+                assert await mounter.is_mounted("/mnt/shared") is True
+            return await mounter.are_mounted(["/mnt/shared", "/mnt/other"])
+
+        assert asyncio.run(scenario()) == {"/mnt/shared": True, "/mnt/other": False}
+        commands = [c.args[0] for c in conn.execute_command.call_args_list]
+        assert commands == [
+            "mount -t cifs -o username=admin //10.10.10.10/to_share /mnt/shared",
+            "cat /proc/self/mountinfo",
+            "umount /mnt/shared",
+            "cat /proc/self/mountinfo",
+        ]
+
+    def test_context_manager_releases_shared_mount(self, conn):
+        handle = PosixMount(connection=conn).mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        mounter = AsyncMount(connection=conn)
+
+        async def scenario():
+            async with mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share") as inner:
+                assert inner.shared is handle.shared
+                assert handle.shared.users == 2
+
+        asyncio.run(scenario())
+        assert handle.shared.users == 1
+        commands = [c.args[0] for c in conn.execute_command.call_args_list]
+        assert commands == ["mount -t nfs 10.10.10.10:/to_share /mnt/shared"]
+
+    def test_umount(self, conn):
+        asyncio.run(AsyncMount(connection=conn).umount("/mnt/shared"))
+        conn.execute_command.assert_called_once_with("umount /mnt/shared", custom_exception=UnmountException)
+
+    def test_runs_off_event_loop(self, conn):
+        threads = []
+        conn.execute_command.side_effect = lambda *args, **kwargs: threads.append(threading.current_thread().name)
+
+        async def scenario():
+            with ThreadPoolExecutor(thread_name_prefix="async_mount_test") as executor:
+                mounter = AsyncMount(connection=conn, executor=executor)
+                await asyncio.gather(*(mounter.umount(f"/mnt/shared{i}") for i in range(4)))
+
+        asyncio.run(scenario())
+        assert len(threads) == 4
+        assert all(name.startswith("async_mount_test") for name in threads)
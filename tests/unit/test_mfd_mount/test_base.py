@@ -0,0 +1,64 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import gc
+import weakref
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_typing.os_values import OSName
+
+from mfd_mount import ESXiMount, Mount, PosixMount
+from mfd_mount.base import _connection_mount_classes
+
+
+class TestMountClassCache:
+    @pytest.fixture()
+    def conn(self, mocker):
+        conn = mocker.create_autospec(RPyCConnection)
+        conn.get_os_name.return_value = OSName.LINUX
+        return conn
+
+    def test_os_detected_once_per_connection(self, conn):
+        for _ in range(5):
+            assert isinstance(Mount(connection=conn), PosixMount)
+        conn.get_os_name.assert_called_once()
+
+    def test_refresh(self, conn):
+        assert Mount.get_mount_class(conn) is PosixMount
+        conn.get_os_name.return_value = OSName.ESXI
+        assert Mount.get_mount_class(conn) is PosixMount
+        assert Mount.get_mount_class(conn, refresh=True) is ESXiMount
+        assert isinstance(Mount(connection=conn), ESXiMount)
+        assert conn.get_os_name.call_count == 2
+
+    def test_clear_mount_class_cache(self, conn):
+        Mount(connection=conn)
+        Mount.clear_mount_class_cache(conn)
+        Mount(connection=conn)
+        Mount.clear_mount_class_cache()
+        Mount(connection=conn)
+        assert conn.get_os_name.call_count == 3
+
+    def test_cache_does_not_keep_connection_alive(self):
+        class Connection:
+            def get_os_name(self):
+                return OSName.LINUX
+
+        conn = Connection()
+        Mount(connection=conn)
+        conn_ref = weakref.ref(conn)
+        assert conn in _connection_mount_classes
+        del conn
+        gc.collect()
+        assert conn_ref() is None
+
+    def test_unhashable_connection(self):
+        class UnhashableConnection:
+            __hash__ = None
+
+            def get_os_name(self):
+                return OSName.LINUX
+
+        conn = UnhashableConnection()
+        assert Mount.get_mount_class(conn) is PosixMount
+        assert Mount.get_mount_class(conn) is PosixMount
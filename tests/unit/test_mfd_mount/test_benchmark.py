@@ -0,0 +1,94 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import json
+
+import pytest
+
+from mfd_mount.benchmark import MountBenchmarkResult, build_fio_command, parse_fio_output
+from mfd_mount.exceptions import MountException
+
+
+def fio_job(name, section, bw_kib, iops, mean_ns):
+    percentiles = {"50.000000": 100000, "90.000000": 200000, "99.000000": 400000, "99.900000": 800000}
+    stats = {"bw": bw_kib, "iops": iops, "clat_ns": {"mean": mean_ns, "percentile": percentiles}}
+    empty = {"bw": 0, "iops": 0.0, "clat_ns": {"mean": 0.0}}
+    return {
+        "jobname": name,
+        "read": stats if section == "read" else empty,
+        "write": stats if section == "write" else empty,
+    }
+
+
+FIO_OUTPUT = "fio: some warning\n" + json.dumps(
+    {
+        "fio version": "fio-3.36",
+        "jobs": [
+            fio_job("mfd_mount_write", "write", 976562, 953.67, 1048000.0),
+            fio_job("mfd_mount_randread", "read", 40000, 10000.0, 99000.0),
+        ],
+    }
+)
+
+
+class TestBenchmark:
+    def test_build_fio_command(self):
+        command = build_fio_command(
+            "/mnt/shared",
+            workloads=["write", "randread"],
+            block_size="4k",
+            file_size="1G",
+            threads=4,
+            runtime=30,
+            direct=True,
+            ioengine="psync",
+        )
+        assert command == (
+            "fio --output-format=json --directory=/mnt/shared --bs=4k --size=1G --numjobs=4 --ioengine=psync "
+            "--direct=1 --percentile_list=50:90:99:99.9 --group_reporting --unlink=1 --runtime=30 --time_based "
+            "--name=mfd_mount_write --rw=write --name=mfd_mount_randread --stonewall --rw=randread"
+        )
+
+    def test_build_fio_command_single_workload(self):
+        command = build_fio_command(
+            "/mnt/shared",
+            workloads="read",
+            block_size="1M",
+            file_size="1G",
+            threads=1,
+            runtime=None,
+            direct=False,
+            ioengine="psync",
+        )
+        assert "--direct=0" in command
+        assert "--time_based" not in command
+        assert command.endswith("--name=mfd_mount_read --rw=read")
+
+    @pytest.mark.parametrize("workloads, threads", [(["trim"], 1), ([], 1), (["read"], 0)])
+    def test_build_fio_command_incorrect(self, workloads, threads):
+        with pytest.raises(MountException):
+            build_fio_command(
+                "/mnt/shared",
+                workloads=workloads,
+                block_size="1M",
+                file_size="1G",
+                threads=threads,
+                runtime=None,
+                direct=True,
+                ioengine="psync",
+            )
+
+    def test_parse_fio_output(self):
+        results = parse_fio_output(FIO_OUTPUT)
+        assert results["write"] == MountBenchmarkResult(
+            workload="write",
+            bandwidth_mb_s=pytest.approx(1000.0, rel=1e-3),
+            iops=953.67,
+            mean_latency_us=1048.0,
+            latency_percentiles_us={50.0: 100.0, 90.0: 200.0, 99.0: 400.0, 99.9: 800.0},
+        )
+        assert results["randread"].iops == 10000.0
+        assert results["randread"].bandwidth_mb_s == pytest.approx(40.96)
+
+    def test_parse_fio_output_incorrect(self):
+        with pytest.raises(MountException):
+            parse_fio_output("fio: command not found")
@@ -0,0 +1,124 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import subprocess
+import sys
+import threading
+from textwrap import dedent
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+
+from mfd_mount import cleanup
+from mfd_mount.exceptions import UnmountException
+from mfd_mount.posix import PosixMount
+
+
+class TestCleanup:
+    @pytest.fixture(autouse=True)
+    def exit_hooks(self, mocker):
+        install = mocker.patch("mfd_mount.cleanup._install_exit_hooks")
+        yield install
+        cleanup._tracked_mounts.clear()
+
+    @pytest.fixture()
+    def conn(self, mocker):
+        conn = mocker.create_autospec(RPyCConnection)
+        conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        return conn
+
+    def test_mounts_tracked(self, conn, exit_hooks):
+        mounter = PosixMount(connection=conn, cleanup_on_exit=True)
+        handle = mounter.mount_nfs(mount_point="/mnt/a/", share_path="10.10.10.10:/a")
+        mounter.mount_tmpfs(mount_point="/mnt/tmp", share_path="tmpfs")
+        assert cleanup.get_tracked_mounts() == {mounter: ["/mnt/a", "/mnt/tmp"]}
+        exit_hooks.assert_called()
+        handle.unmount()
+        mounter.umount("/mnt/tmp")
+        assert cleanup.get_tracked_mounts() == {}
+
+    def test_mounts_not_tracked_by_default(self, conn):
+        PosixMount(connection=conn).mount_nfs(mount_point="/mnt/a", share_path="10.10.10.10:/a")
+        assert cleanup.get_tracked_mounts() == {}
+
+    def test_shared_mount_tracked_once(self, conn):
+        mounter = PosixMount(connection=conn, cleanup_on_exit=True)
+        mounter.mount_nfs(mount_point="/mnt/a", share_path="10.10.10.10:/a")
+        mounter.mount_nfs(mount_point="/mnt/a", share_path="10.10.10.10:/a")
+        assert cleanup.get_tracked_mounts() == {mounter: ["/mnt/a"]}
+
+    def test_cleanup_mounts(self, conn, mocker):
+        first = PosixMount(connection=conn, cleanup_on_exit=True)
+        second_conn = mocker.create_autospec(RPyCConnection)
+        second_conn.execute_command.side_effect = UnmountException(32, "umount")
+        second = PosixMount(connection=second_conn, cleanup_on_exit=True)
+        first.mount_nfs(mount_point="/mnt/a", share_path="10.10.10.10:/a")
+        first.mount_nfs(mount_point="/mnt/a/b", share_path="10.10.10.10:/b")
+        cleanup.track_mount(second, "/mnt/c")
+        assert cleanup.cleanup_mounts(timeout=5) == ["/mnt/c"]
+        conn.execute_command.assert_called_with("umount /mnt/a/b /mnt/a", custom_exception=UnmountException)
+        assert cleanup.get_tracked_mounts() == {}
+
+    def test_failed_umount_stays_tracked(self, conn):
+        mounter = PosixMount(connection=conn, cleanup_on_exit=True)
+        mounter.mount_nfs(mount_point="/mnt/a", share_path="10.10.10.10:/a")
+        conn.execute_command.side_effect = UnmountException(32, "umount")
+        with pytest.raises(UnmountException):
+            mounter.umount("/mnt/a")
+        assert cleanup.get_tracked_mounts() == {mounter: ["/mnt/a"]}
+        conn.execute_command.side_effect = None
+        assert cleanup.cleanup_mounts(timeout=5) == []
+        conn.execute_command.assert_called_with("umount /mnt/a", custom_exception=UnmountException)
+
+    def test_partially_failed_umount_many_keeps_mounted_tracked(self, conn):
+        mounter = PosixMount(connection=conn, cleanup_on_exit=True)
+        mounter.mount_nfs(mount_point="/mnt/a", share_path="10.10.10.10:/a")
+        mounter.mount_nfs(mount_point="/mnt/b", share_path="10.10.10.10:/b")
+        mountinfo = "40 22 0:35 / /mnt/b rw,relatime shared:20 - nfs4 10.10.10.10:/b rw\n"
+        conn.execute_command.side_effect = [
+            UnmountException(32, "umount"),
+            ConnectionCompletedProcess(args="", stdout=mountinfo, return_code=0),
+        ]
+        with pytest.raises(UnmountException):
+            mounter.umount_many(["/mnt/a", "/mnt/b"])
+        assert cleanup.get_tracked_mounts() == {mounter: ["/mnt/b"]}
+
+    def test_cleanup_deadline(self, conn):
+        release = threading.Event()
+
+        def execute_command(command, **kwargs):
+            release.wait(5)
+            return ConnectionCompletedProcess(args=command, return_code=0)
+
+        conn.execute_command.side_effect = execute_command
+        mounter = PosixMount(connection=conn, cleanup_on_exit=True)
+        cleanup.track_mount(mounter, "/mnt/a")
+        try:
+            assert cleanup.cleanup_mounts(timeout=0.1) == ["/mnt/a"]
+        finally:
+            release.set()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="SIGTERM cannot be handled on Windows")
+    def test_cleanup_on_sigterm(self, tmp_path):
+        log = tmp_path / "commands.log"
+        code = dedent(
+            f"""\
+            import os, signal, time
+            from mfd_connect.base import ConnectionCompletedProcess
+            from mfd_mount.posix import PosixMount
+
+            class Connection:
+                def execute_command(self, command, **kwargs):
+                    with open({str(log)!r}, "a") as log:
+                        log.write(command + "\\n")
+                    return ConnectionCompletedProcess(args=command, return_code=0)
+
+            mounter = PosixMount(connection=Connection(), cleanup_on_exit=True)
+            mounter.mount_nfs(mount_point="/mnt/a", share_path="10.10.10.10:/a")
+            os.kill(os.getpid(), signal.SIGTERM)
+            time.sleep(5)
+            """
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=30)
+        assert result.returncode == 128 + 15
+        assert log.read_text().splitlines() == ["mount -t nfs 10.10.10.10:/a /mnt/a", "umount /mnt/a"]
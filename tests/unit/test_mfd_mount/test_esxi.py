@@ -2,11 +2,12 @@
 # SPDX-License-Identifier: MIT
 import pytest
 from textwrap import dedent
+from unittest.mock import call
 from mfd_connect import RPyCConnection
 from mfd_connect.base import ConnectionCompletedProcess
 
 from mfd_mount.exceptions import NFSMountException, MountException, MountTypeNotSupported, UnmountException
-from mfd_mount.esxi import ESXiMount
+from mfd_mount.esxi import ESXiMount, NFSDatastore
 from mfd_mount.base import Mount
 
 from mfd_typing.os_values import OSName
@@ -60,29 +61,91 @@ class TestESXiMount:
         ):
             mount.mount_cifs(mount_point="shared", share_path="10.10.10.10/to_share")
 
-    def test_is_mounted_true(self, mount):
-        output = dedent(
-            """
-        Volume Name  Host          Share        Accessible  Mounted  Read-Only   isPE  Hardware Acceleration
-        -----------  ------------  -----------  ----------  -------  ---------  -----  ---------------------
-        nfs_mount    10.10.10.10   /mount_test        true     true      false  false  Not Supported
-        nfs_mount2   10.10.10.11   /mount_test2       true     true      false  false  Not Supported
+    NFS_LIST = dedent(
+        """\
+        Accessible,Hardware Acceleration,Host,Mounted,Read-Only,Share,Volume Name,isPE,
+        true,Not Supported,10.10.10.10,true,false,/mount_test,nfs_mount,false,
+        true,Not Supported,10.10.10.11,true,true,/mount_test2,nfs_mount2,false,
+        false,Not Supported,10.10.10.12,false,false,/mount_test3,nfs_unmounted,false,
         """
-        )
-        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
-            return_code=0, args="command", stdout=output, stderr="stderr"
+    )
+    NFS41_LIST = dedent(
+        """\
+        Accessible,Hardware Acceleration,Hosts,Mounted,Read-Only,Security,Share,Volume Name,isPE,
+        true,Not Supported,10.10.10.13,true,false,AUTH_SYS,/mount_test4,nfs41_mount,false,
+        """
+    )
+
+    @pytest.fixture()
+    def listing(self, mount):
+        def conn_stdout(command, **kwargs):
+            outputs = {
+                "esxcli --formatter=csv storage nfs list": self.NFS_LIST,
+                "esxcli --formatter=csv storage nfs41 list": self.NFS41_LIST,
+            }
+            return ConnectionCompletedProcess(args=command, stdout=outputs.get(command, ""), return_code=0)
+
+        mount._conn.execute_command.side_effect = conn_stdout
+        return mount
+
+    def test_get_datastore_inventory(self, listing):
+        inventory = listing.get_datastore_inventory()
+        assert inventory == {
+            "nfs_mount": NFSDatastore("nfs_mount", "10.10.10.10", "/mount_test", True, True, False, "3"),
+            "nfs_mount2": NFSDatastore("nfs_mount2", "10.10.10.11", "/mount_test2", True, True, True, "3"),
+            "nfs_unmounted": NFSDatastore("nfs_unmounted", "10.10.10.12", "/mount_test3", False, False, False, "3"),
+            "nfs41_mount": NFSDatastore("nfs41_mount", "10.10.10.13", "/mount_test4", True, True, False, "4.1"),
+        }
+        listing._conn.execute_command.assert_has_calls(
+            [
+                call("esxcli --formatter=csv storage nfs list", skip_logging=True),
+                call("esxcli --formatter=csv storage nfs41 list", skip_logging=True),
+            ]
         )
 
-        assert mount.is_mounted("nfs_mount") is True
-        mount._conn.execute_command.assert_called_once_with("esxcli storage nfs list")
+    def test_is_mounted_true(self, listing):
+        assert listing.is_mounted("nfs_mount") is True
+        assert listing.is_mounted("nfs41_mount") is True
+        assert listing._conn.execute_command.call_count == 2
 
-    def test_is_mounted_false(self, mount):
-        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
-            return_code=0, args="command", stdout="", stderr="stderr"
-        )
+    def test_is_mounted_false(self, listing):
+        assert listing.is_mounted("nfs_unmounted") is False
+        assert listing.is_mounted("nfs") is False
+        assert listing.is_mounted("nfs_mount3") is False
+        assert listing._conn.execute_command.call_count == 2
 
+    def test_is_mounted_empty_listing(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(return_code=0, args="", stdout="")
         assert mount.is_mounted("nfs_mount") is False
-        mount._conn.execute_command.assert_called_once_with("esxcli storage nfs list")
+
+    def test_inventory_invalidated_on_mount_and_umount(self, listing):
+        listing.is_mounted("nfs_mount")
+        listing.mount_nfs(mount_point="shared", share_path="10.10.10.10:/to_share")
+        listing.is_mounted("nfs_mount")
+        listing.umount(mount_point="shared")
+        listing.is_mounted("nfs_mount")
+        assert listing._conn.execute_command.call_count == 8
+
+    def test_inventory_expired(self, mocker, listing):
+        monotonic = mocker.patch("mfd_mount.esxi.time.monotonic", return_value=100.0)
+        listing.is_mounted("nfs_mount")
+        monotonic.return_value = 100.0 + listing.inventory_ttl
+        listing.is_mounted("nfs_mount")
+        assert listing._conn.execute_command.call_count == 4
+
+    def test_inventory_shared_by_connection(self, listing):
+        listing.is_mounted("nfs_mount")
+        ESXiMount(connection=listing._conn).is_mounted("nfs_mount")
+        assert listing._conn.execute_command.call_count == 2
+
+    def test_are_mounted(self, listing):
+        assert listing.are_mounted(["nfs_mount", "nfs41_mount", "nfs_unmounted", "nfs_mount3"]) == {
+            "nfs_mount": True,
+            "nfs41_mount": True,
+            "nfs_unmounted": False,
+            "nfs_mount3": False,
+        }
+        assert listing._conn.execute_command.call_count == 2
 
     def test_umount_failure(self, mount):
         output = "Error performing operation: NFS Error: Unable to Unmount filesystem: Busy."
@@ -96,3 +159,16 @@ class TestESXiMount:
         mount._conn.execute_command.assert_called_once_with(
             "esxcli storage nfs remove -v Shared", custom_exception=UnmountException
         )
+
+    def test_umount_many(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        mount.umount_many(["Shared", "Other"])
+        mount._conn.execute_command.assert_called_once_with(
+            'rc=0; for volume in Shared Other; do esxcli storage nfs remove -v "$volume" || rc=$?; done; exit $rc',
+            shell=True,
+            custom_exception=UnmountException,
+        )
+
+    def test_umount_lazy_not_supported(self, mount):
+        with pytest.raises(MountException):
+            mount.umount(mount_point="Shared", lazy=True)
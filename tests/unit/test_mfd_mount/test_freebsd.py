@@ -83,3 +83,31 @@ class TestFreeBSDMount:
                 custom_exception=CIFSMountException,
             )
         assert mount._conn.execute_command.call_count == 3
+
+    def test_is_mounted(self, mount):
+        output = "/dev/ada0p2\t/\tufs\trw\t1 1\n//FOO@10.10.10.10/TO_SHARE\t/mnt/shared\tsmbfs\trw\t0 0\n"
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", stdout=output, return_code=0)
+        assert mount.is_mounted("/mnt/shared") is True
+        assert mount.is_mounted("/mnt/other") is False
+        mount._conn.execute_command.assert_called_once_with("mount -p", skip_logging=True)
+
+    def test_are_mounted(self, mount):
+        output = "/dev/ada0p2\t/\tufs\trw\t1 1\n//FOO@10.10.10.10/TO_SHARE\t/mnt/shared\tsmbfs\trw\t0 0\n"
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", stdout=output, return_code=0)
+        assert mount.are_mounted(["/mnt/shared", "/mnt/other"]) == {"/mnt/shared": True, "/mnt/other": False}
+        mount._conn.execute_command.assert_called_once_with("mount -p", skip_logging=True)
+
+    def test_mount_cifs_and_verify(self, mount):
+        mount.verify_mounts = True
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="MFD_MOUNT_STATUS mounted 0\n", return_code=0
+        )
+        mount.mount_cifs(mount_point="/mnt/shared", share_path="10.10.10.10/to_share", username="foo")
+        script = mount._conn.execute_command.call_args.args[0]
+        assert "mount_smbfs -I 10.10.10.10 //foo@10.10.10.10/to_share /mnt/shared ||" in script
+        assert "mount -p | awk '{print $2}' | grep -qxF -- /mnt/shared ||" in script
+
+    def test_umount_lazy_not_supported(self, mount):
+        with pytest.raises(MountException):
+            mount.umount_many(["/mnt/a"], lazy=True)
+        mount._conn.execute_command.assert_not_called()
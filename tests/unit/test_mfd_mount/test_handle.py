@@ -0,0 +1,52 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+
+from mfd_mount import MountHandle, PosixMount
+from mfd_mount.exceptions import UnmountException
+
+
+class TestMountHandle:
+    @pytest.fixture()
+    def mount(self, mocker):
+        mount = PosixMount(connection=mocker.create_autospec(RPyCConnection))
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        return mount
+
+    def test_mount_returns_handle(self, mount):
+        handle = mount.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        assert type(handle) is MountHandle
+        assert handle.mounter is mount
+        assert handle.mount_point == "/mnt/shared"
+        assert handle.duration >= 0
+        assert handle.mounted_at > 0
+        with pytest.raises(TypeError):
+            vars(handle)
+
+    def test_no_class_created_per_call(self, mount):
+        handles = [
+            mount.mount_nfs(mount_point=f"/mnt/shared{i}", share_path="10.10.10.10:/to_share") for i in range(3)
+        ]
+        assert {type(handle) for handle in handles} == {MountHandle}
+
+    def test_context_manager(self, mount):
+        with mount.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share") as handle:
+            assert handle.mount_point == "/mnt/shared"
+        mount._conn.execute_command.assert_called_with("umount /mnt/shared", custom_exception=UnmountException)
+
+    def test_unmount(self, mount):
+        handle = mount.mount_tmpfs(mount_point="/mnt/shared", share_path="tmpfs")
+        handle.unmount()
+        mount._conn.execute_command.assert_called_with("umount /mnt/shared", custom_exception=UnmountException)
+
+    def test_mounter_attributes(self, mount):
+        handle = mount.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        assert handle._conn is mount._conn
+        handle.umount("/mnt/other")
+        mount._conn.execute_command.assert_called_with("umount /mnt/other", custom_exception=UnmountException)
+
+    def test_preserves_method_metadata(self):
+        assert PosixMount.mount_nfs.__name__ == "mount_nfs"
+        assert "Mount NFS share." in PosixMount.mount_nfs.__doc__
@@ -0,0 +1,127 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import subprocess
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+
+from mfd_mount.exceptions import HUGETLBFSMountException, HugepageReservationException, MountException
+from mfd_mount.hugepages import (
+    HugepageReservation,
+    build_reservation_script,
+    get_hugepages_directory,
+    parse_reservation,
+)
+from mfd_mount.options import HUGETLBFSOptions
+from mfd_mount.posix import PosixMount
+
+
+class TestReservationScript:
+    """Run reservation script against fake sysfs."""
+
+    @pytest.fixture()
+    def sysfs(self, mocker, tmp_path):
+        mocker.patch("mfd_mount.hugepages.HUGEPAGES_SYSFS", str(tmp_path))
+        pool = tmp_path / "hugepages-2048kB"
+        pool.mkdir()
+        return pool
+
+    def _pool(self, pool, nr, free, resv=0):
+        (pool / "nr_hugepages").write_text(f"{nr}\n")
+        (pool / "free_hugepages").write_text(f"{free}\n")
+        (pool / "resv_hugepages").write_text(f"{resv}\n")
+
+    def _reserve(self, count, page_size="2M"):
+        script = build_reservation_script(count, page_size)
+        output = subprocess.run(["sh", "-c", script], capture_output=True, text=True).stdout
+        return parse_reservation(output, count, page_size)
+
+    def test_pool_grown_by_missing_free_pages(self, sysfs):
+        self._pool(sysfs, nr=10, free=2)
+        self._reserve(6)
+        assert (sysfs / "nr_hugepages").read_text().strip() == "14"
+
+    def test_pool_not_shrunk(self, sysfs):
+        self._pool(sysfs, nr=10, free=8)
+        reservation = self._reserve(4)
+        assert (sysfs / "nr_hugepages").read_text().strip() == "10"
+        assert reservation == HugepageReservation(2097152, None, 4, 10, 8)
+        assert reservation.satisfied
+
+    def test_reserved_pages_not_free(self, sysfs):
+        self._pool(sysfs, nr=10, free=8, resv=6)
+        reservation = self._reserve(4)
+        assert (sysfs / "nr_hugepages").read_text().strip() == "12"
+        assert reservation == HugepageReservation(2097152, None, 4, 12, 2)
+
+    def test_missing_pool(self, sysfs):
+        with pytest.raises(MountException):
+            self._reserve(1, page_size="1G")
+
+
+class TestHugepages:
+    def test_get_hugepages_directory(self):
+        assert get_hugepages_directory("1G") == "/sys/kernel/mm/hugepages/hugepages-1048576kB"
+        assert get_hugepages_directory(2097152, node=1) == "/sys/devices/system/node/node1/hugepages/hugepages-2048kB"
+
+    @pytest.mark.parametrize("count", [-1, 1.5, True])
+    def test_invalid_count(self, count):
+        with pytest.raises(MountException):
+            build_reservation_script(count, "2M")
+
+    def test_unparsable_output(self):
+        with pytest.raises(MountException):
+            parse_reservation("sh: permission denied", 1, "2M")
+
+
+class TestPosixMountHugepages:
+    @pytest.fixture()
+    def mounter(self, mocker):
+        mounter = PosixMount(connection=mocker.create_autospec(RPyCConnection))
+        yield mounter
+        mounter.forget_shared_mounts()
+
+    def test_reserve_hugepages(self, mounter):
+        mounter._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="MFD_HUGEPAGES 512 512\n", return_code=0
+        )
+        reservation = mounter.reserve_hugepages(512, node=0)
+        assert reservation == HugepageReservation(2097152, 0, 512, 512, 512)
+        assert "/sys/devices/system/node/node0/hugepages/hugepages-2048kB" in (
+            mounter._conn.execute_command.call_args.args[0]
+        )
+
+    def test_reserve_hugepages_not_satisfied(self, mounter):
+        mounter._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="MFD_HUGEPAGES 100 100\n", return_code=0
+        )
+        with pytest.raises(HugepageReservationException):
+            mounter.reserve_hugepages(512)
+        assert mounter.reserve_hugepages(512, strict=False).free == 100
+
+    def test_mount_hugetlbfs_with_reservation(self, mounter):
+        mounter._conn.execute_command.side_effect = [
+            ConnectionCompletedProcess(args="", stdout="MFD_HUGEPAGES 8 8\n", return_code=0),
+            ConnectionCompletedProcess(args="", return_code=0),
+        ]
+        mounter.mount_hugetlbfs(
+            mount_point="/mnt/huge",
+            share_path="nodev",
+            options=HUGETLBFSOptions(pagesize="1G", size="8G", min_size="8G"),
+            reserve=8,
+        )
+        reserve_call, mount_call = mounter._conn.execute_command.call_args_list
+        assert "hugepages-1048576kB" in reserve_call.args[0]
+        assert mount_call.args[0] == "mount -t hugetlbfs -o pagesize=1G,size=8G,min_size=8G nodev /mnt/huge"
+        assert mount_call.kwargs["custom_exception"] is HUGETLBFSMountException
+
+    def test_mount_hugetlbfs_empty_reserve_nodes(self, mounter):
+        with pytest.raises(MountException):
+            mounter.mount_hugetlbfs(mount_point="/mnt/huge", share_path="nodev", reserve=8, reserve_nodes=[])
+        mounter._conn.execute_command.assert_not_called()
+
+    def test_mount_hugetlbfs_reserve_nodes_without_reserve(self, mounter):
+        with pytest.raises(MountException, match="reserve_nodes requires reserve"):
+            mounter.mount_hugetlbfs(mount_point="/mnt/huge", share_path="nodev", reserve_nodes=[0])
+        mounter._conn.execute_command.assert_not_called()
@@ -0,0 +1,42 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import subprocess
+import sys
+
+import pytest
+
+import mfd_mount
+
+PLATFORM_MODULES = [
+    "mfd_mount.posix",
+    "mfd_mount.windows",
+    "mfd_mount.esxi",
+    "mfd_mount.freebsd",
+    "mfd_typing",
+    "mfd_common_libs",
+]
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+
+class TestImport:
+    def test_platform_modules_not_imported(self):
+        code = f"import sys, mfd_mount; print([m for m in {PLATFORM_MODULES!r} if m in sys.modules])"
+        assert _run_python(code).stdout.strip() == "[]"
+
+    def test_platform_module_imported_on_access(self):
+        code = (
+            f"import sys, mfd_mount; mfd_mount.ESXiMount; print([m for m in {PLATFORM_MODULES!r} if m in sys.modules])"
+        )
+        assert _run_python(code).stdout.strip() == "['mfd_mount.esxi']"
+
+    @pytest.mark.parametrize("name", mfd_mount.__all__)
+    def test_lazy_attributes(self, name):
+        assert getattr(mfd_mount, name).__name__ == name
+        assert name in dir(mfd_mount)
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            mfd_mount.NotExistingMount
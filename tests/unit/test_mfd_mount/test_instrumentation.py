@@ -0,0 +1,99 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing.os_values import OSName
+
+from mfd_mount import Mount
+from mfd_mount.esxi import ESXiMount
+from mfd_mount.exceptions import NFSMountException, UnmountException
+from mfd_mount.instrumentation import MountEvent
+from mfd_mount.posix import PosixMount
+from mfd_mount.windows import WindowsMount
+
+
+class TestInstrumentation:
+    @pytest.fixture()
+    def events(self):
+        events = []
+        Mount.add_observer(events.append)
+        yield events
+        Mount.remove_observer(events.append)
+
+    @pytest.fixture()
+    def conn(self, mocker):
+        conn = mocker.create_autospec(RPyCConnection)
+        conn.execute_command.return_value = ConnectionCompletedProcess(args="", stdout="", return_code=0)
+        return conn
+
+    def test_mount_event(self, conn, events):
+        PosixMount(connection=conn).mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        assert len(events) == 1
+        event = events[0]
+        assert isinstance(event, MountEvent)
+        assert event.operation == "mount"
+        assert event.fs_type == "nfs"
+        assert event.server == "10.10.10.10"
+        assert event.mount_point == "/mnt/shared"
+        assert event.command == "mount -t nfs 10.10.10.10:/to_share /mnt/shared"
+        assert event.return_code == 0
+        assert event.exception is None
+        assert event.duration >= 0
+
+    def test_failed_mount_event(self, conn, events):
+        conn.execute_command.side_effect = NFSMountException(32, "mount")
+        with pytest.raises(NFSMountException):
+            PosixMount(connection=conn).mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        assert events[0].return_code == 32
+        assert events[0].exception is NFSMountException
+
+    def test_password_masked(self, conn, events):
+        PosixMount(connection=conn).mount_sshfs(
+            mount_point="/mnt/shared", share_path="10.10.10.10:/to_share", username="root", password="secret"
+        )
+        assert events[0].fs_type == "sshfs"
+        assert "secret" not in events[0].command
+        assert events[0].command.endswith("/mnt/shared <<<'*****'")
+
+    def test_is_mounted_and_umount_events(self, conn, events):
+        mounter = PosixMount(connection=conn, mount_table_ttl=0)
+        mounter.is_mounted("/mnt/shared")
+        mounter.umount("/mnt/shared")
+        assert [(event.operation, event.mount_point, event.command) for event in events] == [
+            ("is_mounted", "/mnt/shared", "cat /proc/self/mountinfo"),
+            ("umount", "/mnt/shared", "umount /mnt/shared"),
+        ]
+        assert events[1].server is None
+
+    def test_context_manager_events(self, conn, events):
+        with PosixMount(connection=conn).mount_tmpfs(mount_point="/mnt/tmp", share_path="tmpfs"):
+            pass
+        assert [(event.operation, event.fs_type) for event in events] == [("mount", "tmpfs"), ("umount", None)]
+
+    def test_windows_and_esxi_events(self, conn, events):
+        conn.get_os_name.return_value = OSName.WINDOWS
+        WindowsMount(connection=conn).mount_nfs(mount_point="Z:", share_path="10.10.10.10:/to_share")
+        conn.execute_command.side_effect = UnmountException(1, "esxcli")
+        with pytest.raises(UnmountException):
+            ESXiMount(connection=conn).umount("datastore")
+        assert [(event.operation, event.fs_type, event.exception) for event in events] == [
+            ("mount", "nfs", None),
+            ("umount", None, UnmountException),
+        ]
+
+    def test_failing_observer_ignored(self, conn, events):
+        def failing(event):
+            raise RuntimeError
+
+        Mount.add_observer(failing)
+        try:
+            PosixMount(connection=conn).umount("/mnt/shared")
+        finally:
+            Mount.remove_observer(failing)
+        assert len(events) == 1
+
+    def test_no_events_without_observer(self, conn, mocker):
+        notify = mocker.patch("mfd_mount.instrumentation._notify")
+        PosixMount(connection=conn).umount("/mnt/shared")
+        notify.assert_not_called()
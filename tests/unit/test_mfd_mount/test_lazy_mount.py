@@ -0,0 +1,71 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import os
+from pathlib import Path
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+
+from mfd_mount import LazyMount
+from mfd_mount.exceptions import NFSMountException
+from mfd_mount.posix import PosixMount
+
+
+class TestLazyMount:
+    @pytest.fixture()
+    def conn(self, mocker):
+        conn = mocker.create_autospec(RPyCConnection)
+        conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        return conn
+
+    @pytest.fixture()
+    def mounter(self, conn):
+        mounter = PosixMount(connection=conn)
+        yield mounter
+        mounter.forget_shared_mounts()
+
+    @staticmethod
+    def _commands(conn):
+        return [call.args[0] for call in conn.execute_command.call_args_list]
+
+    def test_never_accessed(self, conn, mounter):
+        with mounter.lazy_mounts().mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share") as share:
+            assert isinstance(share, LazyMount)
+            assert share.mount_point == "/mnt/shared"
+            assert not share.mounted
+        conn.execute_command.assert_not_called()
+
+    def test_mounted_on_first_access(self, conn, mounter):
+        with mounter.lazy_mounts().mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share") as share:
+            assert share / "file.txt" == Path("/mnt/shared/file.txt")
+            assert os.fspath(share) == str(Path("/mnt/shared"))
+            assert share.path == Path("/mnt/shared")
+            assert share.mounted
+        assert self._commands(conn) == ["mount -t nfs 10.10.10.10:/to_share /mnt/shared", "umount /mnt/shared"]
+
+    def test_ensure(self, conn, mounter):
+        share = mounter.lazy_mounts().mount_tmpfs(mount_point="/mnt/tmp", share_path="tmpfs")
+        handle = share.ensure()
+        assert share.ensure() is handle
+        assert handle.mount_point == "/mnt/tmp"
+        share.unmount()
+        share.unmount()
+        assert self._commands(conn) == ["mount -t tmpfs tmpfs /mnt/tmp", "umount /mnt/tmp"]
+
+    def test_failed_mount_retried_on_next_access(self, conn, mounter):
+        conn.execute_command.side_effect = [NFSMountException(32, "mount"), conn.execute_command.return_value]
+        share = mounter.lazy_mounts().mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        with pytest.raises(NFSMountException):
+            share.ensure()
+        assert not share.mounted
+        share.ensure()
+        assert share.mounted
+
+    def test_invalid_parameters(self, mounter):
+        with pytest.raises(TypeError):
+            mounter.lazy_mounts().mount_nfs(mount_point="/mnt/shared", share="10.10.10.10:/to_share")
+
+    def test_not_mount_method(self, mounter):
+        with pytest.raises(AttributeError):
+            mounter.lazy_mounts().umount
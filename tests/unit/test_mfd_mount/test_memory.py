@@ -0,0 +1,47 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+from textwrap import dedent
+
+import pytest
+
+from mfd_mount.exceptions import MountException
+from mfd_mount.memory import parse_meminfo, plan_tmpfs_options
+
+MEMINFO = dedent(
+    """\
+    MemTotal:       16318644 kB
+    MemFree:         8124436 kB
+    MemAvailable:   10485760 kB
+    HugePages_Total:       0
+    Hugepagesize:       2048 kB
+    """
+)
+
+
+class TestMemory:
+    def test_parse_meminfo(self):
+        meminfo = parse_meminfo(MEMINFO)
+        assert meminfo["MemAvailable"] == 10 * 1024**3
+        assert meminfo["HugePages_Total"] == 0
+        assert meminfo["Hugepagesize"] == 2 * 1024**2
+
+    def test_plan_tmpfs_options(self):
+        options = plan_tmpfs_options(parse_meminfo(MEMINFO), percent=33, mode="1777")
+        assert options.size == 3542089728  # 33% of 10 GiB rounded down to 2 MiB
+        assert options.size % (2 * 1024**2) == 0
+        assert options.huge == "within_size"
+        assert options.mode == "1777"
+
+    def test_plan_without_huge_pages(self):
+        options = plan_tmpfs_options(parse_meminfo(MEMINFO), percent=33, huge=None)
+        assert options.size == 3543138304  # rounded down to MiB
+        assert options.huge is None
+
+    @pytest.mark.parametrize("percent", [0, 91])
+    def test_plan_percent_out_of_range(self, percent):
+        with pytest.raises(MountException):
+            plan_tmpfs_options(parse_meminfo(MEMINFO), percent=percent)
+
+    def test_plan_low_memory(self):
+        with pytest.raises(MountException):
+            plan_tmpfs_options({"MemAvailable": 1024 * 1024})
@@ -0,0 +1,69 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+from textwrap import dedent
+
+import pytest
+
+from mfd_mount.mount_table import MountTable, MountTableEntry, escape_mount_point, normalize_mount_point
+
+
+class TestMountTable:
+    def test_from_mountinfo(self):
+        output = dedent(
+            """\
+            22 1 8:1 / / rw,relatime shared:1 - ext4 /dev/sda1 rw
+            40 22 0:35 / /mnt/shared rw,relatime shared:20 master:3 - nfs4 10.10.10.10:/to_share rw,vers=4.2
+            41 22 0:36 / /mnt/with\\040space rw,relatime - cifs //10.10.10.10/to_share rw
+            malformed line
+            """
+        )
+        table = MountTable.from_mountinfo(output)
+        assert len(table) == 3
+        assert table.get("/mnt/shared") == MountTableEntry(
+            source="10.10.10.10:/to_share", mount_point="/mnt/shared", fs_type="nfs4", options="rw,relatime"
+        )
+        assert table.get("/mnt/with space").fs_type == "cifs"
+        assert "/" in table
+        assert "/mnt" not in table
+
+    def test_from_mountinfo_stacked_mounts(self):
+        output = dedent(
+            """\
+            40 22 0:35 / /mnt/shared rw - nfs 10.10.10.10:/first rw
+            41 40 0:36 / /mnt/shared rw - nfs 10.10.10.10:/second rw
+            """
+        )
+        assert MountTable.from_mountinfo(output).get("/mnt/shared").source == "10.10.10.10:/second"
+
+    def test_from_fstab(self):
+        output = dedent(
+            """\
+            /dev/ada0p2\t/\tufs\trw\t1 1
+            //FOO@10.10.10.10/TO_SHARE\t/mnt/shared\tsmbfs\trw\t0 0
+            devfs\t/dev\tdevfs\trw,multilabel\t0 0
+            """
+        )
+        table = MountTable.from_fstab(output)
+        assert len(table) == 3
+        assert table.get("/mnt/shared").fs_type == "smbfs"
+        assert "/mnt/shared/" in table
+
+    def test_is_expired(self, mocker):
+        monotonic = mocker.patch("mfd_mount.mount_table.time.monotonic", return_value=10.0)
+        table = MountTable([])
+        assert table.is_expired(5) is False
+        monotonic.return_value = 15.0
+        assert table.is_expired(5) is True
+        assert table.is_expired(0) is True
+
+    @pytest.mark.parametrize(
+        "mount_point, expected", [("/mnt/shared/", "/mnt/shared"), ("/", "/"), ("//", "/"), ("relative", "relative")]
+    )
+    def test_normalize_mount_point(self, mount_point, expected):
+        assert normalize_mount_point(mount_point) == expected
+
+    @pytest.mark.parametrize(
+        "mount_point, expected", [("/mnt/shared/", "/mnt/shared"), ("/mnt/a b", "/mnt/a\\040b"), ("/a\\b", "/a\\134b")]
+    )
+    def test_escape_mount_point(self, mount_point, expected):
+        assert escape_mount_point(mount_point) == expected
@@ -0,0 +1,132 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+
+from mfd_mount.exceptions import MountException
+from mfd_mount.numa import (
+    NumaNode,
+    build_mpol,
+    format_nodelist,
+    get_cpu_nodes,
+    parse_cpulist,
+    parse_numa_topology,
+)
+from mfd_mount.posix import PosixMount
+
+TOPOLOGY_OUTPUT = (
+    "MFD_NUMA_NODE 0 0-3,8-11 16777216 8388608\n"
+    "MFD_NUMA_NODE 1 4-7,12-15 16777216 4194304\n"
+    "MFD_NUMA_NODE 2 1048576 1048576\n"
+)
+
+
+class TestNuma:
+    def test_parse_cpulist(self):
+        assert parse_cpulist("0-2,8,10-11\n") == [0, 1, 2, 8, 10, 11]
+        assert parse_cpulist("") == []
+        with pytest.raises(MountException):
+            parse_cpulist("0-a")
+
+    def test_format_nodelist(self):
+        assert format_nodelist([3, 0, 1]) == "0-1,3"
+        assert format_nodelist([1]) == "1"
+
+    def test_parse_numa_topology(self):
+        topology = parse_numa_topology(TOPOLOGY_OUTPUT)
+        assert topology[0] == NumaNode(0, [0, 1, 2, 3, 8, 9, 10, 11], 16 * 1024**3, 8 * 1024**3)
+        assert topology[2] == NumaNode(2, [], 1024**3, 1024**3)
+
+    def test_get_cpu_nodes(self):
+        topology = parse_numa_topology(TOPOLOGY_OUTPUT)
+        assert get_cpu_nodes(topology, [1, 2]) == [0]
+        assert get_cpu_nodes(topology, [3, 4]) == [0, 1]
+        with pytest.raises(MountException):
+            get_cpu_nodes(topology, [64])
+
+    def test_build_mpol(self):
+        assert build_mpol("interleave", [0, 1]) == "interleave:0-1"
+        with pytest.raises(MountException):
+            build_mpol("local", [0])
+
+
+class TestPosixMountNuma:
+    @pytest.fixture()
+    def mounter(self, mocker):
+        mounter = PosixMount(connection=mocker.create_autospec(RPyCConnection))
+        yield mounter
+        mounter.forget_shared_mounts()
+
+    @staticmethod
+    def _result(stdout=""):
+        return ConnectionCompletedProcess(args="", stdout=stdout, return_code=0)
+
+    def test_local_nodes_of_interface(self, mounter):
+        mounter._conn.execute_command.return_value = self._result("1\n")
+        assert mounter.get_local_numa_nodes(interface="eth0") == [1]
+        mounter._conn.execute_command.assert_called_once_with(
+            "cat /sys/class/net/eth0/device/numa_node", skip_logging=True
+        )
+
+    def test_interface_without_affinity(self, mounter):
+        mounter._conn.execute_command.side_effect = [self._result("-1\n"), self._result(TOPOLOGY_OUTPUT)]
+        assert mounter.get_local_numa_nodes(interface="eth0") == [0, 1, 2]
+
+    def test_interface_numa_node_not_parsable(self, mounter):
+        mounter._conn.execute_command.return_value = self._result("cat: numa_node: No such file\n")
+        with pytest.raises(MountException):
+            mounter.get_local_numa_nodes(interface="eth0")
+
+    def test_mount_local_tmpfs_interface_without_affinity(self, mounter):
+        mounter._conn.execute_command.side_effect = [
+            self._result(TOPOLOGY_OUTPUT),
+            self._result("-1\n"),
+            self._result(),
+        ]
+        mounter.mount_local_scratch(mount_point="/mnt/scratch", interface="eth0", percent=50)
+        assert mounter._conn.execute_command.call_args.args[0] == (
+            "mount -t tmpfs -o size=6979321856,huge=within_size,mpol=bind:0-2 tmpfs /mnt/scratch"
+        )
+
+    def test_mount_local_scratch_without_numa(self, mounter):
+        mounter._conn.execute_command.side_effect = [
+            self._result("-1\n"),
+            self._result(""),
+            self._result("MFD_HUGEPAGES 512 512\n"),
+            self._result(),
+        ]
+        mounter.mount_local_scratch(mount_point="/mnt/huge", interface="eth0", hugepages=512)
+        _, _, reserve_call, mount_call = mounter._conn.execute_command.call_args_list
+        assert "/sys/kernel/mm/hugepages/hugepages-2048kB" in reserve_call.args[0]
+        assert mount_call.args[0] == "mount -t hugetlbfs -o pagesize=2M,size=1073741824 nodev /mnt/huge"
+
+    def test_local_nodes_require_single_source(self, mounter):
+        with pytest.raises(MountException):
+            mounter.get_local_numa_nodes()
+        with pytest.raises(MountException):
+            mounter.get_local_numa_nodes(interface="eth0", cpus=[0])
+
+    def test_mount_local_tmpfs(self, mounter):
+        mounter._conn.execute_command.side_effect = [self._result(TOPOLOGY_OUTPUT), self._result()]
+        mounter.mount_local_scratch(mount_point="/mnt/scratch", cpus=[4, 5], percent=50)
+        assert mounter._conn.execute_command.call_count == 2
+        assert mounter._conn.execute_command.call_args.args[0] == (
+            "mount -t tmpfs -o size=2147483648,huge=within_size,mpol=bind:1 tmpfs /mnt/scratch"
+        )
+
+    def test_mount_local_hugetlbfs(self, mounter):
+        mounter._conn.execute_command.side_effect = [
+            self._result("0\n"),
+            self._result("MFD_HUGEPAGES 512 512\n"),
+            self._result(),
+        ]
+        mounter.mount_local_scratch(mount_point="/mnt/huge", interface="eth0", hugepages=512)
+        _, reserve_call, mount_call = mounter._conn.execute_command.call_args_list
+        assert "/sys/devices/system/node/node0/hugepages/hugepages-2048kB" in reserve_call.args[0]
+        assert mount_call.args[0] == "mount -t hugetlbfs -o pagesize=2M,size=1073741824 nodev /mnt/huge"
+
+    def test_preferred_policy_single_node(self, mounter):
+        mounter._conn.execute_command.return_value = self._result(TOPOLOGY_OUTPUT)
+        with pytest.raises(MountException):
+            mounter.mount_local_scratch(mount_point="/mnt/scratch", cpus=[0, 4], policy="preferred")
@@ -0,0 +1,153 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_mount.exceptions import MountException
+from mfd_mount.options import CIFSOptions, HUGETLBFSOptions, NFSOptions, TMPFSOptions, parse_page_size
+
+
+class TestNFSOptions:
+    def test_to_mount_options(self):
+        options = NFSOptions(
+            version="4.1", nconnect=8, rsize=1048576, wsize=524288, proto="tcp", actimeo=30, hard=True, timeo=600
+        )
+        assert options.to_mount_options() == [
+            "vers=4.1",
+            "proto=tcp",
+            "nconnect=8",
+            "rsize=1048576",
+            "wsize=524288",
+            "timeo=600",
+            "actimeo=30",
+            "hard",
+        ]
+
+    def test_to_mount_options_empty(self):
+        assert NFSOptions().to_mount_options() == []
+
+    def test_soft(self):
+        assert NFSOptions(hard=False).to_mount_options() == ["soft"]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"version": "5"},
+            {"proto": "sctp"},
+            {"nconnect": 0},
+            {"nconnect": 17},
+            {"nconnect": "8"},
+            {"nconnect": True},
+            {"rsize": 1024},
+            {"wsize": 2 * 1048576},
+            {"rsize": 1048575},
+            {"actimeo": -1},
+            {"timeo": 0},
+            {"version": "4.2", "proto": "udp"},
+            {"proto": "udp6", "version": "4"},
+        ],
+    )
+    def test_validation(self, kwargs):
+        with pytest.raises(MountException):
+            NFSOptions(**kwargs)
+
+    def test_udp_nfsv3(self):
+        assert NFSOptions(version="3", proto="udp").to_mount_options() == ["vers=3", "proto=udp"]
+
+
+class TestCIFSOptions:
+    def test_to_mount_options(self):
+        options = CIFSOptions(
+            vers="3.1.1",
+            multichannel=True,
+            max_channels=4,
+            cache="loose",
+            rsize=4194304,
+            wsize=4194304,
+            actimeo=1,
+            nosharesock=True,
+        )
+        assert options.to_mount_options() == [
+            "vers=3.1.1",
+            "multichannel",
+            "max_channels=4",
+            "cache=loose",
+            "rsize=4194304",
+            "wsize=4194304",
+            "actimeo=1",
+            "nosharesock",
+        ]
+
+    def test_to_mount_options_empty(self):
+        assert CIFSOptions().to_mount_options() == []
+
+    def test_nomultichannel(self):
+        assert CIFSOptions(vers="2.1", multichannel=False).to_mount_options() == ["vers=2.1", "nomultichannel"]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"vers": "4"},
+            {"cache": "writeback"},
+            {"max_channels": 2},
+            {"multichannel": True, "max_channels": 0},
+            {"multichannel": True, "max_channels": 17},
+            {"multichannel": True, "vers": "2.1"},
+            {"rsize": 1024},
+            {"wsize": 32 * 1048576},
+            {"actimeo": -1},
+        ],
+    )
+    def test_validation(self, kwargs):
+        with pytest.raises(MountException):
+            CIFSOptions(**kwargs)
+
+
+class TestTMPFSOptions:
+    def test_to_mount_options(self):
+        options = TMPFSOptions(size="50%", nr_inodes="1m", mode="1777", huge="within_size", mpol="interleave:0-1")
+        assert options.to_mount_options() == [
+            "size=50%",
+            "nr_inodes=1m",
+            "mode=1777",
+            "huge=within_size",
+            "mpol=interleave:0-1",
+        ]
+
+    def test_size_in_bytes(self):
+        assert TMPFSOptions(size=1073741824).to_mount_options() == ["size=1073741824"]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"size": "4x"},
+            {"size": -1},
+            {"nr_inodes": "many"},
+            {"mode": "0999"},
+            {"mode": 1777},
+            {"huge": "deny"},
+            {"mpol": "bind"},
+            {"mpol": "prefer:0-1"},
+        ],
+    )
+    def test_validation(self, kwargs):
+        with pytest.raises(MountException):
+            TMPFSOptions(**kwargs)
+
+
+class TestHUGETLBFSOptions:
+    def test_to_mount_options(self):
+        options = HUGETLBFSOptions(pagesize="1G", size="8G", min_size="50%", nr_inodes=64, mode="1770")
+        assert options.to_mount_options() == ["pagesize=1G", "size=8G", "min_size=50%", "nr_inodes=64", "mode=1770"]
+
+    @pytest.mark.parametrize(
+        "page_size, expected", [("2M", 2097152), ("1g", 1073741824), ("2048kB", 2097152), (4096, 4096)]
+    )
+    def test_parse_page_size(self, page_size, expected):
+        assert parse_page_size(page_size) == expected
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"pagesize": "3M"}, {"pagesize": "huge"}, {"size": "8X"}, {"min_size": -1}, {"mode": "rwx"}]
+    )
+    def test_validation(self, kwargs):
+        with pytest.raises(MountException):
+            HUGETLBFSOptions(**kwargs)
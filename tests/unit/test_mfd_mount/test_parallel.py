@@ -0,0 +1,107 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import threading
+import time
+from collections import defaultdict
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+
+from mfd_mount import MountSpec, PosixMount
+from mfd_mount.exceptions import MountException, NFSMountException
+
+
+class TestMountMany:
+    @pytest.fixture()
+    def mount(self, mocker):
+        return PosixMount(connection=mocker.create_autospec(RPyCConnection))
+
+    def test_mount_many(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        specs = [
+            MountSpec("nfs", mount_point="/mnt/a", share_path="10.10.10.10:/a"),
+            MountSpec("cifs", mount_point="/mnt/b", share_path="//10.10.10.11/b", options={"username": "admin"}),
+            MountSpec("tmpfs", mount_point="/mnt/c", share_path="tmpfs", options={"params": "-o size=1G"}),
+        ]
+        results = mount.mount_many(specs)
+        assert [result.spec for result in results] == specs
+        assert all(result.succeeded for result in results)
+        assert all(result.duration >= 0 and result.wait_time >= 0 for result in results)
+        commands = {c.args[0] for c in mount._conn.execute_command.call_args_list}
+        assert commands == {
+            "mount -t nfs 10.10.10.10:/a /mnt/a",
+            "mount -t cifs -o username=admin //10.10.10.11/b /mnt/b",
+            "mount -t tmpfs -o size=1G tmpfs /mnt/c",
+        }
+
+    def test_mount_many_handle_releases_shared_mount(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        handle = mount.mount_nfs(mount_point="/mnt/a", share_path="10.10.10.10:/a")
+        (result,) = mount.mount_many([MountSpec("nfs", mount_point="/mnt/a", share_path="10.10.10.10:/a")])
+        assert result.handle.shared is handle.shared
+        assert handle.shared.users == 2
+        result.handle.unmount()
+        assert handle.shared.users == 1
+        assert mount._conn.execute_command.call_count == 1
+
+    def test_mount_many_failure_reported(self, mount):
+        def execute_command(command, **kwargs):
+            if "/mnt/bad" in command:
+                raise NFSMountException(returncode=32, cmd=command)
+            return ConnectionCompletedProcess(args=command, return_code=0)
+
+        mount._conn.execute_command.side_effect = execute_command
+        results = mount.mount_many(
+            [
+                MountSpec("nfs", mount_point="/mnt/bad", share_path="10.10.10.10:/bad"),
+                MountSpec("nfs", mount_point="/mnt/good", share_path="10.10.10.10:/good"),
+            ]
+        )
+        assert isinstance(results[0].exception, NFSMountException)
+        assert results[0].succeeded is False
+        assert results[0].handle is None
+        assert results[1].succeeded is True
+        assert results[1].handle.mount_point == "/mnt/good"
+
+    def test_mount_many_per_server_limit(self, mount):
+        lock = threading.Lock()
+        running = defaultdict(int)
+        peak = defaultdict(int)
+
+        def execute_command(command, **kwargs):
+            server = command.split()[3].split(":")[0]
+            with lock:
+                running[server] += 1
+                peak[server] = max(peak[server], running[server])
+            time.sleep(0.02)
+            with lock:
+                running[server] -= 1
+            return ConnectionCompletedProcess(args=command, return_code=0)
+
+        mount._conn.execute_command.side_effect = execute_command
+        specs = [
+            MountSpec("nfs", mount_point=f"/mnt/{server}_{i}", share_path=f"{server}:/share{i}")
+            for server in ("10.10.10.10", "10.10.10.11")
+            for i in range(6)
+        ]
+        results = mount.mount_many(specs, max_workers=8, per_server_limit=2)
+        assert all(result.succeeded for result in results)
+        assert peak == {"10.10.10.10": 2, "10.10.10.11": 2}
+
+    def test_mount_many_unsupported_fs_type(self, mount):
+        with pytest.raises(MountException):
+            mount.mount_many([MountSpec("sshfs", mount_point="/mnt/a", share_path="10.10.10.10:/a")])
+        mount._conn.execute_command.assert_not_called()
+
+    @pytest.mark.parametrize("max_workers, per_server_limit", [(0, 1), (1, 0)])
+    def test_mount_many_incorrect_limits(self, mount, max_workers, per_server_limit):
+        with pytest.raises(MountException):
+            mount.mount_many(
+                [MountSpec("nfs", mount_point="/mnt/a", share_path="10.10.10.10:/a")],
+                max_workers=max_workers,
+                per_server_limit=per_server_limit,
+            )
+
+    def test_mount_many_empty(self, mount):
+        assert mount.mount_many([]) == []
@@ -1,12 +1,15 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
+import json
+import subprocess
 from textwrap import dedent
 
 import pytest
-import subprocess
 from mfd_connect.base import ConnectionCompletedProcess
 
 from mfd_mount.exceptions import (
+    MountBenchmarkException,
+    MountException,
     NFSMountException,
     CIFSMountException,
     SSHFSMountException,
@@ -14,6 +17,8 @@ from mfd_mount.exceptions import (
     HUGETLBFSMountException,
     UnmountException,
 )
+from mfd_mount.mount_table import MountState
+from mfd_mount.options import CIFSOptions, NFSOptions, TMPFSOptions
 from mfd_mount.posix import PosixMount
 from mfd_mount.base import Mount
 from mfd_connect import RPyCConnection
@@ -88,6 +93,39 @@ class TestPosixMount:
         mount._conn.execute_command.assert_called_with("umount /mnt/shared", custom_exception=UnmountException)
         assert mount._conn.execute_command.call_count == 2
 
+    def test_mount_nfs_with_options(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        options = NFSOptions(version="4.2", nconnect=8, rsize=1048576, wsize=1048576, proto="tcp", hard=True)
+        mount.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share", options=options)
+        mount._conn.execute_command.assert_called_once_with(
+            "mount -t nfs -o vers=4.2,proto=tcp,nconnect=8,rsize=1048576,wsize=1048576,hard "
+            "10.10.10.10:/to_share /mnt/shared",
+            custom_exception=NFSMountException,
+        )
+
+    def test_mount_nfs_with_user_password_options(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        mount.mount_nfs(
+            mount_point="/mnt/shared",
+            share_path="10.10.10.10:/to_share",
+            username="admin",
+            password="pass",
+            options=NFSOptions(version="3", hard=False, timeo=600, actimeo=0),
+        )
+        mount._conn.execute_command.assert_called_once_with(
+            "mount -t nfs -o username=admin,password=pass,vers=3,timeo=600,actimeo=0,soft "
+            "10.10.10.10:/to_share /mnt/shared",
+            custom_exception=NFSMountException,
+        )
+
+    def test_generic_mount_options_and_params_separated(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        mount._generic_mount("cifs", "/mnt/shared", "//10.10.10.10/to_share", username="admin", params="-o ro")
+        mount._conn.execute_command.assert_called_once_with(
+            "mount -t cifs -o username=admin -o ro //10.10.10.10/to_share /mnt/shared",
+            custom_exception=CIFSMountException,
+        )
+
     def test_mount_cifs(self, mount):
         mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
         mount.mount_cifs(mount_point="/mnt/shared", share_path="//10.10.10.10/to_share")
@@ -95,6 +133,21 @@ class TestPosixMount:
             "mount -t cifs //10.10.10.10/to_share /mnt/shared", custom_exception=CIFSMountException
         )
 
+    def test_mount_cifs_with_options(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        mount.mount_cifs(
+            mount_point="/mnt/shared",
+            share_path="//10.10.10.10/to_share",
+            username="admin",
+            password="pass",
+            options=CIFSOptions(vers="3.1.1", multichannel=True, max_channels=4, cache="none", nosharesock=True),
+        )
+        mount._conn.execute_command.assert_called_once_with(
+            "mount -t cifs -o username=admin,password=pass,vers=3.1.1,multichannel,max_channels=4,cache=none,"
+            "nosharesock //10.10.10.10/to_share /mnt/shared",
+            custom_exception=CIFSMountException,
+        )
+
     def test_mount_cifs_with_user(self, mount):
         mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
         mount.mount_cifs(mount_point="/mnt/shared", share_path="//10.10.10.10/to_share", username="admin")
@@ -186,6 +239,23 @@ class TestPosixMount:
             )
         assert mount._conn.execute_command.call_count == 2
 
+    def test_mount_tmpfs_options(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        mount.mount_tmpfs(
+            mount_point="/mnt/scratch", share_path="tmpfs", options=TMPFSOptions(size="1g", huge="within_size")
+        )
+        mount._conn.execute_command.assert_called_once_with(
+            "mount -t tmpfs -o size=1g,huge=within_size tmpfs /mnt/scratch", custom_exception=TMPFSMountException
+        )
+
+    def test_plan_tmpfs_options(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="MemTotal: 8388608 kB\nMemAvailable: 4194304 kB\nHugepagesize: 2048 kB\n", return_code=0
+        )
+        options = mount.plan_tmpfs_options(percent=50, mpol="bind:0")
+        mount._conn.execute_command.assert_called_once_with("cat /proc/meminfo", skip_logging=True)
+        assert options == TMPFSOptions(size=2 * 1024**3, huge="within_size", mpol="bind:0")
+
     def test_mount_hugetlbfs(self, mount):
         mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
         mount.mount_hugetlbfs(mount_point="/mnt/shared", share_path="//10.10.10.10/to_share", params="-o param")
@@ -211,24 +281,215 @@ class TestPosixMount:
             )
         assert mount._conn.execute_command.call_count == 2
 
+    MOUNTINFO = dedent(
+        """\
+        22 1 8:1 / / rw,relatime shared:1 - ext4 /dev/sda1 rw
+        40 22 0:35 / /shared_directory rw,relatime shared:20 - nfs4 10.10.10.10:/to_share rw,vers=4.2
+        41 22 0:36 / /mnt/with\\040space rw,relatime - cifs //10.10.10.10/to_share rw
+        """
+    )
+
     def test_is_mounted_true(self, mount):
         mount_point = "/shared_directory"
-        mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=self.MOUNTINFO, return_code=0
+        )
+        assert mount.is_mounted(mount_point) is True
+        mount._conn.execute_command.assert_called_once_with("cat /proc/self/mountinfo", skip_logging=True)
+
+    def test_is_mounted_false(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=self.MOUNTINFO, return_code=0
+        )
+        assert mount.is_mounted("shared_directory") is False
+        assert mount.is_mounted("/shared") is False
+        assert mount.is_mounted("/shared_directory/sub") is False
+        mount._conn.execute_command.assert_called_once_with("cat /proc/self/mountinfo", skip_logging=True)
+
+    def test_is_mounted_escaped_and_trailing_separator(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=self.MOUNTINFO, return_code=0
+        )
+        assert mount.is_mounted("/mnt/with space") is True
+        assert mount.is_mounted("/shared_directory/") is True
+
+    def test_is_mounted_falls_back_to_df(self, mount):
         output = dedent(
             """
         Filesystem        1K-blocks    Used Available Use% Mounted on
         remote_filesystem 359061248 6105984 352955264   2% /shared_directory
         """
         )
+        mount._conn.execute_command.side_effect = [
+            subprocess.CalledProcessError(1, "cat /proc/self/mountinfo"),
+            ConnectionCompletedProcess(args="", stdout=output, return_code=0),
+        ]
+        assert mount.is_mounted("/shared_directory") is True
+        mount._conn.execute_command.assert_called_with("df /shared_directory")
+
+    def test_is_mounted_df_failure(self, mount):
+        mount._conn.execute_command.side_effect = subprocess.CalledProcessError(1, "")
+        assert mount.is_mounted("/shared_directory") is False
+        assert mount._conn.execute_command.call_count == 2
+
+    def test_is_mounted_uses_snapshot(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=self.MOUNTINFO, return_code=0
+        )
+        for _ in range(5):
+            assert mount.is_mounted("/shared_directory") is True
+        assert mount._conn.execute_command.call_count == 1
+
+    def test_is_mounted_snapshot_expired(self, mocker, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=self.MOUNTINFO, return_code=0
+        )
+        monotonic = mocker.patch("mfd_mount.mount_table.time.monotonic", return_value=100.0)
+        mount.is_mounted("/shared_directory")
+        monotonic.return_value = 100.0 + mount.mount_table_ttl
+        mount.is_mounted("/shared_directory")
+        assert mount._conn.execute_command.call_count == 2
+
+    def test_is_mounted_ttl_zero(self, mocker):
+        conn = mocker.create_autospec(RPyCConnection)
+        conn.execute_command.return_value = ConnectionCompletedProcess(args="", stdout=self.MOUNTINFO, return_code=0)
+        mount = PosixMount(connection=conn, mount_table_ttl=0)
+        mount.is_mounted("/shared_directory")
+        mount.is_mounted("/shared_directory")
+        assert conn.execute_command.call_count == 2
+
+    def test_mount_invalidates_snapshot(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=self.MOUNTINFO, return_code=0
+        )
+        mount.is_mounted("/shared_directory")
+        mount.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        mount.is_mounted("/shared_directory")
+        mount.umount(mount_point="/mnt/shared")
+        mount.is_mounted("/shared_directory")
+        mount.mount_sshfs(mount_point="/shared", share_path="10.10.10.10:/to_share", username="root", password="root")
+        mount.is_mounted("/shared_directory")
+        assert mount._conn.execute_command.call_count == 7
+
+    def test_mount_failure_invalidates_snapshot(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=self.MOUNTINFO, return_code=0
+        )
+        mount.is_mounted("/shared_directory")
+        mount._conn.execute_command.side_effect = NFSMountException(returncode=32, cmd="")
+        with pytest.raises(NFSMountException):
+            mount.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        mount._conn.execute_command.side_effect = None
+        mount.is_mounted("/shared_directory")
+        assert mount._conn.execute_command.call_count == 3
+
+    def test_context_manager_exit_invalidates_snapshot(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=self.MOUNTINFO, return_code=0
+        )
+        with mount.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share"):
+            mount.is_mounted("/mnt/shared")
+        mount.is_mounted("/mnt/shared")
+        assert mount._conn.execute_command.call_count == 4
+
+    def test_snapshot_shared_by_connection(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=self.MOUNTINFO, return_code=0
+        )
+        other_mount = PosixMount(connection=mount._conn)
+        mount.is_mounted("/shared_directory")
+        other_mount.is_mounted("/shared_directory")
+        assert mount._conn.execute_command.call_count == 1
+        other_mount.umount(mount_point="/shared_directory")
+        mount.is_mounted("/shared_directory")
+        assert mount._conn.execute_command.call_count == 3
+
+    def test_are_mounted(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=self.MOUNTINFO, return_code=0
+        )
+        assert mount.are_mounted(["/shared_directory", "/mnt/with space", "/mnt/other", "/"]) == {
+            "/shared_directory": True,
+            "/mnt/with space": True,
+            "/mnt/other": False,
+            "/": True,
+        }
+        mount._conn.execute_command.assert_called_once_with("cat /proc/self/mountinfo", skip_logging=True)
+
+    def test_benchmark_mount(self, mount):
+        output = json.dumps(
+            {
+                "jobs": [
+                    {
+                        "jobname": "mfd_mount_read",
+                        "read": {"bw": 1000000, "iops": 976.5, "clat_ns": {"mean": 1000000.0, "percentile": {}}},
+                        "write": {"bw": 0, "iops": 0.0, "clat_ns": {"mean": 0.0}},
+                    }
+                ]
+            }
+        )
         mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", stdout=output, return_code=0)
-        assert mount.is_mounted(mount_point) is True
-        mount._conn.execute_command.assert_called_once_with(f"df {mount_point}")
+        results = mount.benchmark_mount("/mnt/shared", workloads="read", threads=2, runtime=10)
+        assert results["read"].bandwidth_mb_s == pytest.approx(1024.0)
+        assert results["read"].mean_latency_us == 1000.0
+        mount._conn.execute_command.assert_called_once_with(
+            "fio --output-format=json --directory=/mnt/shared --bs=1M --size=256M --numjobs=2 --ioengine=psync "
+            "--direct=1 --percentile_list=50:90:99:99.9 --group_reporting --unlink=1 --runtime=10 --time_based "
+            "--name=mfd_mount_read --rw=read",
+            custom_exception=MountBenchmarkException,
+        )
 
-    def test_is_mounted_false(self, mount):
-        mount_point = "shared_directory"
-        mount._conn.execute_command.side_effect = subprocess.CalledProcessError(1, "")
-        assert mount.is_mounted(mount_point) is False
-        mount._conn.execute_command.assert_called_once_with(f"df {mount_point}")
+    def test_benchmark_mount_failure(self, mount):
+        mount._conn.execute_command.side_effect = MountBenchmarkException(returncode=1, cmd="fio")
+        with pytest.raises(MountBenchmarkException):
+            mount.benchmark_mount("/mnt/shared")
+
+    def test_probe_mounts(self, mount):
+        def execute_command(command, **kwargs):
+            if command == "cat /proc/self/mountinfo":
+                return ConnectionCompletedProcess(args=command, stdout=self.MOUNTINFO, return_code=0)
+            return ConnectionCompletedProcess(args=command, stdout="1 137\n0 0\n", return_code=0)
+
+        mount._conn.execute_command.side_effect = execute_command
+        states = mount.probe_mounts(["/shared_directory", "/mnt/with space", "/mnt/absent"], timeout=1)
+        assert states == {
+            "/shared_directory": MountState.MOUNTED,
+            "/mnt/with space": MountState.STALE,
+            "/mnt/absent": MountState.ABSENT,
+        }
+        mount._conn.execute_command.assert_called_with(
+            "(timeout -s KILL 1 df -P /shared_directory >/dev/null 2>&1; echo \"0 $?\") & "
+            "(timeout -s KILL 1 df -P '/mnt/with space' >/dev/null 2>&1; echo \"1 $?\") & wait",
+            shell=True,
+            timeout=6,
+            expected_return_codes=None,
+        )
+
+    def test_probe_mount_absent_without_probe(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=self.MOUNTINFO, return_code=0
+        )
+        assert mount.probe_mount("/mnt/absent") is MountState.ABSENT
+        mount._conn.execute_command.assert_called_once_with("cat /proc/self/mountinfo", skip_logging=True)
+
+    def test_probe_mount_connection_timeout(self, mount):
+        def execute_command(command, **kwargs):
+            if command == "cat /proc/self/mountinfo":
+                return ConnectionCompletedProcess(args=command, stdout=self.MOUNTINFO, return_code=0)
+            raise subprocess.TimeoutExpired(command, kwargs["timeout"])
+
+        mount._conn.execute_command.side_effect = execute_command
+        assert mount.probe_mount("/shared_directory") is MountState.STALE
+
+    def test_probe_script_runs_in_shell(self, mount):
+        def execute_command(command, **kwargs):
+            if command == "cat /proc/self/mountinfo":
+                return ConnectionCompletedProcess(args=command, stdout=self.MOUNTINFO, return_code=0)
+            result = subprocess.run(command, shell=True, executable="/bin/bash", capture_output=True, text=True)
+            return ConnectionCompletedProcess(args=command, stdout=result.stdout, return_code=result.returncode)
+
+        mount._conn.execute_command.side_effect = execute_command
+        assert mount.probe_mount("/") is MountState.MOUNTED
 
     def test_umount_failure(self, mount):
         output = dedent(
@@ -244,3 +505,83 @@ class TestPosixMount:
         mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
         mount.umount(mount_point="/mnt/shared")
         mount._conn.execute_command.assert_called_once_with("umount /mnt/shared", custom_exception=UnmountException)
+
+    def test_mount_and_verify(self, mount):
+        mount.verify_mounts = True
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="MFD_MOUNT_STATUS mounted 0\n", return_code=0
+        )
+        mount.mount_nfs(mount_point="/mnt/shared dir", share_path="10.10.10.10:/to_share")
+        script = mount._conn.execute_command.call_args.args[0]
+        assert mount._conn.execute_command.call_count == 1
+        assert script.startswith("mkdir -p '/mnt/shared dir' ||")
+        assert "mount -t nfs 10.10.10.10:/to_share /mnt/shared dir ||" in script
+        assert "grep -qxF -- '/mnt/shared\\040dir'" in script
+        assert mount._conn.execute_command.call_args.kwargs == {"shell": True, "expected_return_codes": None}
+
+    @pytest.mark.parametrize("stdout, return_code", [("MFD_MOUNT_STATUS mount 32\n", 32), ("", 127)])
+    def test_mount_and_verify_mount_failure(self, mount, stdout, return_code):
+        mount.verify_mounts = True
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=stdout, return_code=return_code
+        )
+        with pytest.raises(NFSMountException) as e:
+            mount.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        assert e.value.returncode == return_code
+
+    def test_mount_and_verify_failure_keeps_stderr(self, mount):
+        mount.verify_mounts = True
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="",
+            stdout="MFD_MOUNT_STATUS mount 32\n",
+            stderr="mount.nfs: access denied by server while mounting 10.10.10.10:/to_share\n",
+            return_code=32,
+        )
+        with pytest.raises(MountException) as e:
+            mount.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        assert e.value.stderr == (
+            "Mount of /mnt/shared failed at mount step.\n"
+            "mount.nfs: access denied by server while mounting 10.10.10.10:/to_share"
+        )
+
+    def test_mount_and_verify_entry_missing(self, mount):
+        mount.verify_mounts = True
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="MFD_MOUNT_STATUS verify 1\n", return_code=1
+        )
+        with pytest.raises(TMPFSMountException) as e:
+            mount.mount_tmpfs(mount_point="/mnt/tmp", share_path="tmpfs")
+        assert e.value.stderr == "/mnt/tmp not found in mount table after mount."
+
+    def test_mount_and_verify_script_runs_in_shell(self, mount):
+        def execute_command(command, **kwargs):
+            command = command.replace("mount -t tmpfs tmpfs /", "true", 1)
+            result = subprocess.run(command, shell=True, capture_output=True, text=True)
+            return ConnectionCompletedProcess(args=command, stdout=result.stdout, return_code=result.returncode)
+
+        mount.verify_mounts = True
+        mount._conn.execute_command.side_effect = execute_command
+        mount.mount_tmpfs(mount_point="/", share_path="tmpfs")
+
+    def test_umount_lazy(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        mount.umount(mount_point="/mnt/shared", lazy=True)
+        mount._conn.execute_command.assert_called_once_with("umount -l /mnt/shared", custom_exception=UnmountException)
+
+    def test_umount_many(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        mount.umount_many(["/mnt/a", "/mnt/b"])
+        mount._conn.execute_command.assert_called_once_with("umount /mnt/a /mnt/b", custom_exception=UnmountException)
+
+    def test_umount_many_failure_invalidates_mount_table(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=self.MOUNTINFO, return_code=0
+        )
+        mount.is_mounted("/")
+        mount._conn.execute_command.side_effect = UnmountException(32, "umount")
+        with pytest.raises(UnmountException):
+            mount.umount_many(["/mnt/a", "/mnt/b"])
+        mount._conn.execute_command.side_effect = None
+        mount.is_mounted("/")
+        # mount table is read to find unmounted mount points, then invalidated
+        assert mount._conn.execute_command.call_count == 4
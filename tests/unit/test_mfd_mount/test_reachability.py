@@ -0,0 +1,153 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import errno
+import shutil
+import socket
+import subprocess
+import time
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+
+from mfd_mount import ReachabilityProbe
+from mfd_mount.exceptions import ServerUnreachableException
+from mfd_mount.posix import PosixMount
+from mfd_mount.reachability import build_probe_command, parse_probe_output, probe_server
+
+
+@pytest.fixture()
+def listening_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        yield sock.getsockname()[1]
+
+
+@pytest.fixture()
+def closed_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestProbeServer:
+    def test_listening_port(self, listening_port):
+        assert probe_server("127.0.0.1", (listening_port,), timeout=1)
+
+    def test_closed_port(self, closed_port):
+        assert not probe_server("127.0.0.1", (closed_port,), timeout=1)
+
+    def test_any_port_enough(self, listening_port, closed_port):
+        assert probe_server("127.0.0.1", (closed_port, listening_port), timeout=1)
+
+    def test_unresolvable_server(self):
+        assert not probe_server("invalid..host", (22,), timeout=1)
+
+    def test_timeout(self, mocker):
+        selector = mocker.patch("mfd_mount.reachability.selectors.DefaultSelector").return_value.__enter__.return_value
+        selector.get_map.return_value = {"pending": None}
+        selector.select.side_effect = lambda timeout: time.sleep(timeout) or []
+        mocker.patch("mfd_mount.reachability.socket.socket").return_value.connect_ex.return_value = errno.EINPROGRESS
+        started = time.monotonic()
+        assert not probe_server("127.0.0.1", (2049,), timeout=0.1)
+        assert time.monotonic() - started < 1
+
+
+@pytest.mark.skipif(
+    shutil.which("bash") is None or shutil.which("timeout") is None, reason="requires bash and timeout programs"
+)
+class TestProbeCommand:
+    """Run probe command in local shell."""
+
+    def _probe(self, ports):
+        command = build_probe_command("127.0.0.1", ports, timeout=1)
+        return parse_probe_output(subprocess.run(["sh", "-c", command], capture_output=True, text=True).stdout)
+
+    def test_listening_port(self, listening_port, closed_port):
+        assert self._probe((closed_port, listening_port))
+
+    def test_closed_port(self, closed_port):
+        assert not self._probe((closed_port,))
+
+
+class TestReachabilityProbe:
+    def test_build_probe_command(self):
+        command = build_probe_command("[fe80::1]", (2049, 111), timeout=0.5)
+        assert "(timeout -s KILL 0.5 bash -c '</dev/tcp/fe80::1/2049' 2>/dev/null" in command
+        assert "bash -c '</dev/tcp/fe80::1/111'" in command
+        assert command.endswith(" wait")
+
+    def test_result_cached(self, mocker, listening_port):
+        probe_server_mock = mocker.patch("mfd_mount.reachability.probe_server", return_value=False)
+        probe = ReachabilityProbe(ttl=60, ports={"mount_nfs": (listening_port,)})
+        for _ in range(3):
+            with pytest.raises(ServerUnreachableException):
+                probe.check("mount_nfs", "10.10.10.10")
+        probe_server_mock.assert_called_once_with("10.10.10.10", (listening_port,), probe.timeout)
+        probe.clear("10.10.10.10")
+        probe_server_mock.return_value = True
+        probe.check("mount_nfs", "10.10.10.10")
+        assert probe_server_mock.call_count == 2
+
+    def test_not_checked_without_server_or_ports(self, mocker):
+        probe_server_mock = mocker.patch("mfd_mount.reachability.probe_server")
+        probe = ReachabilityProbe()
+        probe.check("mount_tmpfs", "10.10.10.10")
+        probe.check("mount_nfs", None)
+        probe_server_mock.assert_not_called()
+
+
+class TestMountReachability:
+    @pytest.fixture()
+    def conn(self, mocker):
+        conn = mocker.create_autospec(RPyCConnection)
+        conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        return conn
+
+    def test_unreachable_server_not_mounted(self, conn, closed_port):
+        probe = ReachabilityProbe(ports={"mount_nfs": (closed_port,)}, local=True)
+        mounter = PosixMount(connection=conn, reachability_probe=probe)
+        with pytest.raises(ServerUnreachableException):
+            mounter.mount_nfs(mount_point="/mnt/shared", share_path="127.0.0.1:/to_share")
+        conn.execute_command.assert_not_called()
+
+    def test_reachable_server_mounted(self, conn, listening_port):
+        probe = ReachabilityProbe(ports={"mount_sshfs": (listening_port,)}, local=True)
+        mounter = PosixMount(connection=conn, reachability_probe=probe)
+        mounter.mount_sshfs(
+            mount_point="/mnt/shared", share_path="user@127.0.0.1:/to_share", username="user", password="pass"
+        )
+        conn.execute_command.assert_called()
+
+    def test_probed_from_connected_host(self, conn, mocker):
+        probe_server_mock = mocker.patch("mfd_mount.reachability.probe_server")
+        conn.execute_command.side_effect = [
+            ConnectionCompletedProcess(args="", stdout="MFD_REACHABLE 2049\n", return_code=0),
+            conn.execute_command.return_value,
+        ]
+        mounter = PosixMount(connection=conn, reachability_probe=ReachabilityProbe(timeout=0.5))
+        mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        probe_call, mount_call = conn.execute_command.call_args_list
+        assert probe_call.args[0] == build_probe_command("10.10.10.10", (2049, 111), timeout=0.5)
+        assert probe_call.kwargs == {"shell": True, "expected_return_codes": None, "skip_logging": True}
+        assert mount_call.args[0] == "mount -t nfs 10.10.10.10:/to_share /mnt/shared"
+        probe_server_mock.assert_not_called()
+
+    def test_unreachable_from_connected_host(self, conn):
+        conn.execute_command.return_value = ConnectionCompletedProcess(args="", stdout="", return_code=0)
+        mounter = PosixMount(connection=conn, reachability_probe=ReachabilityProbe())
+        with pytest.raises(ServerUnreachableException):
+            mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        conn.execute_command.assert_called_once()
+
+    def test_remote_result_cached_per_connection(self, conn, mocker):
+        other_conn = mocker.create_autospec(RPyCConnection)
+        for connection in (conn, other_conn):
+            connection.execute_command.return_value = ConnectionCompletedProcess(args="", stdout="", return_code=0)
+        probe = ReachabilityProbe(ttl=60)
+        for connection in (conn, conn, other_conn):
+            with pytest.raises(ServerUnreachableException):
+                probe.check("mount_nfs", "10.10.10.10", PosixMount(connection=connection))
+        assert conn.execute_command.call_count == 1
+        assert other_conn.execute_command.call_count == 1
@@ -0,0 +1,119 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+
+from mfd_mount import CircuitBreaker, RetryPolicy
+from mfd_mount.exceptions import CIFSMountException, MountCircuitOpenException, MountException, NFSMountException
+from mfd_mount.posix import PosixMount
+
+
+class TestRetryPolicy:
+    @pytest.mark.parametrize(
+        "kwargs", [{"max_attempts": 0}, {"initial_delay": -1}, {"backoff": 0.5}, {"jitter": 1.5}]
+    )
+    def test_invalid_policy(self, kwargs):
+        with pytest.raises(MountException):
+            RetryPolicy(**kwargs)
+
+    def test_delay(self):
+        policy = RetryPolicy(initial_delay=1, backoff=2, max_delay=5, jitter=0)
+        assert [policy.get_delay(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+
+    def test_jitter(self):
+        policy = RetryPolicy(initial_delay=10, jitter=0.5)
+        assert all(5 <= policy.get_delay(1) <= 15 for _ in range(100))
+
+    def test_is_retryable(self):
+        policy = RetryPolicy(retryable_return_codes=frozenset({32}))
+        assert policy.is_retryable(NFSMountException(32, "mount"))
+        assert not policy.is_retryable(NFSMountException(1, "mount"))
+        assert not policy.is_retryable(MountException("incorrect share path"))
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        breaker.record_failure("10.10.10.10")
+        breaker.before_call("10.10.10.10")
+        breaker.record_failure("10.10.10.10")
+        assert breaker.is_open("10.10.10.10")
+        with pytest.raises(MountCircuitOpenException):
+            breaker.before_call("10.10.10.10")
+        breaker.before_call("10.10.10.11")
+
+    def test_half_open(self, mocker):
+        monotonic = mocker.patch("mfd_mount.retry.time.monotonic", return_value=0.0)
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+        breaker.record_failure("server")
+        monotonic.return_value = 10.0
+        breaker.before_call("server")  # trial
+        with pytest.raises(MountCircuitOpenException):
+            breaker.before_call("server")  # only one trial at a time
+        breaker.record_failure("server")
+        with pytest.raises(MountCircuitOpenException):
+            breaker.before_call("server")
+        monotonic.return_value = 20.0
+        breaker.before_call("server")
+        breaker.record_success("server")
+        assert not breaker.is_open("server")
+
+
+class TestMountRetry:
+    @pytest.fixture(autouse=True)
+    def sleep(self, mocker):
+        return mocker.patch("mfd_mount.retry.time.sleep")
+
+    @pytest.fixture()
+    def conn(self, mocker):
+        return mocker.create_autospec(RPyCConnection)
+
+    def test_retried_until_success(self, conn, sleep):
+        conn.execute_command.side_effect = [
+            NFSMountException(32, "mount"),
+            NFSMountException(32, "mount"),
+            ConnectionCompletedProcess(args="", return_code=0),
+        ]
+        mounter = PosixMount(connection=conn, retry_policy=RetryPolicy(max_attempts=3, jitter=0))
+        mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        assert conn.execute_command.call_count == 3
+        assert [call.args[0] for call in sleep.call_args_list] == [1.0, 2.0]
+
+    def test_attempts_exhausted(self, conn):
+        conn.execute_command.side_effect = CIFSMountException(32, "mount")
+        mounter = PosixMount(connection=conn, retry_policy=RetryPolicy(max_attempts=2))
+        with pytest.raises(CIFSMountException):
+            mounter.mount_cifs(mount_point="/mnt/shared", share_path="//10.10.10.10/to_share")
+        assert conn.execute_command.call_count == 2
+
+    def test_not_retryable_return_code(self, conn):
+        conn.execute_command.side_effect = NFSMountException(1, "mount")
+        mounter = PosixMount(
+            connection=conn, retry_policy=RetryPolicy(max_attempts=3, retryable_return_codes=frozenset({32}))
+        )
+        with pytest.raises(NFSMountException):
+            mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        assert conn.execute_command.call_count == 1
+
+    def test_circuit_shared_between_mounters(self, mocker, conn):
+        conn.execute_command.side_effect = NFSMountException(32, "mount")
+        other_conn = mocker.create_autospec(RPyCConnection)
+        breaker = CircuitBreaker(failure_threshold=2)
+        policy = RetryPolicy(max_attempts=5)
+        with pytest.raises(MountCircuitOpenException):
+            PosixMount(connection=conn, retry_policy=policy, circuit_breaker=breaker).mount_nfs(
+                mount_point="/mnt/shared", share_path="10.10.10.10:/to_share"
+            )
+        assert conn.execute_command.call_count == 2
+        with pytest.raises(MountCircuitOpenException):
+            PosixMount(connection=other_conn, circuit_breaker=breaker).mount_nfs(
+                mount_point="/mnt/shared", share_path="10.10.10.10:/other"
+            )
+        other_conn.execute_command.assert_not_called()
+
+    def test_share_without_server_not_checked(self, conn):
+        conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        breaker = CircuitBreaker(failure_threshold=1)
+        PosixMount(connection=conn, circuit_breaker=breaker).mount_tmpfs(mount_point="/mnt/tmp", share_path="tmpfs")
+        assert breaker._circuits == {}
@@ -0,0 +1,105 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import threading
+import time
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+
+from mfd_mount.exceptions import NFSMountException
+from mfd_mount.options import NFSOptions
+from mfd_mount.posix import PosixMount
+
+
+class TestSharedMount:
+    @pytest.fixture()
+    def conn(self, mocker):
+        conn = mocker.create_autospec(RPyCConnection)
+        conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        return conn
+
+    @staticmethod
+    def _commands(conn):
+        return [call.args[0] for call in conn.execute_command.call_args_list]
+
+    def test_identical_mount_reused(self, conn):
+        first, second = PosixMount(connection=conn), PosixMount(connection=conn)
+        with first.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share") as outer:
+            with second.mount_nfs(mount_point="/mnt/shared/", share_path="10.10.10.10:/to_share") as inner:
+                assert inner.shared is outer.shared
+                assert outer.shared.users == 2
+            assert self._commands(conn) == ["mount -t nfs 10.10.10.10:/to_share /mnt/shared"]
+        assert self._commands(conn)[-1] == "umount /mnt/shared"
+        assert conn.execute_command.call_count == 2
+
+    def test_different_options_not_reused(self, conn):
+        mounter = PosixMount(connection=conn)
+        first = mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        second = mounter.mount_nfs(
+            mount_point="/mnt/shared", share_path="10.10.10.10:/to_share", options=NFSOptions(version="4.2")
+        )
+        assert first.shared is not second.shared
+        assert conn.execute_command.call_count == 2
+
+    def test_direct_umount_forgets_mount(self, conn):
+        mounter = PosixMount(connection=conn)
+        handle = mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        mounter.umount("/mnt/shared")
+        assert handle.shared.users == 0
+        mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        assert self._commands(conn).count("mount -t nfs 10.10.10.10:/to_share /mnt/shared") == 2
+
+    def test_failed_mount_not_reused(self, conn):
+        mounter = PosixMount(connection=conn)
+        conn.execute_command.side_effect = [NFSMountException(32, "mount"), conn.execute_command.return_value]
+        with pytest.raises(NFSMountException):
+            mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        handle = mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        assert handle.shared.users == 1
+        assert conn.execute_command.call_count == 2
+
+    def test_handle_released_once(self, conn):
+        mounter = PosixMount(connection=conn)
+        first = mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        second = mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        first.unmount()
+        first.unmount()
+        with first:
+            pass
+        assert "umount /mnt/shared" not in self._commands(conn)
+        assert second.shared.users == 1
+
+    def test_concurrent_mounts_mount_once(self, conn):
+        def execute_command(command, **kwargs):
+            time.sleep(0.01)
+            return ConnectionCompletedProcess(args=command, return_code=0)
+
+        conn.execute_command.side_effect = execute_command
+        mounter = PosixMount(connection=conn)
+        handles = []
+        threads = [
+            threading.Thread(
+                target=lambda: handles.append(
+                    mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+                )
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert conn.execute_command.call_count == 1
+        for handle in handles:
+            handle.unmount()
+        assert self._commands(conn) == ["mount -t nfs 10.10.10.10:/to_share /mnt/shared", "umount /mnt/shared"]
+
+    def test_forget_shared_mounts(self, conn):
+        mounter = PosixMount(connection=conn)
+        handle = mounter.mount_tmpfs(mount_point="/mnt/tmp", share_path="tmpfs")
+        mounter.forget_shared_mounts()
+        mounter.mount_tmpfs(mount_point="/mnt/tmp", share_path="tmpfs")
+        assert conn.execute_command.call_count == 2
+        handle.unmount()
+        assert self._commands(conn)[-1] == "umount /mnt/tmp"
@@ -0,0 +1,119 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import json
+import shutil
+import subprocess
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+
+from mfd_mount.exceptions import MountException, NFSMountException, UnmountException
+from mfd_mount.freebsd import FreeBSDMount
+from mfd_mount.posix import MOUNT_STATUS_PREFIX, PosixMount
+from mfd_mount.state_store import MountStateStore
+
+
+class TestStateStoreScripts:
+    """Run state scripts with fake mount table, as separate processes sharing state directory."""
+
+    @pytest.fixture()
+    def host(self, tmp_path):
+        if shutil.which("flock") is None:
+            pytest.skip("flock program not available")
+        table = tmp_path / "table"
+        table.touch()
+        umount = tmp_path / "umount.sh"
+        umount.write_text(f'grep -vxF -- "$1" {table} > {table}.tmp; mv {table}.tmp {table}\n')
+        return {"table": table, "umount": f"sh {umount}", "state": tmp_path / "state", "mnt": tmp_path / "mnt"}
+
+    def _acquire(self, host, owner, command_suffix=""):
+        store = MountStateStore(host["state"], owner=owner)
+        mount_command = f"echo {host['mnt']} >> {host['table']}{command_suffix}"
+        script = store.build_acquire_script(
+            mount_command,
+            host["mnt"],
+            store.build_record(mount_command, host["mnt"]),
+            f"cat {host['table']}",
+            MOUNT_STATUS_PREFIX,
+        )
+        return subprocess.run(["sh", "-c", script], capture_output=True, text=True)
+
+    def _release(self, host, owner):
+        store = MountStateStore(host["state"], owner=owner)
+        script = store.build_release_script(host["umount"], [host["mnt"]])
+        return subprocess.run(["sh", "-c", script], capture_output=True, text=True)
+
+    def _mounted(self, host):
+        return host["table"].read_text().splitlines().count(str(host["mnt"]))
+
+    def test_adopt_and_release_by_last_owner(self, host):
+        assert self._acquire(host, "worker1").stdout.split() == [MOUNT_STATUS_PREFIX, "mounted", "0"]
+        assert self._acquire(host, "worker2").stdout.split() == [MOUNT_STATUS_PREFIX, "adopted", "0"]
+        assert self._acquire(host, "worker2").stdout.split() == [MOUNT_STATUS_PREFIX, "adopted", "0"]
+        assert self._mounted(host) == 1
+        assert self._release(host, "worker1").returncode == 0
+        assert self._mounted(host) == 1
+        assert self._release(host, "worker2").returncode == 0
+        assert self._mounted(host) == 0
+        assert list(host["state"].iterdir()) == [host["state"] / ".lock"]
+
+    def test_different_mount_conflicts(self, host):
+        self._acquire(host, "worker1")
+        result = self._acquire(host, "worker2", command_suffix=" && true")
+        assert result.returncode == 1
+        assert result.stdout.split() == [MOUNT_STATUS_PREFIX, "conflict", "1"]
+
+    def test_stale_record_remounted(self, host):
+        self._acquire(host, "worker1")
+        host["table"].write_text("")  # eg. unmounted outside of store
+        assert self._acquire(host, "worker2").stdout.split() == [MOUNT_STATUS_PREFIX, "mounted", "0"]
+        self._release(host, "worker2")
+        assert self._mounted(host) == 0
+
+
+class TestPosixMountStateStore:
+    @pytest.fixture()
+    def conn(self, mocker):
+        return mocker.create_autospec(RPyCConnection)
+
+    @pytest.fixture()
+    def mounter(self, conn):
+        mounter = PosixMount(connection=conn, state_store=MountStateStore(owner="worker1"))
+        yield mounter
+        mounter.forget_shared_mounts()
+
+    def test_record_masks_password(self):
+        record = json.loads(MountStateStore.build_record("mount -o password=secret x /mnt", "/mnt/", ["secret"]))
+        assert record["command"] == "mount -o password=***** x /mnt"
+        assert record["mount_point"] == "/mnt"
+
+    def test_adopted(self, conn, mounter):
+        conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=f"{MOUNT_STATUS_PREFIX} adopted 0\n", return_code=0
+        )
+        mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        script = conn.execute_command.call_args.args[0]
+        assert "flock -w 30 9" in script
+        assert "mount -t nfs 10.10.10.10:/to_share /mnt/shared" in script
+        assert conn.execute_command.call_args.kwargs["shell"] is True
+
+    def test_conflict(self, conn, mounter):
+        conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=f"{MOUNT_STATUS_PREFIX} conflict 1\n", return_code=1
+        )
+        with pytest.raises(NFSMountException) as e:
+            mounter.mount_nfs(mount_point="/mnt/shared", share_path="10.10.10.10:/to_share")
+        assert "different mount" in e.value.stderr
+
+    def test_umount_releases(self, conn, mounter):
+        conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        mounter.umount_many(["/mnt/a", "/mnt/b"])
+        script = conn.execute_command.call_args.args[0]
+        assert "grep -vxF -- worker1" in script
+        assert "umount /mnt/a" in script and "umount /mnt/b" in script
+        assert conn.execute_command.call_args.kwargs["custom_exception"] is UnmountException
+
+    def test_not_supported_on_freebsd(self, conn):
+        with pytest.raises(MountException):
+            FreeBSDMount(connection=conn, state_store=MountStateStore())
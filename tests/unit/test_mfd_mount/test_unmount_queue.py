@@ -0,0 +1,53 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+
+from mfd_mount import UnmountQueue
+from mfd_mount.exceptions import UnmountException
+from mfd_mount.posix import PosixMount
+
+
+class TestUnmountQueue:
+    @pytest.fixture()
+    def mount(self, mocker):
+        conn = mocker.create_autospec(RPyCConnection)
+        conn.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        return PosixMount(connection=conn)
+
+    def test_flush_on_exit(self, mount):
+        with mount.defer_unmounts() as queue:
+            assert isinstance(queue, UnmountQueue)
+            queue.add("/mnt/a")
+            queue.add("/mnt/b c")
+            assert len(queue) == 2
+            mount._conn.execute_command.assert_not_called()
+        mount._conn.execute_command.assert_called_once_with(
+            "umount /mnt/a '/mnt/b c'", custom_exception=UnmountException
+        )
+        assert queue.pending == []
+
+    def test_lazy(self, mount):
+        with mount.defer_unmounts(lazy=True) as queue:
+            queue.add("/mnt/a")
+        mount._conn.execute_command.assert_called_once_with("umount -l /mnt/a", custom_exception=UnmountException)
+
+    def test_empty_flush(self, mount):
+        mount.defer_unmounts().flush()
+        mount._conn.execute_command.assert_not_called()
+
+    def test_handles(self, mount):
+        first = mount.mount_nfs(mount_point="/mnt/a", share_path="10.10.10.10:/a")
+        second = mount.mount_nfs(mount_point="/mnt/a", share_path="10.10.10.10:/a")
+        other = mount.mount_tmpfs(mount_point="/mnt/tmp", share_path="tmpfs")
+        queue = mount.defer_unmounts()
+        queue.add(first)
+        assert queue.pending == []
+        queue.add(second)
+        queue.add(second)
+        queue.add(other)
+        assert queue.pending == ["/mnt/a", "/mnt/tmp"]
+        queue.flush()
+        mount._conn.execute_command.assert_called_with("umount /mnt/a /mnt/tmp", custom_exception=UnmountException)
+        assert mount._conn.execute_command.call_count == 3
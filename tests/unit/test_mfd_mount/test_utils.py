@@ -0,0 +1,32 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_mount.utils import get_share_server, get_signature
+
+
+class TestUtils:
+    @pytest.mark.parametrize(
+        "share_path, server",
+        [
+            ("10.10.10.10:/to_share", "10.10.10.10"),
+            ("//10.10.10.10/to_share", "10.10.10.10"),
+            (r"\\10.10.10.10\to_share", "10.10.10.10"),
+            ("10.10.10.10/to_share", "10.10.10.10"),
+            ("root@10.10.10.10:/to_share", "10.10.10.10"),
+            ("filer.example.com:/export", "filer.example.com"),
+            ("[fe80::1]:/export", "fe80::1"),
+            ("tmpfs", None),
+            ("/dev/hugepages", None),
+        ],
+    )
+    def test_get_share_server(self, share_path, server):
+        assert get_share_server(share_path) == server
+
+    def test_get_signature_cached(self):
+        def mount(self, *, mount_point, share_path=None):
+            pass
+
+        signature = get_signature(mount)
+        assert list(signature.parameters) == ["self", "mount_point", "share_path"]
+        assert get_signature(mount) is signature
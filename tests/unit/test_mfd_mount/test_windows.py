@@ -2,10 +2,11 @@
 # SPDX-License-Identifier: MIT
 import pytest
 import subprocess
+from textwrap import dedent
 from mfd_connect import RPyCConnection
 from mfd_connect.base import ConnectionCompletedProcess
 
-from mfd_mount.exceptions import NFSMountException, CIFSMountException, UnmountException
+from mfd_mount.exceptions import NFSMountException, CIFSMountException, MountException, UnmountException
 from mfd_mount.windows import WindowsMount
 from mfd_mount.base import Mount
 
@@ -161,6 +162,26 @@ class TestWindowsMount:
         assert mount.is_mounted(mount_point) is False
         mount._conn.execute_command.assert_called_once_with(f"net use {mount_point}")
 
+    def test_are_mounted(self, mount):
+        output = dedent(
+            """\
+            New connections will not be remembered.
+
+
+            Status       Local     Remote                    Network
+
+            -------------------------------------------------------------------------------
+            OK           Z:        \\\\10.10.10.10\\to_share     Microsoft Windows Network
+            Unavailable  Y:        \\\\10.10.10.11\\very_long_share_name_which_wraps
+                                                            Microsoft Windows Network
+                         X:        \\\\10.10.10.12\\nfs_share    NFS Network
+            The command completed successfully.
+            """
+        )
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(args="", stdout=output, return_code=0)
+        assert mount.are_mounted(["Z:", "y:", "X:\\", "W:"]) == {"Z:": True, "y:": True, "X:\\": True, "W:": False}
+        mount._conn.execute_command.assert_called_once_with("net use")
+
     def test_umount_failure(self, mount):
         output = "Z: was not successfully deleted."
         mount._conn.execute_command.side_effect = UnmountException(cmd="", returncode=1, stderr=output)
@@ -179,3 +200,25 @@ class TestWindowsMount:
         )
         mount.umount(mount_point="Z:")
         mount._conn.execute_command.assert_called_once_with("net use Z: /delete", custom_exception=UnmountException)
+
+    def test_umount_many(self, mount):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", return_code=0, stdout="Z: was deleted successfully.\nY: was deleted successfully.\n"
+        )
+        mount.umount_many(["Z:", "Y:"])
+        mount._conn.execute_command.assert_called_once_with(
+            "powershell -Command \"'Z:','Y:' | ForEach-Object { net use $_ /delete /y }\"", expected_return_codes=None
+        )
+
+    def test_umount_many_failure_confirmation(self, mount, mocker):
+        mount._conn.execute_command.return_value = ConnectionCompletedProcess(
+            args="", return_code=2, stdout="Z: was deleted successfully.\n"
+        )
+        forget = mocker.patch.object(mount, "_forget_mount")
+        with pytest.raises(UnmountException, match="returned non-zero exit status 2"):
+            mount.umount_many(["Z:", "Y:"])
+        forget.assert_called_once_with("Z:")
+
+    def test_umount_lazy_not_supported(self, mount):
+        with pytest.raises(MountException):
+            mount.umount_many(["Z:"], lazy=True)